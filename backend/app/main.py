@@ -1,6 +1,10 @@
 from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.utils.compression import CompressionMiddleware, response_compressor
+from app.utils.metrics import TimingMiddleware
+from app.v2.core.config import settings
+
 from app.v2.routes import (
     github_routes as github_routes_v2,
     projects_routes as projects_routes_v2,
@@ -8,7 +12,7 @@ from app.v2.routes import (
 from app.v2.db import mongoDB
 
 from app.v2.auth.jwt_bearer import JWTBearer
-from app.v2.routes import admin_routes
+from app.v2.routes import admin_routes, metrics_routes, sync_routes
 
 app = FastAPI(lifespan=mongoDB.lifespan)
 
@@ -18,6 +22,18 @@ app.add_middleware(
     allow_origins=["*"],
     allow_methods=["*"],
 )
+if settings.COMPRESSION_ENABLED:
+    response_compressor.configure(
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        encodings=settings.COMPRESSION_ENCODINGS,
+        levels=settings.COMPRESSION_LEVELS,
+        cached_levels=settings.COMPRESSION_CACHED_LEVELS,
+    )
+    app.add_middleware(CompressionMiddleware, compressor=response_compressor)
+else:
+    response_compressor.configure(encodings=[])
+# Added last so it wraps everything, CORS and compression included.
+app.add_middleware(TimingMiddleware, server_timing=settings.SERVER_TIMING_ENABLED)
 
 
 # Include routers
@@ -32,8 +48,12 @@ app.include_router(github_routes_v2.router)
 # Include routers v2
 app.include_router(projects_routes_v2.router, prefix="/v2", dependencies=[Depends(JWTBearer())])
 app.include_router(admin_routes.router, prefix="/v2")
+app.include_router(sync_routes.router, prefix="/v2", dependencies=[Depends(JWTBearer())])
+
+if settings.METRICS_ENABLED and settings.METRICS_TOKEN:
+    app.include_router(metrics_routes.router)
 
 if __name__ == "__main__":
-    import uvicorn
+    from app.server import main
 
-    uvicorn.run(app, port=8000)
+    main()
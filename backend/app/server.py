@@ -0,0 +1,73 @@
+"""
+Production entry point: serves ``app.main:app`` with uvicorn across worker processes.
+
+    python -m app.server [--workers N] [--host 0.0.0.0] [--port 8000]
+
+Each worker runs the application lifespan (Mongo pool warm-up, ``init_beanie``,
+GitHub client, pre-warm) before it starts accepting connections. On SIGTERM,
+workers stop accepting, give in-flight requests SERVER_GRACEFUL_SHUTDOWN_SECONDS
+to finish, then run the lifespan shutdown (background sync stopped, pools closed).
+
+Pools, caches, metrics and the in-memory login rate limits are per worker; the
+background sync runs in one worker at a time (see SyncScheduler).
+"""
+import argparse
+import os
+from typing import List, Optional
+
+import uvicorn
+
+from app.utils.logger import logger, setup_logging, shutdown_logging
+from app.v2.core.config import settings
+
+
+def worker_count(configured: int) -> int:
+    """
+    ``configured`` workers, or one per CPU when it is 0.
+    """
+    return configured if configured > 0 else os.cpu_count() or 1
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, default=settings.SERVER_WORKERS)
+    parser.add_argument("--host", default=settings.SERVER_HOST)
+    parser.add_argument("--port", type=int, default=settings.SERVER_PORT)
+    args = parser.parse_args(argv)
+
+    # The supervisor process logs through the same pipeline as the workers.
+    setup_logging(
+        level=settings.LOG_LEVEL,
+        json_output=settings.LOG_JSON,
+        levels=settings.LOG_LEVELS,
+        info_sample_rate=settings.LOG_INFO_SAMPLE_RATE,
+    )
+    workers = worker_count(args.workers)
+    if workers > 1:
+        logger.warning(
+            "Login rate limits are kept in memory per worker: up to %d login attempts "
+            "per IP and %d per username every %.0fs across %d workers",
+            settings.LOGIN_RATE_LIMIT_PER_IP * workers,
+            settings.LOGIN_RATE_LIMIT_PER_USERNAME * workers,
+            settings.LOGIN_RATE_LIMIT_WINDOW_SECONDS,
+            workers,
+        )
+    try:
+        uvicorn.run(
+            "app.main:app",
+            host=args.host,
+            port=args.port,
+            workers=workers,
+            timeout_graceful_shutdown=settings.SERVER_GRACEFUL_SHUTDOWN_SECONDS,
+            timeout_keep_alive=settings.SERVER_KEEPALIVE_SECONDS,
+            proxy_headers=True,
+            forwarded_allow_ips=settings.SERVER_FORWARDED_ALLOW_IPS,
+            # Logging is configured by setup_logging, here and in each worker's lifespan.
+            log_config=None,
+        )
+    finally:
+        shutdown_logging()
+
+
+if __name__ == "__main__":
+    main()
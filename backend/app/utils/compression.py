@@ -0,0 +1,305 @@
+import zlib
+from typing import Dict, Iterable, Optional
+
+from fastapi import Request, Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# brotli and zstandard are optional; without them only gzip is offered.
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the environment
+    zstandard = None
+
+GZIP = "gzip"
+BROTLI = "br"
+ZSTD = "zstd"
+
+AVAILABLE_ENCODINGS = [GZIP] + ([BROTLI] if brotli else []) + ([ZSTD] if zstandard else [])
+
+DEFAULT_LEVELS = {GZIP: 6, BROTLI: 4, ZSTD: 3}
+# Cached bodies are compressed once and served many times, so spend more CPU on them.
+DEFAULT_CACHED_LEVELS = {GZIP: 9, BROTLI: 9, ZSTD: 10}
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "application/javascript", "text/")
+
+
+def parse_accept_encoding(value: Optional[str]) -> Dict[str, float]:
+    """
+    Map each coding in an Accept-Encoding header to its q-value.
+    """
+    qualities: Dict[str, float] = {}
+    for item in (value or "").split(","):
+        name, _, params = item.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, raw = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(raw)
+                except ValueError:
+                    quality = 0.0
+        qualities[name] = quality
+    return qualities
+
+
+class StreamCompressor:
+    """
+    Incremental compressor for one response body. Every chunk is flushed so the
+    client can decode it as soon as it arrives (important for NDJSON).
+    """
+
+    def __init__(self, encoding: str, level: int):
+        self.encoding = encoding
+        if encoding == GZIP:
+            self._gzip = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        elif encoding == BROTLI:
+            self._brotli = brotli.Compressor(quality=level)
+        elif encoding == ZSTD:
+            self._zstd = zstandard.ZstdCompressor(level=level).compressobj()
+        else:
+            raise ValueError(f"Unsupported encoding {encoding!r}")
+
+    def compress(self, chunk: bytes) -> bytes:
+        if self.encoding == GZIP:
+            return self._gzip.compress(chunk) + self._gzip.flush(zlib.Z_SYNC_FLUSH)
+        if self.encoding == BROTLI:
+            return self._brotli.process(chunk) + self._brotli.flush()
+        return self._zstd.compress(chunk) + self._zstd.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        if self.encoding == GZIP:
+            return self._gzip.flush(zlib.Z_FINISH)
+        if self.encoding == BROTLI:
+            return self._brotli.finish()
+        return self._zstd.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+class ResponseCompressor:
+    """
+    Content-coding negotiation and compression shared by ``CompressionMiddleware``
+    and the routes that serve cached, precompressed bodies.
+    """
+
+    def __init__(
+        self,
+        minimum_size: int = 1024,
+        encodings: Optional[Iterable[str]] = None,
+        levels: Optional[Dict[str, int]] = None,
+        cached_levels: Optional[Dict[str, int]] = None,
+    ):
+        self.counters = {"compressed": 0, "streamed": 0, "precompressed_hits": 0, "bytes_in": 0, "bytes_out": 0}
+        self.configure(minimum_size, encodings, levels, cached_levels)
+
+    def configure(
+        self,
+        minimum_size: int = 1024,
+        encodings: Optional[Iterable[str]] = None,
+        levels: Optional[Dict[str, int]] = None,
+        cached_levels: Optional[Dict[str, int]] = None,
+    ) -> None:
+        """
+        :param encodings: Codings to offer, in order of preference; ones whose
+                          library is not installed are skipped.
+        """
+        self.minimum_size = minimum_size
+        self.encodings = [
+            encoding for encoding in (encodings if encodings is not None else [BROTLI, ZSTD, GZIP])
+            if encoding in AVAILABLE_ENCODINGS
+        ]
+        self.levels = {**DEFAULT_LEVELS, **(levels or {})}
+        self.cached_levels = {**DEFAULT_CACHED_LEVELS, **(cached_levels or {})}
+
+    def negotiate(self, accept_encoding: Optional[str]) -> Optional[str]:
+        """
+        Pick the coding with the highest q-value; ties go to our preference order.
+        """
+        qualities = parse_accept_encoding(accept_encoding)
+        if not qualities:
+            return None
+        wildcard = qualities.get("*", 0.0)
+        best, best_quality = None, 0.0
+        for encoding in self.encodings:
+            quality = qualities.get(encoding, wildcard)
+            if quality > best_quality:
+                best, best_quality = encoding, quality
+        return best
+
+    def validator(self, request: Request, etag: str) -> str:
+        """
+        The ETag to send for ``request``: weak when it negotiated a coding, as
+        ``weaken_etag`` makes it on the compressed 200, so a 304 (or an
+        uncompressed small body) carries the same validator the client stored.
+        """
+        if self.negotiate(request.headers.get("accept-encoding")) is None:
+            return etag
+        return etag if etag.startswith("W/") else "W/" + etag
+
+    @staticmethod
+    def is_compressible(headers: Headers) -> bool:
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "").lower()
+        return content_type.startswith(COMPRESSIBLE_TYPES) or "+json" in content_type
+
+    def compress(self, body: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+        level = self.levels[encoding] if level is None else level
+        if encoding == GZIP:
+            compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            compressed = compressor.compress(body) + compressor.flush()
+        elif encoding == BROTLI:
+            compressed = brotli.compress(body, quality=level)
+        elif encoding == ZSTD:
+            compressed = zstandard.ZstdCompressor(level=level).compress(body)
+        else:
+            raise ValueError(f"Unsupported encoding {encoding!r}")
+        self.counters["bytes_in"] += len(body)
+        self.counters["bytes_out"] += len(compressed)
+        return compressed
+
+    def stream(self, encoding: str) -> StreamCompressor:
+        return StreamCompressor(encoding, self.levels[encoding])
+
+    def cached_response(
+        self,
+        request: Request,
+        body: bytes,
+        variants: Dict[str, bytes],
+        media_type: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Response:
+        """
+        Build a response for a cached body, reusing (or filling) ``variants``,
+        the cache entry's compressed copies keyed by coding. Repeat hits then
+        skip compression entirely.
+        """
+        response = Response(content=body, media_type=media_type, headers=headers)
+        vary_on_accept_encoding(response.headers)
+        encoding = self.negotiate(request.headers.get("accept-encoding"))
+        if encoding is None or len(body) < self.minimum_size:
+            return response
+
+        compressed = variants.get(encoding)
+        if compressed is None:
+            compressed = variants[encoding] = self.compress(body, encoding, self.cached_levels[encoding])
+        else:
+            self.counters["precompressed_hits"] += 1
+        response.body = compressed
+        response.headers["Content-Length"] = str(len(compressed))
+        response.headers["Content-Encoding"] = encoding
+        weaken_etag(response.headers)
+        return response
+
+    def stats(self) -> Dict[str, float]:
+        return {**self.counters, "encodings": list(self.encodings)}
+
+
+def vary_on_accept_encoding(headers: MutableHeaders) -> None:
+    vary = [token.strip().lower() for token in headers.get("vary", "").split(",")]
+    if "accept-encoding" not in vary and "*" not in vary:
+        headers.add_vary_header("Accept-Encoding")
+
+
+def weaken_etag(headers: MutableHeaders) -> None:
+    """
+    An encoded body is a different byte sequence, so its ETag can only be weak
+    (RFC 9110 8.8.3); If-None-Match uses weak comparison and still matches it.
+    """
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        headers["ETag"] = "W/" + etag
+
+
+class CompressionMiddleware:
+    """
+    Pure ASGI middleware compressing JSON/NDJSON/text responses with the best
+    coding the client accepts. Complete bodies under ``minimum_size`` are sent
+    as-is; streamed bodies are compressed chunk by chunk without buffering.
+    Responses that already carry a Content-Encoding are left untouched.
+    """
+
+    def __init__(self, app: ASGIApp, compressor: ResponseCompressor):
+        self.app = app
+        self.compressor = compressor
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = self.compressor.negotiate(Headers(scope=scope).get("accept-encoding"))
+        responder = _CompressionResponder(self.compressor, encoding, send)
+        await self.app(scope, receive, responder)
+
+
+class _CompressionResponder:
+    def __init__(self, compressor: ResponseCompressor, encoding: Optional[str], send: Send):
+        self.compressor = compressor
+        self.encoding = encoding
+        self.send = send
+        self.start: Optional[Message] = None
+        self.passthrough = False
+        self.stream: Optional[StreamCompressor] = None
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+        if self.stream is not None:
+            await self._send_chunk(message)
+            return
+
+        # First body message: decide how to send the response.
+        headers = MutableHeaders(scope=self.start)
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if not self.compressor.is_compressible(headers) or self.start["status"] in (204, 304):
+            await self._pass(message)
+            return
+        vary_on_accept_encoding(headers)
+        if self.encoding is None or (not more_body and len(body) < self.compressor.minimum_size):
+            await self._pass(message)
+            return
+
+        headers["Content-Encoding"] = self.encoding
+        weaken_etag(headers)
+        if not more_body:
+            compressed = self.compressor.compress(body, self.encoding)
+            self.compressor.counters["compressed"] += 1
+            headers["Content-Length"] = str(len(compressed))
+            await self.send(self.start)
+            await self.send({"type": "http.response.body", "body": compressed})
+            return
+
+        del headers["Content-Length"]
+        self.stream = self.compressor.stream(self.encoding)
+        self.compressor.counters["streamed"] += 1
+        await self.send(self.start)
+        await self._send_chunk(message)
+
+    async def _pass(self, message: Message) -> None:
+        self.passthrough = True
+        await self.send(self.start)
+        await self.send(message)
+
+    async def _send_chunk(self, message: Message) -> None:
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        chunk = self.stream.compress(body) if body else b""
+        if not more_body:
+            chunk += self.stream.finish()
+        self.compressor.counters["bytes_in"] += len(body)
+        self.compressor.counters["bytes_out"] += len(chunk)
+        await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+
+response_compressor = ResponseCompressor()
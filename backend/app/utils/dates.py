@@ -0,0 +1,11 @@
+from datetime import datetime, timezone
+
+
+def as_utc(value: datetime) -> datetime:
+    """
+    Return ``value`` as an aware UTC datetime. Mongo hands back naive datetimes
+    that are already in UTC, while GitHub timestamps are aware.
+    """
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
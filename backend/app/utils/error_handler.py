@@ -4,6 +4,8 @@ import logging
 
 from httpx import HTTPStatusError
 
+from app.v2.core.github_budget import is_rate_limited
+
 logger = logging.getLogger(__name__)
 
 def handle_error(func):
@@ -15,16 +17,23 @@ def handle_error(func):
         try:
             return await func(*args, **kwargs)
         except HTTPException as e:
-            logger.error(f"HTTP Exception: {e}", exc_info=e)
+            logger.error("HTTP Exception: %s", e, exc_info=e)
             raise e
         except HTTPStatusError as http:
-            logger.error(f"HTTP Error: {http}", exc_info=http)
+            logger.error("HTTP Error: %s", http, exc_info=http)
+            if is_rate_limited(http.response):
+                # Upstream rate limit: tell the client when to come back instead of a 403.
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Upstream API rate limit reached, try again later",
+                    headers={"Retry-After": http.response.headers.get("retry-after", "60")},
+                )
             raise HTTPException(
                 status_code=http.response.status_code,
                 detail=f"Failed to process request: {http}",
             )
         except Exception as e:
-            logger.error(f"Unexpected Error: {e}", exc_info=e)
+            logger.error("Unexpected Error: %s", e, exc_info=e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"An unexpected error occurred: {e}",
@@ -0,0 +1,104 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, Iterable, List, Tuple, Union
+
+from app.utils.cache import TTLCache
+
+LanguageFetcher = Callable[[str], Awaitable[List[str]]]
+
+
+class LanguageResolver:
+    """
+    Resolves repository ``languages_url``s to language lists.
+
+    Concurrent requests for the same URL share one in-flight fetch
+    (single-flight), results are kept in a TTL cache, and at most
+    ``concurrency`` fetches run at once across all callers.
+
+    The fetcher is injected, so the v2 GitHub client and the v1 Prisma path
+    can each plug in their own HTTP call.
+
+    A fetch runs in the context of the caller that started it. When the
+    fetcher depends on that context (e.g. the GitHub request priority),
+    ``context_key`` returns the relevant part and fetches are only shared
+    between callers with the same key.
+    """
+
+    def __init__(
+        self,
+        fetch: LanguageFetcher,
+        ttl: float = 300.0,
+        maxsize: int = 2048,
+        concurrency: int = 8,
+        context_key: Callable[[], Hashable] = lambda: None,
+    ):
+        self._fetch = fetch
+        self._context_key = context_key
+        self._cache = TTLCache(maxsize, ttl)
+        self._inflight: Dict[Tuple[str, Hashable], asyncio.Future] = {}
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self.concurrency = concurrency
+        self.coalesced = 0
+
+    async def _load(self, url: str) -> List[str]:
+        async with self._semaphore:
+            languages = await self._fetch(url)
+        self._cache.set(url, list(languages))
+        return languages
+
+    def _forget(self, key: Tuple[str, Hashable], future: asyncio.Future) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        # Mark the exception as retrieved even if every waiter was cancelled.
+        if not future.cancelled():
+            future.exception()
+
+    async def resolve(self, url: str, refresh: bool = False) -> List[str]:
+        """
+        Languages of one repository.
+
+        :param refresh: Skip the TTL cache (an in-flight fetch is still shared).
+        :raises httpx.HTTPStatusError: If GitHub answers with an error status.
+        """
+        if not refresh:
+            cached = self._cache.get(url)
+            if cached is not None:
+                return list(cached)
+
+        key = (url, self._context_key())
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._load(url))
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+        # Shielded so a cancelled caller does not cancel the fetch others wait on.
+        return list(await asyncio.shield(future))
+
+    async def resolve_many(
+        self, urls: Iterable[str], refresh: bool = False
+    ) -> Dict[str, Union[List[str], Exception]]:
+        """
+        Resolve a batch of URLs concurrently. Each URL maps to its languages or
+        to the exception raised while fetching them.
+        """
+        unique = list(dict.fromkeys(urls))
+        results = await asyncio.gather(
+            *(self.resolve(url, refresh) for url in unique), return_exceptions=True
+        )
+        return dict(zip(unique, results))
+
+    def invalidate(self, url: str) -> None:
+        self._cache.pop(url)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            **self._cache.stats(),
+            "ttl": self._cache.ttl,
+            "inflight": len(self._inflight),
+            "coalesced": self.coalesced,
+            "concurrency": self.concurrency,
+        }
@@ -0,0 +1,266 @@
+import bisect
+import threading
+import time
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = Tuple[str, ...]
+# (metric name, type, help, [(labels, value)])
+Family = Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(key, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for key, value in labels.items()
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def collect(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} counter"
+        with self._lock:
+            values = list(self._values.items())
+        for labels, value in values:
+            yield f"{self.name}{_format_labels(dict(zip(self.labelnames, labels)))} {_format_value(value)}"
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram; ``observe`` is a bisect and three additions, cheap
+    enough to run on every request.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts (+Inf last), sum, count]
+        self._series: Dict[LabelValues, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def collect(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} histogram"
+        with self._lock:
+            series = [(labels, list(counts), total, count) for labels, (counts, total, count) in self._series.items()]
+        for labels, counts, total, count in series:
+            base = dict(zip(self.labelnames, labels))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                labelled = _format_labels({**base, "le": _format_value(bound)})
+                yield f"{self.name}_bucket{labelled} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(base)} {_format_value(total)}"
+            yield f"{self.name}_count{_format_labels(base)} {count}"
+
+
+class MetricsRegistry:
+    """
+    Process-wide set of metrics, rendered in the Prometheus text format.
+
+    Components that already keep their own counters (caches, pools) register a
+    collector instead, which is only called when ``/metrics`` is scraped.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._collectors: List[Callable[[], Iterable[Family]]] = []
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._metrics.setdefault(name, Counter(name, help, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._metrics.setdefault(name, Histogram(name, help, labelnames, buckets))
+
+    def register_collector(self, collector: Callable[[], Iterable[Family]]) -> None:
+        self._collectors.append(collector)
+
+    def render(self, *extra: Iterable[Family]) -> str:
+        """
+        :param extra: Additional families computed by the caller, e.g. from
+                      objects that live on ``app.state``.
+        """
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.collect())
+        families = [family for collector in self._collectors for family in collector()]
+        for group in extra:
+            families.extend(group)
+        for name, kind, help, samples in families:
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                if value is not None:
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ("method", "route", "status"),
+)
+SPAN_DURATION = registry.histogram(
+    "app_span_duration_seconds",
+    "Latency of instrumented operations (Mongo, GitHub, JWT, bcrypt).",
+    ("span",),
+)
+
+
+class RequestTimings:
+    """
+    Spans recorded while serving one request, aggregated by nested path.
+    """
+
+    __slots__ = ("spans",)
+
+    def __init__(self):
+        # path -> [name, count, total seconds]
+        self.spans: Dict[str, list] = {}
+
+    def server_timing(self, total: float, limit: int = 20) -> str:
+        entries = []
+        for path, (name, count, seconds) in list(self.spans.items())[:limit]:
+            desc = path if count == 1 else f"{path} x{count}"
+            entries.append(f'{name};dur={seconds * 1000:.2f};desc="{desc}"')
+        entries.append(f"total;dur={total * 1000:.2f}")
+        return ", ".join(entries)
+
+
+_timings: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+# Path of the innermost open span; a ContextVar so concurrent tasks each nest correctly.
+_parent: ContextVar[Optional[str]] = ContextVar("span_parent", default=None)
+
+
+class span:
+    """
+    Time a block of work::
+
+        with span("mongo.find"):
+            await ...
+
+    The duration feeds the ``app_span_duration_seconds`` histogram and, inside a
+    request, the response's ``Server-Timing`` header. Spans opened inside other
+    spans are reported under their parent's path.
+    """
+
+    __slots__ = ("name", "timings", "path", "token", "started")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self) -> "span":
+        self.timings = _timings.get()
+        if self.timings is not None:
+            parent = _parent.get()
+            self.path = f"{parent} > {self.name}" if parent else self.name
+            self.token = _parent.set(self.path)
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        elapsed = time.perf_counter() - self.started
+        SPAN_DURATION.observe(elapsed, self.name)
+        if self.timings is not None:
+            _parent.reset(self.token)
+            entry = self.timings.spans.get(self.path)
+            if entry is None:
+                self.timings.spans[self.path] = [self.name, 1, elapsed]
+            else:
+                entry[1] += 1
+                entry[2] += elapsed
+
+
+class TimingMiddleware:
+    """
+    Pure ASGI middleware recording per-route latency and, when enabled, adding a
+    ``Server-Timing`` header with the spans recorded before the response started.
+    """
+
+    def __init__(self, app: ASGIApp, server_timing: bool = True):
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        timings = RequestTimings()
+        token = _timings.set(timings)
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.server_timing:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", timings.server_timing(time.perf_counter() - started))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _timings.reset(token)
+            route = scope.get("route")
+            # Route templates keep label cardinality bounded; unmatched paths share one label.
+            route_path = getattr(route, "path", None) or "unmatched"
+            REQUEST_DURATION.observe(
+                time.perf_counter() - started, scope["method"], route_path, str(status_code)
+            )
@@ -1,6 +1,22 @@
-from passlib.context import CryptContext
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from fastapi import HTTPException, status
+from app.utils.metrics import span
+
+
+@lru_cache(maxsize=None)
+def pwd_context():
+    """
+    The bcrypt CryptContext. passlib is only imported by the first login or
+    registration, keeping it out of application start-up.
+    """
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 def hash_password(password: str):
     """
@@ -8,7 +24,7 @@ def hash_password(password: str):
     :param password: The plaintext password to hash.
     :return: The hashed password.
     """
-    return pwd_context.hash(password)
+    return pwd_context().hash(password)
 
 def verify_password(password: str, hashed_password: str):
     """
@@ -17,4 +33,96 @@ def verify_password(password: str, hashed_password: str):
     :param hashed_password: The hashed password to compare against.
     :return: True if the passwords match, False otherwise.
     """
-    return pwd_context.verify(password, hashed_password)
\ No newline at end of file
+    return pwd_context().verify(password, hashed_password)
+
+
+class PasswordHasherPool:
+    """
+    Runs bcrypt in a dedicated, bounded thread pool so hashing never blocks the
+    event loop (bcrypt releases the GIL while it works).
+
+    At most ``max_pending`` calls may be running or queued; further calls are
+    rejected with 503 right away instead of piling up behind a login burst.
+    """
+
+    def __init__(self, max_workers: int = 2, max_pending: int = 16, retry_after: int = 1):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.retry_after = retry_after
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+        self.calls = 0
+        self.rejected = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def configure(self, max_workers: int, max_pending: int) -> None:
+        """
+        Resize the pool; takes effect for the next executor that is created.
+        """
+        self.shutdown()
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="bcrypt"
+            )
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self._pending >= self.max_pending:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many concurrent password operations, try again shortly",
+                headers={"Retry-After": str(self.retry_after)},
+            )
+        self._pending += 1
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            with span("bcrypt"):
+                return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self._pending -= 1
+            elapsed = time.perf_counter() - started
+            self.calls += 1
+            self.total_seconds += elapsed
+            self.max_seconds = max(self.max_seconds, elapsed)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "pending": self._pending,
+            "calls": self.calls,
+            "rejected": self.rejected,
+            "avg_seconds": self.total_seconds / self.calls if self.calls else None,
+            "max_seconds": self.max_seconds,
+        }
+
+
+password_pool = PasswordHasherPool()
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password off the event loop.
+    :raises HTTPException: 503 when the password pool is saturated.
+    """
+    return await password_pool.run(hash_password, password)
+
+
+async def verify_password_async(password: str, hashed_password: str) -> bool:
+    """
+    Verify a password off the event loop.
+    :raises HTTPException: 503 when the password pool is saturated.
+    """
+    return await password_pool.run(verify_password, password, hashed_password)
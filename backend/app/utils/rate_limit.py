@@ -0,0 +1,97 @@
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import List, Optional
+
+from fastapi import HTTPException, status
+
+
+class RateLimitStorage(ABC):
+    """
+    Backend holding the sliding-window counters. The in-memory implementation
+    serves a single process; a shared backend (e.g. Redis) can implement the
+    same interface for multiple workers.
+    """
+
+    @abstractmethod
+    async def hit(self, key: str, window: float, now: float) -> float:
+        """
+        Record one hit for ``key`` and return the weighted number of hits in
+        the sliding window ending at ``now``.
+        """
+
+    @abstractmethod
+    async def reset(self, key: str) -> None:
+        """
+        Forget every hit recorded for ``key``.
+        """
+
+
+class InMemoryRateLimitStorage(RateLimitStorage):
+    """
+    Sliding-window counters kept in process memory.
+
+    Each key stores three numbers: the start of its current fixed window and the
+    hit counts of the current and previous windows. The previous count is
+    weighted by how much of it still overlaps the sliding window, which
+    approximates a true sliding log with constant memory per key.
+
+    Keys are kept in order of their last hit; beyond ``max_keys`` the least
+    recently hit ones are evicted, which forgets their counts.
+    """
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._windows: "OrderedDict[str, List[float]]" = OrderedDict()
+
+    async def hit(self, key: str, window: float, now: float) -> float:
+        start = now - now % window
+        entry = self._windows.get(key)
+        if entry is None or entry[0] < start - window:
+            entry = [start, 0, 0]
+        elif entry[0] < start:
+            entry = [start, 0, entry[1]]
+        entry[1] += 1
+        self._windows[key] = entry
+        self._windows.move_to_end(key)
+        while len(self._windows) > self.max_keys:
+            self._windows.popitem(last=False)
+        overlap = 1 - (now - start) / window
+        return entry[1] + entry[2] * overlap
+
+    async def reset(self, key: str) -> None:
+        self._windows.pop(key, None)
+
+
+class SlidingWindowRateLimiter:
+    """
+    Allow at most ``limit`` hits per ``window`` seconds for each key.
+    """
+
+    def __init__(self, limit: int, window: float, storage: RateLimitStorage, prefix: str = ""):
+        self.limit = limit
+        self.window = window
+        self.storage = storage
+        self.prefix = prefix
+        self.rejected = 0
+
+    async def check(self, key: str, now: Optional[float] = None) -> None:
+        """
+        Count a hit for ``key``.
+
+        :raises HTTPException: 429 with Retry-After once the limit is exceeded.
+        """
+        now = time.time() if now is None else now
+        count = await self.storage.hit(f"{self.prefix}:{key}", self.window, now)
+        if count > self.limit:
+            self.rejected += 1
+            retry_after = math.ceil(self.window - now % self.window)
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many attempts, try again later",
+                headers={"Retry-After": str(retry_after)},
+            )
+
+    async def reset(self, key: str) -> None:
+        await self.storage.reset(f"{self.prefix}:{key}")
@@ -0,0 +1,46 @@
+import json
+from functools import lru_cache
+from typing import Any, Optional
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from pydantic_core import PydanticSerializationError, to_json
+
+
+@lru_cache(maxsize=None)
+def json_adapter(type_: Any) -> TypeAdapter:
+    """
+    TypeAdapter for ``type_``, built once; building one compiles a serializer.
+    """
+    return TypeAdapter(type_)
+
+
+def dump_json(value: Any, type_: Any, include: Optional[Any] = None) -> bytes:
+    """
+    Serialize ``value`` as ``type_`` straight to JSON bytes in pydantic-core,
+    without the validate / ``jsonable_encoder`` / ``json.dumps`` passes a
+    ``response_model`` goes through. The output matches what FastAPI sends.
+
+    :param include: Fields to keep, as accepted by ``model_dump``.
+    """
+    return json_adapter(type_).dump_json(value, by_alias=True, include=include)
+
+
+def render_json(content: Any, include: Optional[Any] = None) -> bytes:
+    """
+    Serialize a response value to the same JSON bytes FastAPI would send for it.
+    Models, dicts, lists and datetimes are handled by pydantic-core; anything it
+    does not know falls back to ``jsonable_encoder``.
+
+    :param include: Fields to keep, e.g. ``{"__all__": {"name"}}`` for a list of models.
+    """
+    try:
+        return to_json(content, by_alias=True, include=include)
+    except PydanticSerializationError:
+        return json.dumps(
+            jsonable_encoder(content, include=include),
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+        ).encode("utf-8")
@@ -0,0 +1,54 @@
+from typing import AsyncIterable, AsyncIterator, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+JSON_MEDIA_TYPE = "application/json"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def _prepend(first: T, rest: AsyncIterator[T]) -> AsyncIterator[T]:
+    yield first
+    async for item in rest:
+        yield item
+
+
+async def _empty() -> AsyncIterator[T]:
+    return
+    yield
+
+
+async def primed(iterator: AsyncIterator[T]) -> AsyncIterator[T]:
+    """
+    Pull the first item eagerly so that upstream errors are raised before a
+    streaming response has started, and return an iterator over all items.
+    """
+    try:
+        first = await iterator.__anext__()
+    except StopAsyncIteration:
+        return _empty()
+    return _prepend(first, iterator)
+
+
+async def ndjson_lines(
+    models: AsyncIterable[BaseModel], by_alias: bool = False
+) -> AsyncIterator[bytes]:
+    """
+    Serialize models one per line (NDJSON) as they arrive.
+    """
+    async for model in models:
+        yield model.model_dump_json(by_alias=by_alias).encode() + b"\n"
+
+
+async def json_array(
+    models: AsyncIterable[BaseModel], by_alias: bool = False
+) -> AsyncIterator[bytes]:
+    """
+    Serialize models into a single JSON array, one chunk per element.
+    """
+    separator = b"["
+    async for model in models:
+        yield separator + model.model_dump_json(by_alias=by_alias).encode()
+        separator = b","
+    yield b"[]" if separator == b"[" else b"]"
@@ -1,4 +1,5 @@
 import httpx
+from app.utils.language_resolver import LanguageResolver
 from app.v1.core.config_v1 import settings
 
 async def fetch_languages(language_url: str) -> list[str]:
@@ -15,4 +16,8 @@ async def fetch_languages(language_url: str) -> list[str]:
         response.raise_for_status()
         
         languages = list(dict(response.json()).keys())
-        return languages
\ No newline at end of file
+        return languages
+
+
+# Shared across requests so concurrent inserts of the same repository fetch its languages once.
+language_resolver = LanguageResolver(fetch_languages)
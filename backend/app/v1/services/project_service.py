@@ -7,14 +7,9 @@ from app.v1.models.project import (
     ProjectGet,
 )
 from app.v1.db.prisma import get_prisma
-from app.v1.services.language import fetch_languages
+from app.v1.services.language import language_resolver
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
-handler = logging.StreamHandler()
-formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-handler.setFormatter(formatter)
-logger.addHandler(handler)
 
 
 class ProjectService:
@@ -47,7 +42,7 @@ class ProjectService:
                 for project in projects
             ]
         except PrismaError as e:
-            logger.error(f"Prisma error fetching projects: {e}")
+            logger.error("Prisma error fetching projects: %s", e)
             raise HTTPException(status_code=500, detail="Failed to fetch projects")
 
     async def insert_project(self, project: ProjectCreate) -> Any:
@@ -62,7 +57,7 @@ class ProjectService:
         """
         try:
             # Fetch languages from an external source (returns a list of language names, e.g. ["Python", "JavaScript"])
-            languages = await fetch_languages(project.languages_url)
+            languages = await language_resolver.resolve(project.languages_url)
 
             data = {
                 **project.model_dump(),
@@ -83,7 +78,7 @@ class ProjectService:
             new_project = await self.prisma.project.create(data=data)
             return await self.get_project_by_id(new_project.id)
         except PrismaError as e:
-            logger.error(f"Prisma error inserting project: {e}")
+            logger.error("Prisma error inserting project: %s", e)
             raise HTTPException(
                 status_code=400, detail=f"{e}: Failed to insert project"
             )
@@ -107,7 +102,7 @@ class ProjectService:
                 )
             return ProjectGet.from_prisma(project.model_dump(mode="python"))
         except PrismaError as e:
-            logger.error(f"Prisma error getting project by id: {e}")
+            logger.error("Prisma error getting project by id: %s", e)
             raise HTTPException(status_code=500, detail="Failed to get project by id")
 
     async def delete_project(self, id: int) -> Any:
@@ -124,11 +119,11 @@ class ProjectService:
             deleted_project = await self.prisma.project.delete(where={"id": id})
 
             if not deleted_project:
-                logger.error(f"Project with id {id} not found for deletion")
+                logger.error("Project with id %s not found for deletion", id)
                 raise HTTPException(
                     status_code=404, detail=f"Project with id {id} not found"
                 )
             return deleted_project
         except PrismaError as e:
-            logger.error(f"Prisma error deleting project: {e}")
+            logger.error("Prisma error deleting project: %s", e)
             raise HTTPException(status_code=500, detail="Failed to delete project")
@@ -5,14 +5,6 @@ from .jwt_handler import decode_jwt
 
 from app.utils.logger import logger
 
-def verify_jwt(jwtoken: str) -> bool:
-    isTokenValid: bool = False
-
-    payload = decode_jwt(jwtoken)
-    if payload:
-        isTokenValid = True
-    return isTokenValid
-
 class JWTBearer(HTTPBearer):
     def __init__(self, auto_error: bool = True):
         super(JWTBearer, self).__init__(auto_error=auto_error)
@@ -21,7 +13,7 @@ class JWTBearer(HTTPBearer):
         credentials: HTTPAuthorizationCredentials = await super(
             JWTBearer, self
         ).__call__(request)
-        logger.info(f"Credentials: {credentials}")
+        logger.debug("Authenticating request with %s credentials", credentials.scheme if credentials else None)
 
         if credentials:
             if not credentials.scheme == "Bearer":
@@ -29,11 +21,14 @@ class JWTBearer(HTTPBearer):
                     status_code=403, detail="Invalid authentication token"
                 )
 
-            if not verify_jwt(credentials.credentials):
+            claims = decode_jwt(credentials.credentials)
+            if not claims:
                 raise HTTPException(
                     status_code=403, detail="Invalid token or expired token"
                 )
 
+            # Verified once per request; get_current_user reads the claims from here.
+            request.state.jwt_claims = claims
             return credentials.credentials
         else:
             raise HTTPException(status_code=403, detail="Invalid authorization token")
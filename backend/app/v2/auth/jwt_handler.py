@@ -1,13 +1,16 @@
 from datetime import datetime, timedelta, timezone
+import hashlib
 import time
 from typing import Dict
 
 from bson import ObjectId
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Request
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt, ExpiredSignatureError
 
-from app.v2.core.config import Settings
+from app.utils.cache import TTLCache
+from app.utils.metrics import span
+from app.v2.core.config import settings
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login")
 
@@ -15,10 +18,13 @@ def token_response(token: str):
     return {"access_token": token}
 
 
-SECRET_KEY = Settings().SECRET_KEY
-ALGORITHM = Settings().ALGORITHM  
+SECRET_KEY = settings.SECRET_KEY
+ALGORITHM = settings.ALGORITHM
 EXPIRATION_TIME_MINUTES = 30
 
+# sha256(token) -> verified claims, each entry expiring at the token's ``exp``
+verified_tokens = TTLCache(maxsize=settings.JWT_CACHE_MAX_ENTRIES, ttl=EXPIRATION_TIME_MINUTES * 60)
+
 def sign_jwt(admin_id: ObjectId) -> str:
     payload = {
         "sub": str(admin_id), 
@@ -41,27 +47,40 @@ def verify_jwt(jwtoken: str) -> bool:
 def decode_jwt(token: str) -> dict:
     """
     Decode the JWT token and verify its expiration.
+    Verified tokens are remembered until they expire, so a client reusing its
+    token pays for the signature check once.
     """
+    digest = hashlib.sha256(token.encode()).digest()
+    claims = verified_tokens.get(digest)
+    if claims is not None:
+        return claims
     try:
-        decoded_token = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM], options={"verify_exp": True})
-        return decoded_token
+        with span("jwt.decode"):
+            decoded_token = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM], options={"verify_exp": True})
     except ExpiredSignatureError as e:
         raise HTTPException(status_code=401, detail="Token has expired")
     except JWTError as e:
         raise HTTPException(status_code=401, detail="Invalid token")
+    exp = decoded_token.get("exp")
+    ttl = exp - time.time() if exp is not None else None
+    if ttl is None or ttl > 0:
+        verified_tokens.set(digest, decoded_token, ttl=ttl)
+    return decoded_token
     
-def get_current_user(token: str = Depends(oauth2_scheme)) :
+def get_current_user(request: Request, token: str = Depends(oauth2_scheme)) :
     credentials_exception = HTTPException(
         status_code=401,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        id: str = payload.get("sub")
-        if id is None:
+    # JWTBearer already verified this request's token and kept its claims.
+    payload = getattr(request.state, "jwt_claims", None)
+    if payload is None:
+        try:
+            payload = decode_jwt(token)
+        except HTTPException:
             raise credentials_exception
-        token_data = id
-    except JWTError:
+    id: str = payload.get("sub")
+    if id is None:
         raise credentials_exception
-    return token_data
+    return id
@@ -1,3 +1,5 @@
+from functools import lru_cache
+from typing import Dict, List, Optional
 from urllib.parse import quote_plus
 from pydantic_settings import BaseSettings
 
@@ -13,6 +15,125 @@ class Settings(BaseSettings):
     EXTRA_CONNECT_PARAMS: str
     SECRET_KEY: str
     ALGORITHM: str
+    # Verified JWTs remembered until they expire
+    JWT_CACHE_MAX_ENTRIES: int = 1024
+    # bcrypt runs in its own thread pool; calls beyond MAX_PENDING get a 503
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 16
+    # Login throttling (sliding window, per client IP and per username)
+    LOGIN_RATE_LIMIT_PER_IP: int = 20
+    LOGIN_RATE_LIMIT_PER_USERNAME: int = 5
+    LOGIN_RATE_LIMIT_WINDOW_SECONDS: float = 60.0
+
+    # Production server (python -m app.server); 0 workers means one per CPU.
+    # Pools and caches below are per worker.
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int = 1
+    # In-flight requests get this long after SIGTERM before they are cancelled
+    SERVER_GRACEFUL_SHUTDOWN_SECONDS: int = 30
+    SERVER_KEEPALIVE_SECONDS: int = 5
+    SERVER_FORWARDED_ALLOW_IPS: str = "127.0.0.1"
+    # Open the GitHub connection and cache the project listing before serving
+    PREWARM_ENABLED: bool = True
+    PREWARM_TIMEOUT_SECONDS: float = 15.0
+
+    # Drop indexes not declared on the models at startup. Off by default: every
+    # worker would race to drop them. Migrate with `python -m app.v2.db.indexes`.
+    MONGO_DROP_UNDECLARED_INDEXES: bool = False
+    # Log a warning at startup for service queries that scan a whole collection
+    MONGO_CHECK_QUERY_PLANS: bool = False
+    # MongoDB connection pool (Motor); MIN_POOL_SIZE connections are opened at startup
+    MONGO_MAX_POOL_SIZE: int = 100
+    MONGO_MIN_POOL_SIZE: int = 5
+    MONGO_MAX_IDLE_TIME_MS: Optional[int] = None
+    # Checkouts waiting longer than this fail instead of queueing forever
+    MONGO_WAIT_QUEUE_TIMEOUT_MS: Optional[int] = None
+    MONGO_SERVER_SELECTION_TIMEOUT_MS: int = 10000
+    MONGO_CONNECT_TIMEOUT_MS: int = 10000
+    # Wire compression, in order of preference (zstd/snappy need zstandard/python-snappy)
+    MONGO_COMPRESSORS: List[str] = ["zstd", "zlib"]
+    MONGO_READ_PREFERENCE: str = "primary"
+    MONGO_READ_CONCERN: Optional[str] = None
+    # Read preference of the project listing and its version token. A non-primary
+    # mode offloads the primary, but each read may hit a different, lagging member:
+    # an ETag can then be paired with an older body until replication catches up.
+    MONGO_LIST_READ_PREFERENCE: str = "primary"
+    # Secondaries lagging more than this are skipped (at least 90 seconds)
+    MONGO_MAX_STALENESS_SECONDS: Optional[int] = None
+
+    # Observability
+    METRICS_ENABLED: bool = True
+    # /metrics is served only when this is set, to scrapers sending it as a Bearer token
+    METRICS_TOKEN: Optional[str] = None
+    # Server-Timing exposes internal timings to clients; disable on public deployments if unwanted
+    SERVER_TIMING_ENABLED: bool = True
+
+    # Response compression (br/zstd need the optional brotli/zstandard packages)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_ENCODINGS: List[str] = ["br", "zstd", "gzip"]
+    COMPRESSION_LEVELS: Dict[str, int] = {"gzip": 6, "br": 4, "zstd": 3}
+    # Cached bodies are compressed once per entry, so they use stronger levels
+    COMPRESSION_CACHED_LEVELS: Dict[str, int] = {"gzip": 9, "br": 9, "zstd": 10}
+
+    # Logging
+    LOG_LEVEL: str = "INFO"
+    LOG_JSON: bool = False
+    # Per-logger level overrides, e.g. {"app.v2.services": "DEBUG"}
+    LOG_LEVELS: Dict[str, str] = {}
+    # Fraction of INFO records kept (1.0 keeps everything)
+    LOG_INFO_SAMPLE_RATE: float = 1.0
+
+    # GitHub HTTP client
+    GITHUB_API_URL: str = "https://api.github.com"
+    GITHUB_HTTP2: bool = True
+    GITHUB_MAX_CONNECTIONS: int = 20
+    GITHUB_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    GITHUB_KEEPALIVE_EXPIRY: float = 30.0
+    GITHUB_CONNECT_TIMEOUT: float = 5.0
+    GITHUB_READ_TIMEOUT: float = 10.0
+    GITHUB_POOL_TIMEOUT: float = 5.0
+    # Read timeout overrides per host, e.g. {"api.github.com": 15}
+    GITHUB_HOST_TIMEOUTS: Dict[str, float] = {}
+    # Conditional-request (ETag) cache entries, 0 disables the cache
+    GITHUB_CACHE_MAX_ENTRIES: int = 512
+    # Retries on 429, rate-limited 403, 5xx and transport errors (jittered exponential backoff)
+    GITHUB_MAX_RETRIES: int = 3
+    GITHUB_BACKOFF_BASE_SECONDS: float = 0.5
+    GITHUB_BACKOFF_MAX_SECONDS: float = 30.0
+    # Background sync and language refreshes pause once this few calls remain
+    GITHUB_RATE_LIMIT_RESERVE: int = 200
+    # Longest an interactive request waits for the GitHub budget before a 503
+    GITHUB_MAX_WAIT_SECONDS: float = 10.0
+    # Pages of /user/repos fetched in parallel after the first one
+    GITHUB_PAGE_CONCURRENCY: int = 4
+
+    # Projects API
+    # Documents fetched per cursor round-trip when streaming the project list
+    PROJECT_STREAM_BATCH_SIZE: int = 100
+    # Read-through cache of serialized project responses
+    PROJECT_CACHE_TTL_SECONDS: float = 30.0
+    PROJECT_CACHE_MAX_ENTRIES: int = 256
+    # Cache-Control sent with the ETag of each project route
+    PROJECTS_LIST_CACHE_CONTROL: str = "private, no-cache"
+    PROJECT_ITEM_CACHE_CONTROL: str = "private, no-cache"
+    # Language lookups in flight at once, across the bulk sync and admin requests
+    SYNC_LANGUAGE_CONCURRENCY: int = 8
+    # Resolved language lists are reused for this long (seconds)
+    LANGUAGES_CACHE_TTL_SECONDS: float = 300.0
+    LANGUAGES_CACHE_MAX_ENTRIES: int = 2048
+    # Project updates refetch languages older than this (seconds)
+    LANGUAGES_MAX_AGE_SECONDS: float = 86400.0
+    # Background incremental sync started from the lifespan
+    SYNC_ENABLED: bool = False
+    SYNC_INTERVAL_SECONDS: float = 900.0
+    SYNC_STOP_TIMEOUT_SECONDS: float = 10.0
+    # Every worker starts a scheduler, but only the holder of this lease (stored in
+    # sync_state) runs the sync. It is renewed on each run, so it must outlast
+    # SYNC_INTERVAL_SECONDS; another worker takes over once it expires.
+    SYNC_LEASE_SECONDS: float = 1800.0
+
     @property
     def MONGO_URI(self) -> str:
         encoded_username = quote_plus(self.MONGO_USERNAME)
@@ -28,4 +149,12 @@ class Settings(BaseSettings):
         env_file_encoding = "utf-8"
 
 
-settings = Settings()
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """
+    The process-wide Settings; the environment and ``.env`` are read once.
+    """
+    return Settings()
+
+
+settings: Settings = get_settings()
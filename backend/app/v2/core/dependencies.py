@@ -0,0 +1,18 @@
+from fastapi import Request
+
+from app.utils.language_resolver import LanguageResolver
+from app.v2.core.github_client import GitHubClient
+
+
+def get_github_client(request: Request) -> GitHubClient:
+    """
+    Return the shared GitHub client opened in the application lifespan.
+    """
+    return request.app.state.github_client
+
+
+def get_language_resolver(request: Request) -> LanguageResolver:
+    """
+    Return the shared language resolver opened in the application lifespan.
+    """
+    return request.app.state.language_resolver
@@ -0,0 +1,161 @@
+import asyncio
+import math
+import random
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Dict, Iterator, Optional
+
+import httpx
+from fastapi import HTTPException, status
+
+from app.utils.logger import logger
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class Priority(IntEnum):
+    # Work a user is waiting on
+    HIGH = 0
+    # Background sync and language refreshes; queued while the budget is low
+    LOW = 1
+
+
+_priority: ContextVar[Priority] = ContextVar("github_priority", default=Priority.HIGH)
+
+
+def current_priority() -> Priority:
+    return _priority.get()
+
+
+@contextmanager
+def github_priority(priority: Priority) -> Iterator[None]:
+    """
+    Run the GitHub calls made inside the block (and in tasks it spawns) at ``priority``.
+    """
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def _header_float(response: httpx.Response, name: str) -> Optional[float]:
+    value = response.headers.get(name)
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def is_rate_limited(response: httpx.Response) -> bool:
+    """
+    True for GitHub's primary (403/429 with no remaining calls) and secondary
+    (403/429 with Retry-After) rate-limit responses, as opposed to a plain 403.
+    """
+    if response.status_code not in (403, 429):
+        return False
+    return (
+        response.status_code == 429
+        or "retry-after" in response.headers
+        or response.headers.get("x-ratelimit-remaining") == "0"
+    )
+
+
+class GitHubRateBudget:
+    """
+    Tracks the GitHub API budget from ``X-RateLimit-*`` and ``Retry-After``
+    response headers and gates requests on it.
+
+    Low-priority calls wait once ``remaining`` drops to ``reserve``, keeping the
+    rest of the budget for interactive requests. High-priority calls only wait
+    when the budget is exhausted, and fail fast with 503 if that wait would be
+    longer than ``max_wait``.
+    """
+
+    def __init__(self, reserve: int = 200, max_wait: float = 10.0):
+        self.reserve = reserve
+        self.max_wait = max_wait
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[float] = None
+        self.blocked_until = 0.0
+        self.waits: Counter = Counter()
+        self.retries: Counter = Counter()
+
+    def update(self, response: httpx.Response) -> None:
+        limit = _header_float(response, "x-ratelimit-limit")
+        remaining = _header_float(response, "x-ratelimit-remaining")
+        reset = _header_float(response, "x-ratelimit-reset")
+        if limit is not None:
+            self.limit = int(limit)
+        if remaining is not None:
+            self.remaining = int(remaining)
+        if reset is not None:
+            self.reset_at = reset
+        retry_after = _header_float(response, "retry-after")
+        if retry_after is not None and is_rate_limited(response):
+            self.blocked_until = max(self.blocked_until, time.time() + retry_after)
+
+    def wait_time(self, priority: Priority, now: Optional[float] = None) -> float:
+        """
+        Seconds a call of ``priority`` should wait before going out.
+        """
+        now = time.time() if now is None else now
+        wait = max(0.0, self.blocked_until - now)
+        if self.remaining is not None and self.reset_at is not None and now < self.reset_at:
+            floor = self.reserve if priority == Priority.LOW else 0
+            if self.remaining <= floor:
+                wait = max(wait, self.reset_at - now)
+        return wait
+
+    @property
+    def low(self) -> bool:
+        """
+        Whether low-priority work is currently being held back.
+        """
+        return self.wait_time(Priority.LOW) > 0
+
+    async def acquire(self, priority: Priority) -> None:
+        """
+        Wait until a call of ``priority`` may be sent, then count it against the budget.
+
+        :raises HTTPException: 503 with Retry-After when a high-priority call
+                               would have to wait longer than ``max_wait``.
+        """
+        while True:
+            wait = self.wait_time(priority)
+            if wait <= 0:
+                break
+            if priority == Priority.HIGH and wait > self.max_wait:
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="GitHub API rate limit exhausted, try again later",
+                    headers={"Retry-After": str(math.ceil(wait))},
+                )
+            self.waits[priority.name.lower()] += 1
+            logger.info("GitHub budget low, holding %s priority call for %.1fs", priority.name, wait)
+            # Jitter so queued calls do not all fire at the same instant.
+            await asyncio.sleep(wait + random.uniform(0, 1))
+        if self.remaining is not None and self.remaining > 0:
+            # Optimistic: the next response's headers correct it.
+            self.remaining -= 1
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "limit": self.limit,
+            "remaining": self.remaining,
+            "reset_in": max(0.0, self.reset_at - time.time()) if self.reset_at else None,
+            "reserve": self.reserve,
+            "waits": dict(self.waits),
+            "retries": dict(self.retries),
+        }
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """
+    Exponential backoff with full jitter: uniform in [0, min(cap, base * 2**attempt)].
+    """
+    return random.uniform(0, min(cap, base * 2 ** attempt))
@@ -0,0 +1,74 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import httpx
+
+from app.utils.cache import LRUCache
+
+
+@dataclass
+class CachedResponse:
+    etag: Optional[str]
+    last_modified: Optional[str]
+    value: Any
+
+
+class GitHubResponseCache:
+    """
+    Conditional-request cache for GitHub API responses.
+
+    Entries keep the validators (ETag / Last-Modified) of a response together
+    with its already-parsed value, so a ``304 Not Modified`` can be answered
+    without decoding JSON or building models again. GitHub does not count 304
+    responses against the rate limit.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        self._entries = LRUCache(maxsize)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        if not params:
+            return url
+        query = "&".join(f"{k}={params[k]}" for k in sorted(params))
+        return f"{url}?{query}"
+
+    def lookup(self, key: str) -> Optional[CachedResponse]:
+        return self._entries.peek(key)
+
+    def conditional_headers(self, entry: Optional[CachedResponse]) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if entry is None:
+            return headers
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def store(self, key: str, response: httpx.Response, value: Any) -> None:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            self._entries.pop(key)
+            return
+        self._entries.set(key, CachedResponse(etag, last_modified, value))
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self._entries.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self._entries.evictions,
+            "hit_ratio": self.hits / lookups if lookups else None,
+        }
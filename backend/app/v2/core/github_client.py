@@ -0,0 +1,243 @@
+import asyncio
+import importlib.util
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.utils.logger import logger
+from app.utils.metrics import span
+from app.v2.core.github_budget import (
+    RETRYABLE_STATUS,
+    GitHubRateBudget,
+    backoff_delay,
+    current_priority,
+    is_rate_limited,
+)
+from app.v2.core.github_cache import GitHubResponseCache
+
+# HTTP/2 needs the optional ``h2`` package (httpx[http2]); fall back to HTTP/1.1.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class GitHubClient:
+    """
+    Shared, pooled HTTPX client for the GitHub API.
+
+    A single instance is opened in the application lifespan and reused by every
+    request, so connections (and their TLS sessions) to api.github.com are kept
+    alive instead of being re-established on each call.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "https://api.github.com",
+        token: Optional[str] = None,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 10.0,
+        pool_timeout: float = 5.0,
+        host_timeouts: Optional[Dict[str, float]] = None,
+        http2: bool = True,
+        cache_size: int = 512,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        rate_limit_reserve: int = 200,
+        max_wait: float = 10.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        :param base_url: Root of the GitHub REST API.
+        :param token: Optional personal access token sent as a Bearer header.
+        :param host_timeouts: Read timeout overrides keyed by host name.
+        :param cache_size: Maximum entries in the conditional-request cache
+                           (0 disables it).
+        :param max_retries: Retries on 429, rate-limited 403, 5xx and transport
+                            errors, with jittered exponential backoff.
+        :param rate_limit_reserve: Remaining calls kept for high-priority work.
+        :param max_wait: Longest a high-priority call waits for the budget.
+        :param transport: Custom transport, e.g. ``httpx.MockTransport`` for a
+                          local stand-in of the GitHub API.
+        """
+        self.base_url = base_url
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeout = httpx.Timeout(
+            read_timeout, connect=connect_timeout, pool=pool_timeout
+        )
+        self.host_timeouts = {
+            host: httpx.Timeout(value, connect=connect_timeout, pool=pool_timeout)
+            for host, value in (host_timeouts or {}).items()
+        }
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self.headers = {"Accept": "application/vnd.github+json"}
+        if token:
+            self.headers["Authorization"] = f"Bearer {token}"
+        self.cache = GitHubResponseCache(cache_size) if cache_size > 0 else None
+        self.budget = GitHubRateBudget(rate_limit_reserve, max_wait)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._closed = False
+
+    @classmethod
+    def from_settings(cls, settings: Any, **kwargs: Any) -> "GitHubClient":
+        """
+        Build a client from the application ``Settings``.
+        """
+        return cls(
+            base_url=settings.GITHUB_API_URL,
+            token=settings.GITHUB_TOKEN or None,
+            max_connections=settings.GITHUB_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.GITHUB_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.GITHUB_KEEPALIVE_EXPIRY,
+            connect_timeout=settings.GITHUB_CONNECT_TIMEOUT,
+            read_timeout=settings.GITHUB_READ_TIMEOUT,
+            pool_timeout=settings.GITHUB_POOL_TIMEOUT,
+            host_timeouts=settings.GITHUB_HOST_TIMEOUTS,
+            http2=settings.GITHUB_HTTP2,
+            cache_size=settings.GITHUB_CACHE_MAX_ENTRIES,
+            max_retries=settings.GITHUB_MAX_RETRIES,
+            backoff_base=settings.GITHUB_BACKOFF_BASE_SECONDS,
+            backoff_max=settings.GITHUB_BACKOFF_MAX_SECONDS,
+            rate_limit_reserve=settings.GITHUB_RATE_LIMIT_RESERVE,
+            max_wait=settings.GITHUB_MAX_WAIT_SECONDS,
+            **kwargs,
+        )
+
+    async def start(self) -> None:
+        """
+        Open the connection pool now. Optional: the first request opens it
+        otherwise, which keeps the TLS context setup out of application start-up.
+        """
+        self._open()
+
+    def _open(self) -> httpx.AsyncClient:
+        if self._client is not None:
+            return self._client
+        self._closed = False
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            limits=self.limits,
+            timeout=self.timeout,
+            http2=self.http2,
+            transport=self._transport,
+        )
+        logger.info("GitHub client started (http2=%s)", self.http2)
+        return self._client
+
+    async def aclose(self) -> None:
+        self._closed = True
+        if self._client is None:
+            return
+        await self._client.aclose()
+        self._client = None
+        logger.info("GitHub client closed")
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._closed:
+            raise RuntimeError("GitHub client is closed")
+        return self._open()
+
+    def _timeout_for(self, url: str) -> httpx.Timeout:
+        host = urlsplit(url).hostname or urlsplit(self.base_url).hostname
+        return self.host_timeouts.get(host, self.timeout)
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> Optional[float]:
+        """
+        Seconds to wait before retrying ``response``, or None to give up.
+        """
+        if attempt >= self.max_retries:
+            return None
+        if is_rate_limited(response) and (
+            "retry-after" in response.headers or response.headers.get("x-ratelimit-remaining") == "0"
+        ):
+            # The budget gate in ``_send`` waits out Retry-After / the reset.
+            return 0.0
+        if response.status_code in RETRYABLE_STATUS:
+            return backoff_delay(attempt, self.backoff_base, self.backoff_max)
+        return None
+
+    async def _send(
+        self, url: str, params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
+        """
+        GET through the rate-limit budget, retrying transient failures.
+        """
+        priority = current_priority()
+        attempt = 0
+        while True:
+            await self.budget.acquire(priority)
+            try:
+                with span("github.get"):
+                    response = await self.client.get(
+                        url, params=params, headers=headers, timeout=self._timeout_for(url)
+                    )
+            except httpx.TransportError as e:
+                if attempt >= self.max_retries:
+                    raise
+                reason, delay = type(e).__name__, backoff_delay(attempt, self.backoff_base, self.backoff_max)
+            else:
+                self.budget.update(response)
+                delay = self._retry_delay(response, attempt)
+                if delay is None:
+                    return response
+                reason = str(response.status_code)
+            attempt += 1
+            self.budget.retries[reason] += 1
+            logger.warning("GitHub GET %s failed (%s), retry %d in %.2fs", url, reason, attempt, delay)
+            await asyncio.sleep(delay)
+
+    async def get(self, url: str, params: Optional[Dict[str, Any]] = None) -> httpx.Response:
+        """
+        GET a GitHub API URL (absolute or relative to ``base_url``).
+
+        :raises httpx.HTTPStatusError: If GitHub answers with an error status.
+        """
+        response = await self._send(url, params=params)
+        response.raise_for_status()
+        return response
+
+    async def get_json(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        parse: Optional[Callable[[httpx.Response], Any]] = None,
+    ) -> Any:
+        """
+        GET a GitHub API URL and return its parsed body.
+
+        When a previous response for the same URL is cached, the request is sent
+        with ``If-None-Match`` / ``If-Modified-Since`` and a ``304`` is answered
+        from the cache without parsing the payload again.
+
+        :param parse: Turns the response into the value to return and cache.
+                      Defaults to ``response.json()``.
+        :raises httpx.HTTPStatusError: If GitHub answers with an error status.
+        """
+        parse = parse or (lambda response: response.json())
+        if self.cache is None:
+            return parse(await self.get(url, params=params))
+
+        key = self.cache.key(url, params)
+        entry = self.cache.lookup(key)
+        response = await self._send(url, params=params, headers=self.cache.conditional_headers(entry))
+        if response.status_code == httpx.codes.NOT_MODIFIED and entry is not None:
+            self.cache.hits += 1
+            return entry.value
+
+        response.raise_for_status()
+        self.cache.misses += 1
+        value = parse(response)
+        self.cache.store(key, response, value)
+        return value
@@ -0,0 +1,44 @@
+from fastapi import Request
+
+from app.utils.rate_limit import (
+    InMemoryRateLimitStorage,
+    RateLimitStorage,
+    SlidingWindowRateLimiter,
+)
+from app.v2.core.config import settings
+
+
+class LoginRateLimiter:
+    """
+    Throttles login attempts per client IP and per username, before any
+    database lookup or bcrypt work is done.
+
+    With the default in-memory storage the counters are per process: behind
+    ``app.server`` with N workers a client can make up to N times the
+    configured attempts. Use a shared storage (``use_storage``) to enforce the
+    limits across workers.
+    """
+
+    def __init__(self, storage: RateLimitStorage):
+        window = settings.LOGIN_RATE_LIMIT_WINDOW_SECONDS
+        self.by_ip = SlidingWindowRateLimiter(
+            settings.LOGIN_RATE_LIMIT_PER_IP, window, storage, "login:ip"
+        )
+        self.by_username = SlidingWindowRateLimiter(
+            settings.LOGIN_RATE_LIMIT_PER_USERNAME, window, storage, "login:user"
+        )
+
+    def use_storage(self, storage: RateLimitStorage) -> None:
+        self.by_ip.storage = storage
+        self.by_username.storage = storage
+
+    async def check(self, request: Request, username: str) -> None:
+        """
+        :raises HTTPException: 429 when either limit is exceeded.
+        """
+        client_ip = request.client.host if request.client else "unknown"
+        await self.by_ip.check(client_ip)
+        await self.by_username.check(username.strip().lower())
+
+
+login_rate_limiter = LoginRateLimiter(InMemoryRateLimitStorage())
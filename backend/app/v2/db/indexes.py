@@ -0,0 +1,95 @@
+"""
+Bring the MongoDB indexes in line with the ones declared on the models.
+
+Run once per deployment, before starting the workers:
+
+    python -m app.v2.db.indexes [--drop-undeclared]
+
+An existing index on the same keys as a declared one but with other options
+(e.g. the old non-unique ``github_id_1`` next to the unique
+``github_id_unique``) blocks the declared index from being built, so it is
+dropped first. ``--drop-undeclared`` also drops every index not declared on a
+model. The workers themselves only create missing indexes (see
+``MONGO_DROP_UNDECLARED_INDEXES``): dropping from every worker at startup
+races, and all but one of them fail on the already-dropped index.
+
+Existing duplicate ``github_id`` or ``email`` values make the unique index
+build fail; clean them up and run it again.
+"""
+import argparse
+import asyncio
+import sys
+from typing import List, Type
+
+from beanie import Document, init_beanie
+from beanie.odm.fields import IndexModelField
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import OperationFailure
+
+from app.utils.logger import logger
+from app.v2 import models
+
+# Server error code when the index to drop no longer exists
+INDEX_NOT_FOUND = 27
+
+
+async def conflicting_indexes(database: AsyncIOMotorDatabase, model: Type[Document]) -> List[IndexModelField]:
+    """
+    Existing indexes on the keys of a declared index but with different options.
+    """
+    collection = database[model.Settings.name]
+    existing = IndexModelField.from_motor_index_information(await collection.index_information())
+    declared = [IndexModelField(index) for index in getattr(model.Settings, "indexes", [])]
+    return [
+        index for index in existing
+        if any(index.same_fields(other) and index != other for other in declared)
+    ]
+
+
+async def migrate_indexes(database: AsyncIOMotorDatabase, drop_undeclared: bool = False) -> List[str]:
+    """
+    Drop the conflicting indexes, then let Beanie create the declared ones.
+    Returns the names of the dropped indexes.
+    """
+    dropped = []
+    for model in models.__all__:
+        collection = database[model.Settings.name]
+        for index in await conflicting_indexes(database, model):
+            try:
+                await collection.drop_index(index.name)
+            except OperationFailure as e:
+                if e.code != INDEX_NOT_FOUND:
+                    raise
+            logger.info("Dropped index %s.%s", model.Settings.name, index.name)
+            dropped.append(f"{model.Settings.name}.{index.name}")
+    await init_beanie(
+        database=database,
+        document_models=models.__all__,
+        allow_index_dropping=drop_undeclared,
+    )
+    return dropped
+
+
+async def _main() -> int:
+    from app.v2.core.config import settings
+    from app.v2.db.mongo_pool import create_mongo_client
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--drop-undeclared", action="store_true", help="Also drop indexes not declared on a model"
+    )
+    args = parser.parse_args()
+
+    client = create_mongo_client(settings)
+    try:
+        dropped = await migrate_indexes(client[settings.MONGO_DATABASE], args.drop_undeclared)
+    finally:
+        client.close()
+    for name in dropped:
+        print(f"dropped {name}")
+    print("indexes up to date")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(_main()))
@@ -1,32 +1,63 @@
 from beanie import init_beanie
 from fastapi import FastAPI
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from app.utils.password_encrypt import password_pool
 from app.v2.core.config import settings
+from app.v2.core.github_client import GitHubClient
+from app.v2.db.mongo_pool import create_mongo_client, warm_up_pool
+from app.v2.db.query_plans import check_query_plans
+from app.v2.services.language import create_language_resolver
+from app.v2.services.prewarm import prewarm
+from app.v2.services.sync_scheduler import SyncScheduler
 from contextlib import asynccontextmanager
 import logging
-import certifi
 
+from app.utils.logger import setup_logging, shutdown_logging
 from app.v2 import models
 
-# Configure the logger
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
 logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    client = AsyncIOMotorClient(
-        settings.MONGO_URI,
-        tls=True,
-        tlsCAFile=certifi.where(),
+    setup_logging(
+        level=settings.LOG_LEVEL,
+        json_output=settings.LOG_JSON,
+        levels=settings.LOG_LEVELS,
+        info_sample_rate=settings.LOG_INFO_SAMPLE_RATE,
     )
+    client = create_mongo_client(settings)
+    await warm_up_pool(client, settings.MONGO_MIN_POOL_SIZE)
+    database = client[settings.MONGO_DATABASE]
     await init_beanie(
-        database=client[settings.MONGO_DATABASE],
+        database=database,
         document_models=models.__all__,
+        allow_index_dropping=settings.MONGO_DROP_UNDECLARED_INDEXES,
     )
+    if settings.MONGO_CHECK_QUERY_PLANS:
+        await check_query_plans(database)
+    password_pool.configure(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_MAX_PENDING)
+    # Opened by pre-warming, or else by its first request.
+    github_client = GitHubClient.from_settings(settings)
+    app.state.github_client = github_client
+    language_resolver = create_language_resolver(github_client)
+    app.state.language_resolver = language_resolver
+    if settings.PREWARM_ENABLED:
+        await prewarm(github_client, language_resolver, settings.PREWARM_TIMEOUT_SECONDS)
+    scheduler = None
+    if settings.SYNC_ENABLED:
+        scheduler = SyncScheduler(
+            github_client,
+            settings.SYNC_INTERVAL_SECONDS,
+            languages=language_resolver,
+            lease=settings.SYNC_LEASE_SECONDS,
+        )
+        scheduler.start()
+        app.state.sync_scheduler = scheduler
     yield
+    logger.info("Draining background work")
+    if scheduler is not None:
+        await scheduler.stop(settings.SYNC_STOP_TIMEOUT_SECONDS)
+    await github_client.aclose()
+    password_pool.shutdown()
     client.close()
+    shutdown_logging()
@@ -0,0 +1,156 @@
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import certifi
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
+from pymongo import monitoring
+from pymongo.read_preferences import make_read_preference, read_pref_mode_from_name
+
+from app.utils.logger import logger
+from app.utils.metrics import registry
+
+CHECKOUT_WAIT = registry.histogram(
+    "mongo_pool_checkout_seconds",
+    "Time spent waiting to check a connection out of the Motor pool.",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+)
+CHECKOUT_FAILURES = registry.counter(
+    "mongo_pool_checkout_failures_total",
+    "Connection checkouts that failed, by reason.",
+    ("reason",),
+)
+
+
+class PoolMetricsListener(monitoring.ConnectionPoolListener):
+    """
+    Records how long operations wait for a pooled connection, and how many
+    connections are open and checked out. pymongo emits checkout-started and
+    checked-out from the same thread, so a thread-local holds the start time.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.open = 0
+        self.checked_out = 0
+
+    def _adjust(self, name: str, delta: int) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + delta)
+
+    def connection_check_out_started(self, event):
+        self._local.started = time.perf_counter()
+
+    def connection_checked_out(self, event):
+        started = getattr(self._local, "started", None)
+        if started is not None:
+            CHECKOUT_WAIT.observe(time.perf_counter() - started)
+            self._local.started = None
+        self._adjust("checked_out", 1)
+
+    def connection_check_out_failed(self, event):
+        self._local.started = None
+        CHECKOUT_FAILURES.inc(str(event.reason))
+
+    def connection_checked_in(self, event):
+        self._adjust("checked_out", -1)
+
+    def connection_created(self, event):
+        self._adjust("open", 1)
+
+    def connection_closed(self, event):
+        self._adjust("open", -1)
+
+    def connection_ready(self, event):
+        pass
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        logger.warning("Mongo connection pool cleared for %s", event.address)
+
+    def pool_closed(self, event):
+        pass
+
+    def stats(self) -> Dict[str, int]:
+        return {"open": self.open, "checked_out": self.checked_out}
+
+
+pool_listener = PoolMetricsListener()
+
+
+def mongo_client_options(settings: Any) -> Dict[str, Any]:
+    """
+    Motor/pymongo client keyword arguments built from ``Settings``.
+    """
+    options: Dict[str, Any] = {
+        "maxPoolSize": settings.MONGO_MAX_POOL_SIZE,
+        "minPoolSize": settings.MONGO_MIN_POOL_SIZE,
+        "serverSelectionTimeoutMS": settings.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        "connectTimeoutMS": settings.MONGO_CONNECT_TIMEOUT_MS,
+        "readPreference": settings.MONGO_READ_PREFERENCE,
+        "event_listeners": [pool_listener],
+    }
+    if settings.MONGO_MAX_IDLE_TIME_MS is not None:
+        options["maxIdleTimeMS"] = settings.MONGO_MAX_IDLE_TIME_MS
+    if settings.MONGO_WAIT_QUEUE_TIMEOUT_MS is not None:
+        options["waitQueueTimeoutMS"] = settings.MONGO_WAIT_QUEUE_TIMEOUT_MS
+    if settings.MONGO_COMPRESSORS:
+        # pymongo skips (with a warning) compressors whose library is missing.
+        options["compressors"] = ",".join(settings.MONGO_COMPRESSORS)
+    if settings.MONGO_READ_CONCERN:
+        options["readConcernLevel"] = settings.MONGO_READ_CONCERN
+    return options
+
+
+def create_mongo_client(settings: Any) -> AsyncIOMotorClient:
+    return AsyncIOMotorClient(
+        settings.MONGO_URI,
+        tls=True,
+        tlsCAFile=certifi.where(),
+        **mongo_client_options(settings),
+    )
+
+
+async def warm_up_pool(client: AsyncIOMotorClient, size: int) -> None:
+    """
+    Open ``size`` connections up front with concurrent pings, so the first
+    requests after startup do not pay for TCP/TLS setup and authentication.
+    """
+    if size <= 0:
+        return
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(client.admin.command("ping") for _ in range(size)), return_exceptions=True
+    )
+    failures = [result for result in results if isinstance(result, Exception)]
+    if failures:
+        logger.warning("Mongo pool warm-up: %d of %d pings failed: %s", len(failures), size, failures[0])
+        if len(failures) == size:
+            return
+    logger.info(
+        "Mongo pool warmed up with %d connections in %.0fms",
+        pool_listener.open, (time.perf_counter() - started) * 1000,
+    )
+
+
+def with_read_preference(
+    collection: AsyncIOMotorCollection,
+    name: Optional[str],
+    max_staleness: Optional[int] = None,
+) -> AsyncIOMotorCollection:
+    """
+    ``collection`` reading with the ``name``d preference (e.g. "secondaryPreferred").
+    Max staleness only applies to non-primary modes and must be at least 90s.
+    """
+    if not name:
+        return collection
+    mode = read_pref_mode_from_name(name)
+    staleness = max_staleness if max_staleness is not None and mode else -1
+    return collection.with_options(read_preference=make_read_preference(mode, None, staleness))
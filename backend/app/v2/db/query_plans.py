@@ -0,0 +1,132 @@
+"""
+Run ``explain()`` on the queries the services issue and flag the ones that scan
+a whole collection (COLLSCAN) or sort in memory.
+
+Run against the configured database:
+
+    python -m app.v2.db.query_plans
+
+It exits with status 1 when a query uses a COLLSCAN. With
+``MONGO_CHECK_QUERY_PLANS`` enabled, the lifespan runs the same check at
+startup and logs a warning per offending query.
+"""
+import asyncio
+import sys
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import DESCENDING
+
+from app.utils.logger import logger
+from app.utils.pagination import encode_cursor
+from app.v2.models.admin import Admin
+from app.v2.models.project import Project
+from app.v2.models.sync_state import SyncState
+from app.v2.services.project_service import PROJECT_SORT, _keyset_filter
+
+
+class PlanQuery(NamedTuple):
+    name: str
+    collection: str
+    filter: Dict[str, Any]
+    sort: Optional[List[Any]] = None
+    limit: int = 0
+
+
+class PlanReport(NamedTuple):
+    name: str
+    stages: List[str]
+    keys_examined: Optional[int]
+    docs_examined: Optional[int]
+
+    @property
+    def collscan(self) -> bool:
+        return "COLLSCAN" in self.stages
+
+    @property
+    def blocking_sort(self) -> bool:
+        return "SORT" in self.stages
+
+
+def service_queries() -> List[PlanQuery]:
+    """
+    The shapes of the reads the services run on every request, with sample values.
+    """
+    projects = Project.Settings.name
+    cursor = encode_cursor({"p": datetime.now(timezone.utc).isoformat(), "i": str(ObjectId())})
+    return [
+        PlanQuery("projects.list", projects, {}, PROJECT_SORT, 21),
+        PlanQuery("projects.list_page", projects, _keyset_filter(cursor), PROJECT_SORT, 21),
+        PlanQuery("projects.list_languages", projects, {"languages": {"$in": ["Python"]}}, PROJECT_SORT, 21),
+        PlanQuery("projects.version", projects, {}, [("updated_at", DESCENDING)], 1),
+        PlanQuery("projects.by_github_id", projects, {"github_id": 1}, limit=1),
+        PlanQuery("projects.sync_existing", projects, {"github_id": {"$in": [1, 2, 3]}}),
+        PlanQuery("admin.by_email", Admin.Settings.name, {"email": "admin@example.com"}, limit=1),
+        PlanQuery("sync_state.by_key", SyncState.Settings.name, {"key": "github"}, limit=1),
+    ]
+
+
+def plan_stages(plan: Any) -> Iterator[str]:
+    """
+    Every ``stage`` in an explain plan tree (classic and slot-based engine layouts).
+    """
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            yield plan["stage"]
+        for value in plan.values():
+            yield from plan_stages(value)
+    elif isinstance(plan, list):
+        for item in plan:
+            yield from plan_stages(item)
+
+
+async def explain_query(database: AsyncIOMotorDatabase, query: PlanQuery) -> PlanReport:
+    cursor = database[query.collection].find(query.filter, sort=query.sort, limit=query.limit)
+    explained = await cursor.explain()
+    stats = explained.get("executionStats", {})
+    return PlanReport(
+        name=query.name,
+        stages=list(plan_stages(explained["queryPlanner"]["winningPlan"])),
+        keys_examined=stats.get("totalKeysExamined"),
+        docs_examined=stats.get("totalDocsExamined"),
+    )
+
+
+async def check_query_plans(database: AsyncIOMotorDatabase) -> List[PlanReport]:
+    """
+    Explain every service query and log a warning for each COLLSCAN or in-memory sort.
+    """
+    reports = []
+    for query in service_queries():
+        try:
+            report = await explain_query(database, query)
+        except Exception as e:
+            logger.warning("Could not explain %s: %s", query.name, e)
+            continue
+        if report.collscan:
+            logger.warning("Query %s scans the whole collection: %s", report.name, " > ".join(report.stages))
+        elif report.blocking_sort:
+            logger.warning("Query %s sorts in memory: %s", report.name, " > ".join(report.stages))
+        reports.append(report)
+    return reports
+
+
+async def _main() -> int:
+    from app.v2.core.config import settings
+    from app.v2.db.mongo_pool import create_mongo_client
+
+    client = create_mongo_client(settings)
+    try:
+        reports = await check_query_plans(client[settings.MONGO_DATABASE])
+    finally:
+        client.close()
+    for report in reports:
+        flag = "COLLSCAN" if report.collscan else "SORT" if report.blocking_sort else "ok"
+        print(f"{report.name:<28} {flag:<9} {' > '.join(report.stages)}")
+    return 1 if any(report.collscan for report in reports) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(_main()))
@@ -1,5 +1,6 @@
 # This file makes the models directory a Python package
 from app.v2.models.project import Project
 from app.v2.models.admin import Admin
+from app.v2.models.sync_state import SyncState
 
-__all__ = [Project, Admin]
\ No newline at end of file
+__all__ = [Project, Admin, SyncState]
\ No newline at end of file
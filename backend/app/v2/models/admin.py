@@ -1,5 +1,6 @@
 from beanie import Document
 from pydantic import BaseModel
+from pymongo import IndexModel
 from fastapi.security import HTTPBasicCredentials
 from pydantic import EmailStr
 
@@ -19,6 +20,8 @@ class Admin(Document):
 
     class Settings:
         name = "admin"
+        # Looked up on every login; registration relies on it to detect duplicates
+        indexes = [IndexModel("email", unique=True, name="email_unique")]
 
 class AdminSignIn(HTTPBasicCredentials):
     class Config:
@@ -1,7 +1,9 @@
 from datetime import datetime, timezone
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from typing import Any, List, Literal, Optional, Set
 from app.utils.validators import PyObjectId
+from app.v2.models.github import GitHubRepo
 from beanie import Document, Save, before_event
 
 
@@ -16,10 +18,27 @@ class Project(Document):
     languages: List[str] = Field(..., example=["Python", "JavaScript"])
     languages_url: str = Field(..., example="https://api.github.com/repos/user/my-awesome-project/languages")
     image_url: Optional[str] = Field(None, example="https://example.com/my-awesome-project.png")
+    # When ``languages`` was last fetched from GitHub
+    languages_refreshed_at: Optional[datetime] = Field(None, example="2023-03-01T12:00:00+00:00")
 
     class Settings:
         name = "projects"
-        indexes = ["github_id"]
+        indexes = [
+            # One document per repository; inserts rely on it to detect duplicates
+            IndexModel("github_id", unique=True, name="github_id_unique"),
+            # Keyset pagination of the listing: newest push first
+            IndexModel(
+                [("pushed_at", DESCENDING), ("_id", DESCENDING)],
+                name="pushed_at_id_desc",
+            ),
+            # Language filter combined with the listing sort
+            IndexModel(
+                [("languages", ASCENDING), ("pushed_at", DESCENDING), ("_id", DESCENDING)],
+                name="languages_pushed_at_id_desc",
+            ),
+            # Version token for HTTP caching: newest updated_at
+            IndexModel([("updated_at", DESCENDING)], name="updated_at_desc"),
+        ]
         
     @before_event(Save)
     def pre_save(self):
@@ -66,6 +85,17 @@ class ProjectCreate(BaseModel):
             }
         }
 
+    @classmethod
+    def from_github_repo(cls, repo: GitHubRepo) -> "ProjectCreate":
+        return cls(
+            github_id=repo.id,
+            name=repo.name,
+            description=repo.description,
+            html_url=repo.html_url,
+            pushed_at=repo.pushed_at,
+            languages_url=repo.languages_url,
+        )
+
 
 class ProjectGet(BaseModel):
     id: Optional[PyObjectId] = Field(alias="_id", default=None, example="64a50b684f6b1e2b68a3d1f4")
@@ -112,3 +142,41 @@ class ProjectUpdate(BaseModel):
                 "image_url": "https://example.com/my-awesome-project-updated.png"
             }
         }
+
+
+class ProjectQuery(BaseModel):
+    """
+    Listing options for GET /projects: keyset pagination, field projection and filters.
+    """
+    limit: Optional[int] = None
+    cursor: Optional[str] = None
+    fields: Optional[List[str]] = None
+    languages: Optional[List[str]] = None
+    pushed_after: Optional[datetime] = None
+    pushed_before: Optional[datetime] = None
+
+    @property
+    def is_default(self) -> bool:
+        return not any(value is not None for value in self.model_dump().values())
+
+
+class ProjectPage(BaseModel):
+    # ProjectGet, or a projection of it when only some fields were asked for
+    items: List[Any]
+    next_cursor: Optional[str] = None
+    # Fields to serialize from each item; None serializes them all
+    fields: Optional[Set[str]] = None
+
+
+class ProjectSyncItem(BaseModel):
+    github_id: int
+    status: Literal["created", "updated", "unchanged", "failed"]
+    error: Optional[str] = None
+
+
+class ProjectSyncReport(BaseModel):
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    failed: int = 0
+    items: List[ProjectSyncItem] = []
@@ -0,0 +1,28 @@
+from datetime import datetime
+from typing import Optional
+
+from beanie import Document
+from pydantic import Field
+from pymongo import IndexModel
+
+
+class SyncState(Document):
+    """
+    Persisted progress of the background GitHub -> projects sync.
+    """
+    key: str = Field(..., example="github")
+    # Newest GitHub pushed_at already synced; older repositories are skipped.
+    watermark: Optional[datetime] = None
+    last_run_at: Optional[datetime] = None
+    last_duration_ms: Optional[float] = None
+    last_scanned: int = 0
+    last_synced: int = 0
+    last_failed: int = 0
+    last_error: Optional[str] = None
+    # Scheduler instance allowed to run the periodic sync, until the lease expires.
+    lease_owner: Optional[str] = None
+    lease_expires_at: Optional[datetime] = None
+
+    class Settings:
+        name = "sync_state"
+        indexes = [IndexModel("key", unique=True)]
@@ -1,7 +1,8 @@
 from typing import Any, Dict
-from fastapi import APIRouter, Body, Depends
+from fastapi import APIRouter, Body, Depends, Request
 
 from app.v2.models.admin import Admin, AdminData, AdminSignIn
+from app.v2.core.security import login_rate_limiter
 from app.v2.services.admin_service import AdminService
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
@@ -13,7 +14,8 @@ async def register_admin(admin: Admin = Body(...), service: AdminService = Depen
     return await service.register_admin(admin)
 
 @router.post("/login", status_code=200, response_model=Dict[str, str])
-async def login_admin(admin: AdminSignIn = Body(...), service: AdminService = Depends(get_admin_service)):
+async def login_admin(request: Request, admin: AdminSignIn = Body(...), service: AdminService = Depends(get_admin_service)):
+    await login_rate_limiter.check(request, admin.username)
     return await service.login_admin(admin)
 
 
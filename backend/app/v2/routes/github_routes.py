@@ -1,15 +1,29 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
 import httpx
-from app.v2.services.github_service import fetch_github_repos
+from app.utils.serialization import dump_json
+from app.utils.streaming import JSON_MEDIA_TYPE, NDJSON_MEDIA_TYPE, ndjson_lines, primed
+from app.v2.core.dependencies import get_github_client
+from app.v2.core.github_client import GitHubClient
+from app.v2.services.github_service import fetch_github_repos, stream_github_repos
 from app.v2.models.github import GitHubRepo
 
 router = APIRouter(prefix="/github", tags=["Github"])
 
 
 @router.get("/repos", response_model=list[GitHubRepo])
-async def get_github_repos():
+async def get_github_repos(
+    stream: bool = Query(False, description="Stream repositories as NDJSON while pages load"),
+    client: GitHubClient = Depends(get_github_client),
+):
     try:
-        return await fetch_github_repos()
+        if stream:
+            repos = await primed(stream_github_repos(client))
+            return StreamingResponse(ndjson_lines(repos), media_type=NDJSON_MEDIA_TYPE)
+        repos = await fetch_github_repos(client)
+        return Response(content=dump_json(repos, list[GitHubRepo]), media_type=JSON_MEDIA_TYPE)
+    except HTTPException:
+        raise
     except httpx.HTTPStatusError as e:
         raise HTTPException(
             status_code=e.response.status_code, detail="GitHub API error"
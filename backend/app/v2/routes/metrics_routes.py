@@ -0,0 +1,125 @@
+import hmac
+from typing import Any, Dict, Iterable, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import Response
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from app.utils.compression import response_compressor
+from app.utils.metrics import PROMETHEUS_MEDIA_TYPE, Family, registry
+from app.utils.password_encrypt import password_pool
+from app.v2.auth.jwt_handler import verified_tokens
+from app.v2.core.config import settings
+from app.v2.core.security import login_rate_limiter
+from app.v2.db.mongo_pool import pool_listener
+from app.v2.services.project_cache import project_cache
+
+bearer = HTTPBearer(auto_error=False)
+
+
+def require_metrics_token(credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer)) -> None:
+    """
+    :raises HTTPException: 401 unless the request carries METRICS_TOKEN as its Bearer token.
+    """
+    expected = settings.METRICS_TOKEN
+    if (
+        not expected
+        or credentials is None
+        or not hmac.compare_digest(credentials.credentials.encode(), expected.encode())
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+router = APIRouter(tags=["Metrics"], dependencies=[Depends(require_metrics_token)])
+
+
+def _cache_families(caches: Dict[str, Dict[str, Any]]) -> List[Family]:
+    def samples(field: str):
+        return [({"cache": name}, stats.get(field)) for name, stats in caches.items()]
+
+    return [
+        ("app_cache_entries", "gauge", "Entries currently held by each in-process cache.", samples("size")),
+        ("app_cache_hits_total", "counter", "Cache lookups answered from the cache.", samples("hits")),
+        ("app_cache_misses_total", "counter", "Cache lookups that had to load the value.", samples("misses")),
+        ("app_cache_evictions_total", "counter", "Entries evicted to stay within maxsize.", samples("evictions")),
+    ]
+
+
+def _component_families() -> Iterable[Family]:
+    pool = password_pool.stats()
+    yield ("app_password_pool_pending", "gauge", "bcrypt calls running or queued.", [({}, pool["pending"])])
+    yield ("app_password_pool_calls_total", "counter", "bcrypt calls completed.", [({}, pool["calls"])])
+    yield ("app_password_pool_rejected_total", "counter", "bcrypt calls rejected with 503.", [({}, pool["rejected"])])
+    mongo = pool_listener.stats()
+    yield ("mongo_pool_connections", "gauge", "Connections open in the Motor pool.", [({}, mongo["open"])])
+    yield ("mongo_pool_checked_out", "gauge", "Pooled connections currently in use.", [({}, mongo["checked_out"])])
+    compression = response_compressor.counters
+    yield ("app_compression_bytes_in_total", "counter", "Bytes fed to response compression.", [({}, compression["bytes_in"])])
+    yield ("app_compression_bytes_out_total", "counter", "Compressed bytes produced.", [({}, compression["bytes_out"])])
+    yield (
+        "app_compressed_responses_total",
+        "counter",
+        "Responses sent compressed, by how they were compressed.",
+        [
+            ({"mode": "buffered"}, compression["compressed"]),
+            ({"mode": "streamed"}, compression["streamed"]),
+            ({"mode": "precompressed"}, compression["precompressed_hits"]),
+        ],
+    )
+    yield (
+        "app_login_rate_limited_total",
+        "counter",
+        "Login attempts rejected with 429.",
+        [
+            ({"limiter": "ip"}, login_rate_limiter.by_ip.rejected),
+            ({"limiter": "username"}, login_rate_limiter.by_username.rejected),
+        ],
+    )
+
+
+registry.register_collector(_component_families)
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics(request: Request):
+    caches = {"projects": project_cache.stats(), "jwt": verified_tokens.stats()}
+    github = getattr(request.app.state, "github_client", None)
+    if github is not None and github.cache is not None:
+        caches["github"] = github.cache.stats()
+    families = []
+    if github is not None:
+        budget = github.budget.stats()
+        families.extend([
+            ("github_rate_limit_remaining", "gauge", "GitHub API calls left in the current window.", [({}, budget["remaining"])]),
+            ("github_rate_limit_limit", "gauge", "GitHub API calls allowed per window.", [({}, budget["limit"])]),
+            ("github_rate_limit_reset_seconds", "gauge", "Seconds until the GitHub budget resets.", [({}, budget["reset_in"])]),
+            (
+                "github_budget_waits_total",
+                "counter",
+                "GitHub calls held back by the rate-limit budget, by priority.",
+                [({"priority": name}, count) for name, count in budget["waits"].items()],
+            ),
+            (
+                "github_retries_total",
+                "counter",
+                "GitHub calls retried, by status code or transport error.",
+                [({"reason": reason}, count) for reason, count in budget["retries"].items()],
+            ),
+        ])
+    languages = getattr(request.app.state, "language_resolver", None)
+    if languages is not None:
+        stats = languages.stats()
+        caches["languages"] = stats
+        families.append((
+            "app_language_fetches_coalesced_total",
+            "counter",
+            "Language lookups that joined an in-flight fetch of the same URL.",
+            [({}, stats["coalesced"])],
+        ))
+    return Response(
+        registry.render(_cache_families(caches), families), media_type=PROMETHEUS_MEDIA_TYPE
+    )
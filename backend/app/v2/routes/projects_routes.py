@@ -1,37 +1,138 @@
-from fastapi import APIRouter, HTTPException, Depends
+from datetime import datetime
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Body, HTTPException, Depends, Query, Request
+from fastapi.responses import Response, StreamingResponse
+from app.utils.compression import response_compressor
+from app.utils.serialization import dump_json
+from app.utils.http_cache import cache_headers, is_not_modified, make_etag, not_modified
+from app.utils.streaming import JSON_MEDIA_TYPE, NDJSON_MEDIA_TYPE, json_array, ndjson_lines, primed
+from app.v2.core.config import settings
+from app.utils.language_resolver import LanguageResolver
+from app.v2.core.dependencies import get_github_client, get_language_resolver
+from app.v2.core.github_client import GitHubClient
+from app.v2.services.project_cache import project_cache
 from app.v2.services.project_service import ProjectService
-from app.v2.models.project import Project, ProjectCreate, ProjectGet, ProjectUpdate
+from app.v2.services.sync_service import ProjectSyncService
+from app.v2.models.project import (
+    Project,
+    ProjectCreate,
+    ProjectGet,
+    ProjectQuery,
+    ProjectSyncReport,
+    ProjectUpdate,
+)
 from app.utils.validators import PyObjectId
 from app.v2.auth.jwt_handler import get_current_user
 
 router = APIRouter(prefix="/projects", tags=["Projects"])
 
-def get_project_service() -> ProjectService:
-    return ProjectService()
+def get_project_service(
+    github: GitHubClient = Depends(get_github_client),
+    languages: LanguageResolver = Depends(get_language_resolver),
+) -> ProjectService:
+    return ProjectService(github, languages)
+
+def get_sync_service(
+    github: GitHubClient = Depends(get_github_client),
+    languages: LanguageResolver = Depends(get_language_resolver),
+) -> ProjectSyncService:
+    return ProjectSyncService(github, languages)
+
+def get_project_query(
+    limit: Optional[int] = Query(None, ge=1, le=500, description="Page size; enables cursor pagination"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the previous page"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. name,languages"),
+    language: Optional[List[str]] = Query(None, description="Only projects using any of these languages"),
+    pushed_after: Optional[datetime] = Query(None),
+    pushed_before: Optional[datetime] = Query(None),
+) -> ProjectQuery:
+    return ProjectQuery(
+        limit=limit,
+        cursor=cursor,
+        fields=[field.strip() for field in fields.split(",") if field.strip()] if fields else None,
+        languages=language,
+        pushed_after=pushed_after,
+        pushed_before=pushed_before,
+    )
 
 @router.get("/", status_code=200, response_model=list[ProjectGet])
-async def get_projects(service: ProjectService = Depends(get_project_service)):
-    return await service.get_projects()
+async def get_projects(
+    request: Request,
+    stream: Optional[Literal["json", "ndjson"]] = Query(
+        None, description="Stream the list as a chunked JSON array or as NDJSON"
+    ),
+    query: ProjectQuery = Depends(get_project_query),
+    service: ProjectService = Depends(get_project_service),
+):
+    version = await service.get_collection_version()
+    etag = response_compressor.validator(
+        request, make_etag("projects", request.url.query, version.updated_at, version.count)
+    )
+    # No Last-Modified: a delete leaves the newest updated_at unchanged, so only
+    # the ETag (which includes the count) tells whether the listing changed.
+    headers = cache_headers(etag, None, settings.PROJECTS_LIST_CACHE_CONTROL)
+    if is_not_modified(request, etag, None):
+        return not_modified(headers)
+
+    if stream:
+        projects = await primed(service.stream_projects(query))
+        if stream == "ndjson":
+            return StreamingResponse(ndjson_lines(projects, by_alias=True), media_type=NDJSON_MEDIA_TYPE, headers=headers)
+        return StreamingResponse(json_array(projects, by_alias=True), media_type=JSON_MEDIA_TYPE, headers=headers)
+    cached = await service.read_projects(query, version)
+    if cached.next_cursor:
+        next_url = request.url.include_query_params(cursor=cached.next_cursor)
+        headers["X-Next-Cursor"] = cached.next_cursor
+        headers["Link"] = f'<{next_url}>; rel="next"'
+    return response_compressor.cached_response(request, cached.body, cached.variants, JSON_MEDIA_TYPE, headers)
+
+@router.get("/cache/stats", status_code=200)
+async def get_project_cache_stats():
+    return project_cache.stats()
 
 @router.get("/{id}", status_code=200, response_model=ProjectGet)
 async def get_project_by_id(
-    id: PyObjectId, service: ProjectService = Depends(get_project_service), user_id: str = Depends(get_current_user)
+    request: Request,
+    id: PyObjectId,
+    service: ProjectService = Depends(get_project_service),
+    user_id: str = Depends(get_current_user),
 ):
-    return await service.get_project_by_id(id, user_id)
+    updated_at = await service.get_project_version(id)
+    headers = {}
+    if updated_at is not None:
+        etag = response_compressor.validator(request, make_etag("project", id, updated_at))
+        headers = cache_headers(etag, updated_at, settings.PROJECT_ITEM_CACHE_CONTROL)
+        if is_not_modified(request, etag, updated_at):
+            return not_modified(headers)
+    cached = await service.read_project(id, user_id, updated_at)
+    return response_compressor.cached_response(request, cached.body, cached.variants, JSON_MEDIA_TYPE, headers)
 
 @router.post("/", status_code=201, response_model=ProjectGet)
 async def insert_project(
     project: ProjectCreate, service: ProjectService = Depends(get_project_service)
 ):
-    return await service.insert_project(project)
+    created = await service.insert_project(project)
+    return Response(content=dump_json(created, ProjectGet), status_code=201, media_type=JSON_MEDIA_TYPE)
+
+@router.post("/sync", status_code=200, response_model=ProjectSyncReport)
+async def sync_projects(
+    projects: Optional[List[ProjectCreate]] = Body(
+        None, description="Projects to upsert; omit to import every GitHub repository"
+    ),
+    service: ProjectSyncService = Depends(get_sync_service),
+):
+    return await service.sync_projects(projects)
 
 @router.put("/{id}", status_code=201)
 async def update_project(
     id: PyObjectId,
     project: ProjectUpdate,
+    refresh_languages: bool = Query(False, description="Refetch the project's languages from GitHub"),
     service: ProjectService = Depends(get_project_service),
 ):
-    return await service.update_project(id, project)
+    updated = await service.update_project(id, project, refresh_languages)
+    return Response(content=dump_json(updated, ProjectGet), status_code=201, media_type=JSON_MEDIA_TYPE)
 
 @router.delete("/", status_code=200)
 async def delete_projects(service: ProjectService = Depends(get_project_service)):
@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+
+from app.v2.core.config import settings
+from app.utils.language_resolver import LanguageResolver
+from app.v2.core.dependencies import get_github_client, get_language_resolver
+from app.v2.core.github_client import GitHubClient
+from app.v2.models.sync_state import SyncState
+from app.v2.services.sync_scheduler import SyncInProgress, SyncScheduler
+
+router = APIRouter(prefix="/sync", tags=["Sync"])
+
+
+def get_sync_scheduler(
+    request: Request,
+    github: GitHubClient = Depends(get_github_client),
+    languages: LanguageResolver = Depends(get_language_resolver),
+) -> SyncScheduler:
+    scheduler = getattr(request.app.state, "sync_scheduler", None)
+    return scheduler or SyncScheduler(github, settings.SYNC_INTERVAL_SECONDS, languages=languages)
+
+
+@router.get("/status", status_code=200)
+async def get_sync_status(scheduler: SyncScheduler = Depends(get_sync_scheduler)):
+    state = await SyncState.find_one(SyncState.key == scheduler.key)
+    return {
+        "enabled": settings.SYNC_ENABLED,
+        "running": scheduler.running,
+        "in_progress": scheduler.busy,
+        "interval_seconds": scheduler.interval,
+        "state": state.model_dump(exclude={"id", "revision_id"}) if state else None,
+    }
+
+
+@router.post("/run", status_code=200)
+async def run_sync(scheduler: SyncScheduler = Depends(get_sync_scheduler)):
+    try:
+        state = await scheduler.run_now()
+    except SyncInProgress:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A sync is already in progress",
+        )
+    return state.model_dump(exclude={"id", "revision_id"})
@@ -1,35 +1,45 @@
 from typing import Any, Dict
 from fastapi import HTTPException, status
+from pymongo.errors import DuplicateKeyError
 
 from app.v2.models.admin import Admin, AdminData, AdminSignIn
-from backend.app.utils.password_encrypt import hash_password, verify_password
+from app.utils.password_encrypt import hash_password_async, verify_password_async
 from app.utils.logger import logger
 from app.v2.auth.jwt_handler import sign_jwt
 
 
 class AdminService:
     async def register_admin(self, admin: Admin):
-        admin_exists = await Admin.find_one(Admin.email == admin.email)
-        if admin_exists:
-            logger.error("Admin with email supplied already exists")
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Admin with email supplied already exists"
-            )
-        
-        admin.password = hash_password(admin.password)
-        new_admin = await admin.create()
-        logger.info("Admin registered successfully" + str(new_admin.model_dump(mode="python")))
+        # Indexed lookup so a known email is rejected before paying for bcrypt;
+        # the unique email index still catches concurrent registrations.
+        if await Admin.find_one(Admin.email == admin.email):
+            self._already_exists()
+        admin.password = await hash_password_async(admin.password)
+        try:
+            new_admin = await admin.create()
+        except DuplicateKeyError:
+            self._already_exists()
+        logger.info("Admin registered successfully: %s", new_admin.id)
         return {"message": "Admin registered successfully", "data": new_admin.model_dump(by_alias=True)}
         
 
     
+    @staticmethod
+    def _already_exists():
+        logger.error("Admin with email supplied already exists")
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Admin with email supplied already exists"
+        )
+
     async def login_admin(self, admin: AdminSignIn) -> Dict[str, str]:
         admin_exists = await Admin.find_one(Admin.email == admin.username)
 
-        password_valid = verify_password(admin.password, admin_exists.password)
+        password_valid = admin_exists is not None and await verify_password_async(
+            admin.password, admin_exists.password
+        )
         
-        if not password_valid or not admin_exists:
+        if not password_valid:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Incorrect email or password"
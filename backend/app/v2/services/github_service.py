@@ -1,25 +1,85 @@
+import asyncio
+from typing import AsyncIterator, Optional
+
 import httpx
+
 from app.v2.core.config import settings
+from app.v2.core.github_client import GitHubClient
 from app.v2.models.github import GitHubRepo
 
+REPOS_PER_PAGE = 100
+
 
-async def fetch_github_repos() -> list[GitHubRepo]:
+def _parse_repo_page(response: httpx.Response) -> tuple[list[GitHubRepo], int]:
     """
-    Fetches GitHub repositories using async HTTPX.
+    Parse one page of repositories and the last page number advertised in the
+    ``Link`` header (1 when there is a single page).
     """
-    headers = (
-        {"Authorization": f"Bearer {settings.GITHUB_TOKEN}"}
-        if settings.GITHUB_TOKEN
-        else {}
+    repos = [GitHubRepo(**repo) for repo in response.json()]
+    last = response.links.get("last")
+    last_page = int(httpx.URL(last["url"]).params.get("page", 1)) if last else 1
+    return repos, last_page
+
+
+async def _fetch_repo_page(client: GitHubClient, page: int) -> tuple[list[GitHubRepo], int]:
+    return await client.get_json(
+        "/user/repos",
+        params={"sort": "updated", "per_page": REPOS_PER_PAGE, "page": page},
+        parse=_parse_repo_page,
     )
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            "https://api.github.com/user/repos",
-            headers=headers,
-            params={"sort": "updated", "per_page": 100},
-        )
-        response.raise_for_status()
 
-        repos = response.json()
-        return [GitHubRepo(**repo) for repo in repos]
+async def iter_github_repo_pages(
+    client: GitHubClient, concurrency: Optional[int] = None
+) -> AsyncIterator[list[GitHubRepo]]:
+    """
+    Yield pages of GitHub repositories in order.
+
+    The first page tells how many pages there are; the remaining ones are then
+    fetched concurrently (bounded by ``concurrency``) and yielded in page order
+    as soon as each one is available.
+    """
+    first, last_page = await _fetch_repo_page(client, 1)
+    yield first
+    if last_page <= 1:
+        return
+
+    semaphore = asyncio.Semaphore(concurrency or settings.GITHUB_PAGE_CONCURRENCY)
+
+    async def fetch(page: int) -> list[GitHubRepo]:
+        async with semaphore:
+            repos, _ = await _fetch_repo_page(client, page)
+            return repos
+
+    tasks = [asyncio.create_task(fetch(page)) for page in range(2, last_page + 1)]
+    try:
+        for task in tasks:
+            yield await task
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def stream_github_repos(
+    client: GitHubClient, concurrency: Optional[int] = None
+) -> AsyncIterator[GitHubRepo]:
+    """
+    Yield GitHub repositories one by one while later pages are still loading.
+    """
+    async for page in iter_github_repo_pages(client, concurrency):
+        for repo in page:
+            yield repo
+
+
+async def fetch_github_repos(
+    client: GitHubClient, concurrency: Optional[int] = None
+) -> list[GitHubRepo]:
+    """
+    Fetches every GitHub repository of the authenticated user, following
+    pagination. Unchanged pages are served from the client's conditional-request cache.
+    """
+    repos: list[GitHubRepo] = []
+    async for page in iter_github_repo_pages(client, concurrency):
+        repos.extend(page)
+    return repos
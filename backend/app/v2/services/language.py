@@ -1,23 +1,37 @@
+from functools import partial
+
 import httpx
+
+from app.utils.language_resolver import LanguageResolver
 from app.v2.core.config import settings
+from app.v2.core.github_budget import current_priority
+from app.v2.core.github_client import GitHubClient
+
 
+def _parse_languages(response: httpx.Response) -> list[str]:
+    return list(dict(response.json()).keys())
 
-async def fetch_languages(language_url: str) -> list[str]:
+
+async def fetch_languages(client: GitHubClient, language_url: str) -> list[str]:
     """
-    Fetches GitHub repositories using async HTTPX.
+    Fetches the languages of a repository using the shared GitHub client.
+    Unchanged language lists are served from the client's conditional-request cache.
     """
-    headers = (
-        {"Authorization": f"Bearer {settings.GITHUB_TOKEN}"}
-        if settings.GITHUB_TOKEN
-        else {}
-    )
+    languages = await client.get_json(language_url, parse=_parse_languages)
+    return list(languages)
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            language_url,
-            headers=headers,
-        )
-        response.raise_for_status()
 
-        languages = list(dict(response.json()).keys())
-        return languages
+def create_language_resolver(client: GitHubClient) -> LanguageResolver:
+    """
+    Single-flight, TTL-cached language resolver backed by ``client``.
+
+    Fetches are not shared across GitHub priorities: a request joining a
+    background refresh would otherwise wait in the low-priority queue.
+    """
+    return LanguageResolver(
+        partial(fetch_languages, client),
+        ttl=settings.LANGUAGES_CACHE_TTL_SECONDS,
+        maxsize=settings.LANGUAGES_CACHE_MAX_ENTRIES,
+        concurrency=settings.SYNC_LANGUAGE_CONCURRENCY,
+        context_key=current_priority,
+    )
@@ -0,0 +1,39 @@
+import asyncio
+import time
+
+from app.utils.language_resolver import LanguageResolver
+from app.utils.logger import logger
+from app.v2.core.github_client import GitHubClient
+from app.v2.services.project_service import ProjectService
+
+
+async def prewarm(github: GitHubClient, languages: LanguageResolver, timeout: float) -> None:
+    """
+    Pay the cold-start costs before the worker accepts traffic: open the GitHub
+    connection (``/rate_limit`` is free and seeds the rate-limit budget) and
+    load, serialize and cache the default project listing.
+
+    Failures and timeouts are logged, not raised; the worker then starts cold.
+    """
+    started = time.perf_counter()
+    service = ProjectService(github, languages)
+    steps = {
+        "github": github.get("/rate_limit"),
+        "projects": _warm_projects(service),
+    }
+    try:
+        results = await asyncio.wait_for(
+            asyncio.gather(*steps.values(), return_exceptions=True), timeout
+        )
+    except asyncio.TimeoutError:
+        logger.warning("Pre-warm did not finish within %.0fs, starting cold", timeout)
+        return
+    for name, result in zip(steps, results):
+        if isinstance(result, Exception):
+            logger.warning("Pre-warm step %s failed: %s", name, result)
+    logger.info("Worker pre-warmed in %.0fms", (time.perf_counter() - started) * 1000)
+
+
+async def _warm_projects(service: ProjectService) -> None:
+    # Cached under the live version, as the listing route looks it up.
+    await service.read_projects(version=await service.get_collection_version())
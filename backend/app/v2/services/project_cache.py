@@ -0,0 +1,83 @@
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from app.utils.cache import TTLCache
+from app.utils.serialization import render_json
+from app.v2.core.config import settings
+
+LIST = "list"
+BY_ID = "id"
+
+
+@dataclass
+class CachedBody:
+    """
+    A serialized JSON response body ready to be sent as-is.
+    """
+    body: bytes
+    next_cursor: Optional[str] = None
+    # Version of the data the body was rendered from; see ProjectReadCache
+    version: Hashable = None
+    # Compressed copies of ``body`` by content coding, filled on first use
+    variants: Dict[str, bytes] = field(default_factory=dict, repr=False)
+
+
+class ProjectReadCache:
+    """
+    In-process read-through cache for project reads.
+
+    Entries hold the serialized response bytes, so a hit skips both MongoDB and
+    Pydantic. Writes in this process invalidate the affected entries, but each
+    worker has its own cache and never sees the other workers' writes. Callers
+    therefore pass the live ``version`` they built the ETag from: an entry
+    rendered from another version is reloaded, so a body is never served under
+    an ETag it does not match.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 30.0):
+        self._cache = TTLCache(maxsize, ttl)
+        # Bumped by every invalidation; a load that overlapped one is not stored.
+        self._generation = 0
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        serialize: Callable[[Any], CachedBody] = lambda value: CachedBody(render_json(value)),
+        version: Hashable = None,
+    ) -> CachedBody:
+        cached = self._cache.get(key)
+        if cached is not None and cached.version == version:
+            return cached
+        generation = self._generation
+        cached = serialize(await loader())
+        cached.version = version
+        # A write invalidated the cache while we were loading: the value may
+        # predate it, so serve it to this caller but do not keep it.
+        if generation == self._generation:
+            self._cache.set(key, cached)
+        return cached
+
+    def invalidate_lists(self) -> None:
+        self._generation += 1
+        self._cache.discard_where(lambda key: key[0] == LIST)
+
+    def invalidate_project(self, id: str) -> None:
+        """
+        Drop the entry of one project plus every listing that may contain it.
+        """
+        self._cache.pop((BY_ID, str(id)))
+        self.invalidate_lists()
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self._cache.stats(), "ttl": self._cache.ttl}
+
+
+project_cache = ProjectReadCache(
+    maxsize=settings.PROJECT_CACHE_MAX_ENTRIES,
+    ttl=settings.PROJECT_CACHE_TTL_SECONDS,
+)
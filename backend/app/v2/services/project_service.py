@@ -1,85 +1,390 @@
-from typing import List, Any
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import AsyncIterator, FrozenSet, List, Any, NamedTuple, Optional, Type
+from beanie.odm.utils.projection import get_projection
+from bson import ObjectId
+from bson.errors import InvalidId
 from fastapi import Depends, HTTPException, status
 from httpx import HTTPStatusError
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorCursor
+from pydantic import BaseModel, Field, TypeAdapter, create_model
+from pymongo import DESCENDING
+from pymongo.errors import DuplicateKeyError
 
-from app.v2.models.project import Project, ProjectCreate, ProjectGet, ProjectUpdate
-from app.v2.services.language import fetch_languages
+from app.v2.core.config import settings
+from app.v2.core.github_client import GitHubClient
+from app.v2.db.mongo_pool import with_read_preference
+from app.v2.models.project import (
+    Project,
+    ProjectCreate,
+    ProjectGet,
+    ProjectPage,
+    ProjectQuery,
+    ProjectUpdate,
+)
+from app.v2.services.language import create_language_resolver
+from app.v2.services.project_cache import BY_ID, LIST, CachedBody, project_cache
+from app.utils.dates import as_utc
+from app.utils.language_resolver import LanguageResolver
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.serialization import dump_json, render_json
 from app.utils.validators import PyObjectId
 from app.utils.logger import logger
+from app.utils.metrics import span
 from app.utils.error_handler import handle_error
 
 project_collection = Project
 
+# Listing order; backed by the ``pushed_at_id_desc`` index and used as the keyset.
+PROJECT_SORT = [("pushed_at", DESCENDING), ("_id", DESCENDING)]
+
+
+def _listing_collection() -> AsyncIOMotorCollection:
+    """
+    Projects collection for read-only listing, routed by MONGO_LIST_READ_PREFERENCE
+    (the primary unless configured otherwise).
+    """
+    collection = project_collection.get_motor_collection()
+    if settings.MONGO_LIST_READ_PREFERENCE == settings.MONGO_READ_PREFERENCE:
+        return collection
+    return with_read_preference(
+        collection, settings.MONGO_LIST_READ_PREFERENCE, settings.MONGO_MAX_STALENESS_SECONDS
+    )
+
+
+@lru_cache(maxsize=64)
+def _projection_model(fields: FrozenSet[str]) -> Type[BaseModel]:
+    """
+    Build a ProjectGet variant holding only ``fields`` (all optional), so that
+    Beanie's ``project()`` asks Mongo for just those fields.
+    """
+    definitions = {}
+    for name in fields:
+        field = ProjectGet.model_fields[name]
+        definitions[name] = (Optional[field.annotation], Field(None, alias=field.alias))
+    return create_model("ProjectFields", **definitions)
+
+
+@lru_cache(maxsize=64)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[model])
+
+
+async def _read_many(cursor: AsyncIOMotorCursor, model: Type[BaseModel]) -> List[BaseModel]:
+    """
+    Read-only path: validate the raw documents from ``cursor`` into ``model`` in
+    one pydantic-core call. No Beanie Document (event hooks, state tracking) is
+    built, and ``_id`` becomes a ``PyObjectId`` string once, during validation.
+    """
+    documents = await cursor.to_list(None)
+    return _list_adapter(model).validate_python(documents)
+
+
+async def _read_one(filter: dict, model: Type[BaseModel]) -> Optional[BaseModel]:
+    document = await project_collection.get_motor_collection().find_one(
+        filter, projection=get_projection(model)
+    )
+    return model.model_validate(document) if document is not None else None
+
+
+class CollectionVersion(NamedTuple):
+    updated_at: Optional[datetime]
+    count: int
+
+
+def _resolve_fields(fields: Optional[List[str]]) -> Optional[FrozenSet[str]]:
+    if not fields:
+        return None
+    names = set()
+    for field in fields:
+        name = "id" if field == "_id" else field
+        if name not in ProjectGet.model_fields:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown project field '{field}'",
+            )
+        names.add(name)
+    return frozenset(names)
+
+
+def _keyset_filter(cursor: str) -> dict:
+    values = decode_cursor(cursor)
+    try:
+        pushed_at = datetime.fromisoformat(values["p"])
+        last_id = ObjectId(values["i"])
+    except (KeyError, TypeError, ValueError, InvalidId):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+    return {
+        "$or": [
+            {"pushed_at": {"$lt": pushed_at}},
+            {"pushed_at": pushed_at, "_id": {"$lt": last_id}},
+        ]
+    }
+
+
 class ProjectService:
     """
     Service class for managing project operations using Beanie.
     """
 
+    def __init__(self, github: GitHubClient, languages: Optional[LanguageResolver] = None):
+        """
+        :param github: Shared GitHub client.
+        :param languages: Shared language resolver; a private one around
+                          ``github`` is used when omitted.
+        """
+        self.github = github
+        self.languages = languages or create_language_resolver(github)
+
     @handle_error
     async def get_projects(self) -> List[ProjectGet]:
-        projects = await project_collection.find_all().to_list()
-        return [ProjectGet(**project.model_dump(by_alias=True)) for project in projects]
+        with span("mongo.find"):
+            return await _read_many(
+                _listing_collection().find({}, projection=get_projection(ProjectGet)), ProjectGet
+            )
+
+    def _find_projects(
+        self, query: ProjectQuery, projection: Type[BaseModel], limit: Optional[int] = None
+    ) -> AsyncIOMotorCursor:
+        filters = []
+        if query.languages:
+            filters.append({"languages": {"$in": query.languages}})
+        pushed_at = {}
+        if query.pushed_after:
+            pushed_at["$gte"] = query.pushed_after
+        if query.pushed_before:
+            pushed_at["$lt"] = query.pushed_before
+        if pushed_at:
+            filters.append({"pushed_at": pushed_at})
+        if query.cursor:
+            filters.append(_keyset_filter(query.cursor))
+
+        # Beanie builds the filter and projection; the cursor itself is opened on
+        # the listing collection so it honours MONGO_LIST_READ_PREFERENCE.
+        find = project_collection.find(*filters)
+        return _listing_collection().find(
+            find.get_filter_query(),
+            projection=get_projection(projection),
+            sort=PROJECT_SORT,
+            limit=limit or 0,
+            batch_size=settings.PROJECT_STREAM_BATCH_SIZE,
+        )
+
+    @handle_error
+    async def list_projects(self, query: ProjectQuery) -> ProjectPage:
+        """
+        List projects newest push first, with keyset pagination on
+        ``(pushed_at, _id)``, optional field projection and filters.
+        """
+        fields = _resolve_fields(query.fields)
+        # The keyset fields are always fetched so the next cursor can be built.
+        projection = _projection_model(fields | {"id", "pushed_at"}) if fields else ProjectGet
+        limit = query.limit + 1 if query.limit else None
+        with span("mongo.find"):
+            results = await _read_many(self._find_projects(query, projection, limit), projection)
+
+        next_cursor = None
+        if query.limit and len(results) > query.limit:
+            results = results[: query.limit]
+            last = results[-1]
+            next_cursor = encode_cursor({"p": last.pushed_at.isoformat(), "i": str(last.id)})
+
+        return ProjectPage(
+            items=results,
+            next_cursor=next_cursor,
+            fields=fields | {"id"} if fields else None,
+        )
+
+    async def stream_projects(self, query: Optional[ProjectQuery] = None) -> AsyncIterator[BaseModel]:
+        """
+        Yield projects one by one while walking the Mongo cursor, so memory stays
+        bounded by the cursor batch size instead of the collection size.
+        """
+        query = query or ProjectQuery()
+        fields = _resolve_fields(query.fields)
+        projection = _projection_model(fields | {"id"}) if fields else ProjectGet
+        async for document in self._find_projects(query, projection, query.limit):
+            yield projection.model_validate(document)
+
+    async def get_collection_version(self) -> CollectionVersion:
+        """
+        Cheap version token of the projects collection: the newest ``updated_at``
+        and the document count. Every write that changes a project sets
+        ``updated_at`` explicitly (``update_project``'s ``set()``, the sync's bulk
+        upserts; new documents get it at creation), so any visible insert, update
+        or delete changes at least one of them.
+        """
+        # Same read preference as the listing; see MONGO_LIST_READ_PREFERENCE.
+        collection = _listing_collection()
+        with span("mongo.version"):
+            latest = await collection.find_one(
+                {}, projection={"updated_at": 1}, sort=[("updated_at", DESCENDING)]
+            )
+            count = await collection.estimated_document_count()
+        return CollectionVersion(latest["updated_at"] if latest else None, count)
+
+    async def get_project_version(self, id: PyObjectId) -> Optional[datetime]:
+        """
+        ``updated_at`` of a single project, or None when it does not exist.
+        """
+        try:
+            object_id = ObjectId(id)
+        except (InvalidId, TypeError):
+            return None
+        with span("mongo.version"):
+            project = await project_collection.get_motor_collection().find_one(
+                {"_id": object_id}, projection={"updated_at": 1}
+            )
+        return project["updated_at"] if project else None
+
+    async def read_projects(
+        self, query: Optional[ProjectQuery] = None, version: Optional[CollectionVersion] = None
+    ) -> CachedBody:
+        """
+        Serialized project listing, served from the read cache when it was
+        rendered from ``version`` (see ``get_collection_version``).
+        """
+        query = query or ProjectQuery()
+        if query.is_default:
+            return await project_cache.get_or_load(
+                (LIST, None),
+                self.get_projects,
+                lambda projects: CachedBody(dump_json(projects, List[ProjectGet])),
+                version,
+            )
+        return await project_cache.get_or_load(
+            (LIST, query.model_dump_json()),
+            lambda: self.list_projects(query),
+            lambda page: CachedBody(
+                render_json(page.items, include={"__all__": page.fields} if page.fields else None),
+                page.next_cursor,
+            ),
+            version,
+        )
+
+    async def read_project(
+        self, id: PyObjectId, user_id: str, version: Optional[datetime] = None
+    ) -> CachedBody:
+        return await project_cache.get_or_load(
+            (BY_ID, str(id)),
+            lambda: self.get_project_by_id(id, user_id),
+            lambda project: CachedBody(dump_json(project, ProjectGet)),
+            version,
+        )
 
     @handle_error
     async def get_project_by_id(self, id: PyObjectId, user_id: str) -> ProjectGet:
-        project = await project_collection.get(id)
-        print(user_id)
+        try:
+            object_id = ObjectId(id)
+        except (InvalidId, TypeError):
+            object_id = None
+        project = None
+        if object_id is not None:
+            with span("mongo.get"):
+                project = await _read_one({"_id": object_id}, ProjectGet)
+        logger.debug("Project %s requested by %s", id, user_id)
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Project with id {id} not found",
             )
-        return ProjectGet(**project.model_dump(by_alias=True))
+        return project
 
     @handle_error
     async def get_project_by_github_id(self, github_id: int) -> ProjectGet:
-        project = await project_collection.find_one(project_collection.github_id == github_id)
+        with span("mongo.find_one"):
+            project = await _read_one({"github_id": github_id}, ProjectGet)
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Project with github_id {github_id} not found",
             )
-        return ProjectGet(**project.model_dump(by_alias=True))
+        return project
 
     @handle_error
     async def insert_project(self, project_create: ProjectCreate) -> ProjectGet:
-        project_exists = await project_collection.find_one(project_collection.github_id == project_create.github_id)
-        if project_exists:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"Project with github_id {project_create.github_id} already exists",
+        # Indexed lookup so a known github_id is rejected before spending GitHub
+        # budget on its languages; the unique index still catches concurrent inserts.
+        with span("mongo.find_one"):
+            exists = await project_collection.get_motor_collection().find_one(
+                {"github_id": project_create.github_id}, projection={"_id": 1}
             )
+        if exists:
+            self._already_exists(project_create.github_id)
 
         project_data = project_create.model_dump()
-        languages = await fetch_languages(project_create.languages_url)
-        project_data["languages"] = languages
-
+        project_data["languages"] = await self.languages.resolve(project_create.languages_url)
+        project_data["languages_refreshed_at"] = datetime.now(timezone.utc)
         new_project = Project(**project_data)
-        await new_project.insert()
+        try:
+            with span("mongo.insert"):
+                await new_project.insert()
+        except DuplicateKeyError:
+            self._already_exists(project_create.github_id)
+        project_cache.invalidate_lists()
         return ProjectGet(**new_project.model_dump(by_alias=True))
 
+    @staticmethod
+    def _already_exists(github_id: int):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Project with github_id {github_id} already exists",
+        )
+
+    @staticmethod
+    def _languages_stale(project: Project) -> bool:
+        if project.languages_refreshed_at is None:
+            return True
+        age = datetime.now(timezone.utc) - as_utc(project.languages_refreshed_at)
+        return age > timedelta(seconds=settings.LANGUAGES_MAX_AGE_SECONDS)
+
     @handle_error
-    async def update_project(self, id: PyObjectId, project_update: ProjectUpdate) -> ProjectGet:
-        project = await project_collection.get(id)
+    async def update_project(
+        self, id: PyObjectId, project_update: ProjectUpdate, refresh_languages: bool = False
+    ) -> ProjectGet:
+        """
+        Apply only the fields that changed as a partial ``$set``. Languages are
+        refetched from GitHub when asked to, or when the stored ones are older
+        than ``LANGUAGES_MAX_AGE_SECONDS``.
+        """
+        with span("mongo.get"):
+            project = await project_collection.get(id)
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Project not found",
             )
 
-        languages = await fetch_languages(project.languages_url)
-        update_data = project_update.model_dump(exclude_unset=True)
-        update_data["languages"] = languages
-
-        for key, value in update_data.items():
-            setattr(project, key, value)
+        changes = {
+            key: value
+            for key, value in project_update.model_dump(exclude_unset=True).items()
+            if getattr(project, key) != value
+        }
+        now = datetime.now(timezone.utc)
+        # A stale-only refresh is skipped while the GitHub budget is reserved.
+        if refresh_languages or (self._languages_stale(project) and not self.github.budget.low):
+            languages = await self.languages.resolve(project.languages_url, refresh=refresh_languages)
+            if languages != project.languages:
+                changes["languages"] = languages
+            changes["languages_refreshed_at"] = now
+        if not changes:
+            return ProjectGet(**project.model_dump(by_alias=True))
 
-        await project.save()
+        # Only visible changes bump updated_at (and with it the HTTP ETag).
+        if changes.keys() - {"languages_refreshed_at"}:
+            changes["updated_at"] = now
+        with span("mongo.update"):
+            await project.set(changes)
+        project_cache.invalidate_project(id)
         return ProjectGet(**project.model_dump(by_alias=True))
 
     @handle_error
     async def delete_projects(self) -> Any:
-        delete_result = await project_collection.find_all().delete()
+        with span("mongo.delete"):
+            delete_result = await project_collection.find_all().delete()
+        project_cache.clear()
         return {
             "message": "All projects deleted successfully",
             "deleted_count": getattr(delete_result, "deleted_count", 0),
@@ -87,13 +392,16 @@ class ProjectService:
 
     @handle_error
     async def delete_project(self, id: PyObjectId) -> Any:
-        project = await project_collection.get(id)
+        with span("mongo.get"):
+            project = await project_collection.get(id)
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Project with id {id} not found",
             )
-        await project.delete()
+        with span("mongo.delete"):
+            await project.delete()
+        project_cache.invalidate_project(id)
         return {
             "message": f"Project with id {id} deleted successfully",
             "deleted_id": str(id),
@@ -0,0 +1,245 @@
+import asyncio
+import os
+import socket
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from app.utils.dates import as_utc
+from app.utils.language_resolver import LanguageResolver
+from app.utils.logger import logger
+from app.v2.core.github_budget import Priority, github_priority
+from app.v2.core.github_client import GitHubClient
+from app.v2.models.project import ProjectCreate, ProjectSyncReport
+from app.v2.models.sync_state import SyncState
+from app.v2.services.github_service import fetch_github_repos
+from app.v2.services.sync_service import ProjectSyncService
+
+
+class SyncInProgress(Exception):
+    """
+    Raised by ``run_once`` while another run of the same sync is in progress.
+    """
+
+
+class SyncScheduler:
+    """
+    Periodically reconciles GitHub repositories with the projects collection.
+
+    The newest ``pushed_at`` already synced is persisted as a watermark in the
+    ``sync_state`` collection, so each run only refetches languages and
+    rewrites the projects of repositories pushed since the previous run.
+
+    Each worker process starts its own scheduler; the periodic runs are
+    serialized across them by a lease on the same document, so only one
+    worker syncs at a time. Within a process, ``run_once`` (scheduled or
+    triggered through the API) never overlaps another run of the same key.
+    """
+
+    # Per sync key rather than per instance: the API builds its own scheduler
+    # when the background one is disabled.
+    _run_locks: Dict[str, asyncio.Lock] = {}
+
+    def __init__(
+        self,
+        github: GitHubClient,
+        interval: float,
+        key: str = "github",
+        languages: Optional[LanguageResolver] = None,
+        lease: Optional[float] = None,
+    ):
+        self.github = github
+        self.languages = languages
+        self.interval = interval
+        self.key = key
+        self.lease = lease if lease is not None else interval * 2
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.last_state: Optional[SyncState] = None
+        self._stopping = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def _run_lock(self) -> asyncio.Lock:
+        return self._run_locks.setdefault(self.key, asyncio.Lock())
+
+    @property
+    def busy(self) -> bool:
+        return self._run_lock.locked()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._run(), name="github-sync")
+        logger.info("GitHub sync scheduler started (every %ss)", self.interval)
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """
+        Ask the loop to stop, letting an in-progress run finish within ``timeout``.
+        """
+        if self._task is None:
+            return
+        self._stopping.set()
+        try:
+            await asyncio.wait_for(self._task, timeout)
+        except asyncio.TimeoutError:
+            logger.warning("GitHub sync did not finish within %ss, cancelled", timeout)
+        self._task = None
+        await self.release_lease()
+        logger.info("GitHub sync scheduler stopped")
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                if await self.acquire_lease():
+                    with github_priority(Priority.LOW):
+                        await self.run_once()
+            except SyncInProgress:
+                logger.info("GitHub sync already in progress, skipping this run")
+            except Exception:
+                logger.exception("GitHub sync run failed")
+            try:
+                await asyncio.wait_for(self._stopping.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def acquire_lease(self) -> bool:
+        """
+        Take or renew the sync lease; False while another scheduler holds it.
+        """
+        now = datetime.now(timezone.utc)
+        try:
+            state = await SyncState.get_motor_collection().find_one_and_update(
+                {
+                    "key": self.key,
+                    "$or": [
+                        {"lease_owner": {"$in": [None, self.owner]}},
+                        {"lease_expires_at": {"$lt": now}},
+                    ],
+                },
+                {"$set": {"lease_owner": self.owner, "lease_expires_at": now + timedelta(seconds=self.lease)}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+        except DuplicateKeyError:
+            # The document exists and the lease is held: the upsert tried to insert.
+            return False
+        return state is not None and state["lease_owner"] == self.owner
+
+    async def release_lease(self) -> None:
+        try:
+            await SyncState.get_motor_collection().update_one(
+                {"key": self.key, "lease_owner": self.owner},
+                {"$set": {"lease_owner": None, "lease_expires_at": None}},
+            )
+        except Exception as e:
+            logger.warning("Could not release the GitHub sync lease: %s", e)
+
+    async def _load_state(self) -> SyncState:
+        state = await SyncState.find_one(SyncState.key == self.key)
+        return state or SyncState(key=self.key)
+
+    async def run_once(self) -> SyncState:
+        """
+        Sync every repository pushed after the watermark and persist the outcome.
+
+        :raises SyncInProgress: If a run of the same key is already in progress.
+        """
+        lock = self._run_lock
+        if lock.locked():
+            raise SyncInProgress(self.key)
+        async with lock:
+            return await self._run_once()
+
+    async def run_now(self) -> SyncState:
+        """
+        Run once on demand, under the same lease as the scheduled runs, so it
+        cannot overlap one started by another worker. The lease is kept when
+        this is the background scheduler and released otherwise.
+
+        :raises SyncInProgress: If another scheduler holds the lease, or a run
+                                is already in progress in this process.
+        """
+        if not await self.acquire_lease():
+            raise SyncInProgress(self.key)
+        try:
+            return await self.run_once()
+        finally:
+            if not self.running:
+                await self.release_lease()
+
+    async def _run_once(self) -> SyncState:
+        started = time.perf_counter()
+        state = await self._load_state()
+        error = None
+        scanned = 0
+        report = ProjectSyncReport()
+        try:
+            repos = await fetch_github_repos(self.github)
+            scanned = len(repos)
+            watermark = as_utc(state.watermark) if state.watermark else None
+            changed = [
+                repo for repo in repos
+                if watermark is None or as_utc(repo.pushed_at) > watermark
+            ]
+            if changed:
+                report = await ProjectSyncService(self.github, self.languages).sync_projects(
+                    [ProjectCreate.from_github_repo(repo) for repo in changed]
+                )
+                state.watermark = self._next_watermark(changed, report, state.watermark)
+        except Exception as e:
+            error = str(e)
+            logger.error("GitHub sync failed: %s", e)
+
+        outcome = {
+            "watermark": state.watermark,
+            "last_run_at": datetime.now(timezone.utc),
+            "last_duration_ms": (time.perf_counter() - started) * 1000,
+            "last_scanned": scanned,
+            "last_synced": report.created + report.updated,
+            "last_failed": report.failed,
+            "last_error": error,
+        }
+        # Upsert only the outcome: the document may not exist yet (or have been
+        # created meanwhile), and the lease fields belong to acquire_lease.
+        document = await SyncState.get_motor_collection().find_one_and_update(
+            {"key": self.key},
+            {"$set": outcome},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        state = SyncState.model_validate(document)
+        self.last_state = state
+        logger.info(
+            "GitHub sync: scanned=%d synced=%d failed=%d in %.0fms",
+            state.last_scanned,
+            state.last_synced,
+            state.last_failed,
+            state.last_duration_ms,
+        )
+        return state
+
+    @staticmethod
+    def _next_watermark(repos, report: ProjectSyncReport, current: Optional[datetime]) -> Optional[datetime]:
+        """
+        Advance to the newest synced ``pushed_at``, but never past a failed
+        repository so it is retried on the next run.
+        """
+        failed = {item.github_id for item in report.items if item.status == "failed"}
+        oldest_failure = min(
+            (as_utc(repo.pushed_at) for repo in repos if repo.id in failed), default=None
+        )
+        synced = [
+            as_utc(repo.pushed_at) for repo in repos
+            if repo.id not in failed
+            and (oldest_failure is None or as_utc(repo.pushed_at) < oldest_failure)
+        ]
+        return max(synced, default=current)
@@ -0,0 +1,186 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from beanie.operators import In
+from pydantic import BaseModel, Field
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from app.utils.dates import as_utc
+from app.utils.error_handler import handle_error
+from app.utils.language_resolver import LanguageResolver
+from app.utils.logger import logger
+from app.utils.metrics import span
+from app.utils.validators import PyObjectId
+from app.v2.core.github_client import GitHubClient
+from app.v2.models.project import (
+    Project,
+    ProjectCreate,
+    ProjectSyncItem,
+    ProjectSyncReport,
+)
+from app.v2.services.github_service import fetch_github_repos
+from app.v2.services.language import create_language_resolver
+from app.v2.services.project_cache import project_cache
+
+project_collection = Project
+
+
+# Fields the sync takes from GitHub. name, description and image_url are only
+# written when a project is created, so edits made through the API survive it.
+GITHUB_FIELDS = ("html_url", "pushed_at", "languages_url")
+EDITABLE_FIELDS = ("name", "description", "image_url")
+
+
+class ExistingProject(BaseModel):
+    id: PyObjectId = Field(alias="_id")
+    github_id: int
+    html_url: str
+    pushed_at: datetime
+    languages_url: str
+    languages: List[str] = []
+
+    def changed_fields(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        The subset of ``fields`` whose values differ from the stored ones.
+        """
+        def differs(name: str, value: Any) -> bool:
+            current = getattr(self, name)
+            if isinstance(value, datetime):
+                return as_utc(current) != as_utc(value)
+            return current != value
+
+        return {name: value for name, value in fields.items() if differs(name, value)}
+
+
+class ProjectSyncService:
+    """
+    Bulk import of GitHub repositories into the projects collection.
+
+    Existing projects are looked up with a single ``$in`` query, languages are
+    fetched concurrently and every project is written through one unordered
+    ``bulk_write`` of upserts. Existing projects only get the GitHub fields that
+    changed, and ``updated_at`` (the HTTP cache version) only moves when one did.
+    """
+
+    def __init__(self, github: GitHubClient, languages: Optional[LanguageResolver] = None):
+        self.github = github
+        self.languages = languages or create_language_resolver(github)
+
+    async def _existing_projects(self, github_ids: List[int]) -> Dict[int, ExistingProject]:
+        with span("mongo.find"):
+            existing = await project_collection.find(
+                In(project_collection.github_id, github_ids)
+            ).project(ExistingProject).to_list()
+        return {project.github_id: project for project in existing}
+
+    async def _resolve_languages(
+        self, projects: List[ProjectCreate], existing: Dict[int, ExistingProject]
+    ) -> Dict[int, object]:
+        """
+        Map each github_id to its fetched languages, to the exception raised while
+        fetching them, or to None when ``pushed_at`` did not move and the stored
+        languages are kept.
+        """
+        def unchanged(project: ProjectCreate) -> bool:
+            current = existing.get(project.github_id)
+            return bool(current and current.languages and as_utc(current.pushed_at) >= as_utc(project.pushed_at))
+
+        # A push may have changed the languages, so bypass the resolver's TTL cache.
+        # Runs at the caller's priority: LOW from the background scheduler, where
+        # waiting for the budget is fine, HIGH (fail fast with 503) for requests.
+        fetched = await self.languages.resolve_many(
+            (project.languages_url for project in projects if not unchanged(project)), refresh=True
+        )
+        return {
+            project.github_id: None if unchanged(project) else fetched[project.languages_url]
+            for project in projects
+        }
+
+    @handle_error
+    async def sync_projects(self, projects: Optional[List[ProjectCreate]] = None) -> ProjectSyncReport:
+        """
+        Upsert ``projects`` (or every repository of the GitHub user when omitted)
+        and report the outcome per item.
+        """
+        if projects is None:
+            repos = await fetch_github_repos(self.github)
+            projects = [ProjectCreate.from_github_repo(repo) for repo in repos]
+        # Last occurrence wins when the same repository is sent twice.
+        projects = list({project.github_id: project for project in projects}.values())
+
+        report = ProjectSyncReport()
+        if not projects:
+            return report
+
+        existing = await self._existing_projects([project.github_id for project in projects])
+        languages = await self._resolve_languages(projects, existing)
+
+        now = datetime.now(timezone.utc)
+        items: Dict[int, ProjectSyncItem] = {}
+        operations, written = [], []
+        for project in projects:
+            result = languages[project.github_id]
+            if isinstance(result, Exception):
+                items[project.github_id] = ProjectSyncItem(
+                    github_id=project.github_id, status="failed", error=str(result)
+                )
+                continue
+            fields = {name: getattr(project, name) for name in GITHUB_FIELDS}
+            if result is not None:
+                fields["languages"] = result
+            current = existing.get(project.github_id)
+            if current is None:
+                update = {
+                    "$set": {**fields, "languages_refreshed_at": now, "updated_at": now},
+                    "$setOnInsert": {
+                        **{name: getattr(project, name) for name in EDITABLE_FIELDS},
+                        "created_at": now,
+                    },
+                }
+            else:
+                changes = current.changed_fields(fields)
+                if changes:
+                    changes["updated_at"] = now
+                if result is not None:
+                    changes["languages_refreshed_at"] = now
+                if not changes:
+                    items[project.github_id] = ProjectSyncItem(github_id=project.github_id, status="unchanged")
+                    continue
+                update = {"$set": changes}
+            operations.append(UpdateOne({"github_id": project.github_id}, update, upsert=current is None))
+            written.append((project.github_id, current is None or "updated_at" in update["$set"]))
+
+        failed_writes: Dict[int, str] = {}
+        if operations:
+            try:
+                with span("mongo.bulk_write"):
+                    await project_collection.get_motor_collection().bulk_write(operations, ordered=False)
+            except BulkWriteError as e:
+                for error in e.details.get("writeErrors", []):
+                    failed_writes[error["index"]] = error.get("errmsg", "write failed")
+                logger.error("Bulk sync had %d failed writes", len(failed_writes))
+
+        changed = False
+        for index, (github_id, visible) in enumerate(written):
+            if index in failed_writes:
+                item = ProjectSyncItem(github_id=github_id, status="failed", error=failed_writes[index])
+            elif github_id not in existing:
+                item = ProjectSyncItem(github_id=github_id, status="created")
+                changed = True
+            elif visible:
+                item = ProjectSyncItem(github_id=github_id, status="updated")
+                project_cache.invalidate_project(existing[github_id].id)
+                changed = True
+            else:
+                # Only languages_refreshed_at moved.
+                item = ProjectSyncItem(github_id=github_id, status="unchanged")
+            items[github_id] = item
+
+        for project in projects:
+            item = items[project.github_id]
+            report.items.append(item)
+            setattr(report, item.status, getattr(report, item.status) + 1)
+        if changed:
+            project_cache.invalidate_lists()
+        return report
@@ -0,0 +1,16 @@
+"""
+Load/benchmark suite for the v2 API.
+
+Boots ``app.main:app`` in-process against mongomock-motor (or a local MongoDB
+via ``--mongo-url``) and a fake GitHub API, then drives the main endpoints at a
+configurable concurrency. Run from ``backend/``::
+
+    python -m benchmarks.run --projects 2000 --concurrency 20 --output before.json
+    python -m benchmarks.run --projects 2000 --concurrency 20 --compare before.json
+
+Focused microbenchmarks::
+
+    python -m benchmarks.serialization --items 5000   # response serialization
+    python -m benchmarks.read_path --projects 10000   # Mongo read path
+    python -m benchmarks.import_time --runs 5         # import / cold start
+"""
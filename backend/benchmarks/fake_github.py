@@ -0,0 +1,69 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+import httpx
+
+LANGUAGES = ["Python", "TypeScript", "Go", "Rust", "JavaScript", "Java", "C++", "Shell"]
+
+
+class FakeGitHub:
+    """
+    In-process stand-in for the GitHub REST endpoints the app calls:
+    ``/user/repos`` (paged, with Link and ETag headers) and
+    ``/repos/{owner}/{repo}/languages``. Use ``transport`` with GitHubClient.
+    """
+
+    def __init__(self, repo_count: int = 300, latency: float = 0.0):
+        self.latency = latency
+        self.requests = 0
+        base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        self.repos: List[Dict] = [
+            {
+                "id": i,
+                "name": f"repo-{i}",
+                "description": f"Benchmark repository {i}",
+                "html_url": f"https://github.com/bench/repo-{i}",
+                "pushed_at": (base + timedelta(hours=i)).isoformat(),
+                "created_at": base.isoformat(),
+                "updated_at": (base + timedelta(hours=i)).isoformat(),
+                "languages_url": f"https://api.github.com/repos/bench/repo-{i}/languages",
+            }
+            for i in range(1, repo_count + 1)
+        ]
+
+    @property
+    def transport(self) -> httpx.AsyncBaseTransport:
+        return httpx.MockTransport(self.handle)
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        path = request.url.path
+        if path == "/user/repos":
+            return self._repos_page(request)
+        if path.endswith("/languages"):
+            index = sum(path.encode()) % len(LANGUAGES)
+            languages = {LANGUAGES[index]: 1000, LANGUAGES[(index + 3) % len(LANGUAGES)]: 250}
+            return self._conditional(request, '"lang-%d"' % index, languages)
+        return httpx.Response(404, json={"message": "Not Found"})
+
+    def _repos_page(self, request: httpx.Request) -> httpx.Response:
+        per_page = int(request.url.params.get("per_page", 30))
+        page = int(request.url.params.get("page", 1))
+        last = max(1, -(-len(self.repos) // per_page))
+        response = self._conditional(
+            request, f'"repos-{per_page}-{page}"', self.repos[(page - 1) * per_page: page * per_page]
+        )
+        links = [f'<{request.url.copy_set_param("page", last)}>; rel="last"']
+        if page < last:
+            links.insert(0, f'<{request.url.copy_set_param("page", page + 1)}>; rel="next"')
+        response.headers["Link"] = ", ".join(links)
+        return response
+
+    @staticmethod
+    def _conditional(request: httpx.Request, etag: str, body) -> httpx.Response:
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(200, json=body, headers={"ETag": etag})
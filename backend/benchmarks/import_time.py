@@ -0,0 +1,82 @@
+"""
+Report where the time goes when the application is imported (cold start).
+
+    python -m benchmarks.import_time --runs 5 --top 15 [--module app.main]
+
+Each run imports the module in a fresh interpreter with ``-X importtime``; the
+fastest run is reported, broken down by top-level package and by module.
+"""
+import argparse
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, NamedTuple
+
+from benchmarks.run import ENV_DEFAULTS
+
+# Imports that should stay out of start-up; reported when they show up anyway.
+DEFERRED = ("passlib", "prisma", "app.v1")
+
+
+class ImportTiming(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def profile_import(module: str) -> List[ImportTiming]:
+    env = {**ENV_DEFAULTS, **os.environ}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        timings.append(ImportTiming(name.strip(), int(self_us), int(cumulative_us)))
+    return timings
+
+
+def by_package(timings: List[ImportTiming]) -> Dict[str, int]:
+    totals: Dict[str, int] = defaultdict(int)
+    for timing in timings:
+        package = timing.module.split(".")[0]
+        if package == "app":
+            package = ".".join(timing.module.split(".")[:2])
+        totals[package] += timing.self_us
+    return totals
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    runs = [profile_import(args.module) for _ in range(args.runs)]
+    best = min(runs, key=lambda timings: sum(timing.self_us for timing in timings))
+    total = sum(timing.self_us for timing in best)
+    print(f"import {args.module}: {total / 1000:.1f}ms (best of {args.runs}), {len(best)} modules")
+
+    print(f"\n{'package':<32}{'self':>10}{'share':>8}")
+    for package, self_us in sorted(by_package(best).items(), key=lambda item: -item[1])[: args.top]:
+        print(f"{package:<32}{self_us / 1000:>8.1f}ms{self_us / total:>8.1%}")
+
+    print(f"\n{'module':<48}{'self':>10}{'cumulative':>12}")
+    for timing in sorted(best, key=lambda timing: -timing.self_us)[: args.top]:
+        print(f"{timing.module:<48}{timing.self_us / 1000:>8.1f}ms{timing.cumulative_us / 1000:>10.1f}ms")
+
+    deferred = [timing.module for timing in best if timing.module.startswith(DEFERRED)]
+    if deferred:
+        print(f"\nimported at start-up but meant to be deferred: {', '.join(sorted(deferred))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Compare the ways of reading the project listing out of Mongo.
+
+    python -m benchmarks.read_path --projects 10000 --rounds 5 [--mongo-url mongodb://localhost:27017]
+
+- document:   build a Beanie ``Project`` per document, dump it, validate a ``ProjectGet``
+- projection: Beanie ``find_all().project(ProjectGet)``
+- lean:       raw Motor documents validated into ``ProjectGet`` in one call
+
+Latency is the best of ``--rounds``; memory is the peak traced by tracemalloc
+during one extra run.
+"""
+import argparse
+import asyncio
+import time
+import tracemalloc
+from typing import Awaitable, Callable, List
+
+from beanie import init_beanie
+from beanie.odm.utils.projection import get_projection
+
+from benchmarks.run import open_database
+from app.utils.serialization import dump_json
+from app.v2 import models
+from app.v2.models.project import Project, ProjectGet
+from app.v2.services.project_service import _read_many
+from benchmarks.scenarios import seed_projects
+
+Reader = Callable[[], Awaitable[List[ProjectGet]]]
+
+
+async def read_documents() -> List[ProjectGet]:
+    projects = await Project.find_all().to_list()
+    return [ProjectGet(**project.model_dump(by_alias=True)) for project in projects]
+
+
+async def read_projection() -> List[ProjectGet]:
+    return await Project.find_all().project(ProjectGet).to_list()
+
+
+async def read_lean() -> List[ProjectGet]:
+    cursor = Project.get_motor_collection().find({}, projection=get_projection(ProjectGet))
+    return await _read_many(cursor, ProjectGet)
+
+
+async def best_of(rounds: int, reader: Reader) -> float:
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        await reader()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+async def peak_memory(reader: Reader) -> int:
+    tracemalloc.start()
+    try:
+        await reader()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--projects", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--mongo-url", default=None, help="Real MongoDB instead of mongomock")
+    parser.add_argument("--mongo-db", default="portfolio_read_path")
+    args = parser.parse_args()
+
+    client, database = await open_database(args.mongo_url, args.mongo_db)
+    await init_beanie(database=database, document_models=models.__all__)
+    await seed_projects(args.projects)
+
+    readers = [("document", read_documents), ("projection", read_projection), ("lean", read_lean)]
+    expected = dump_json(await read_documents(), List[ProjectGet])
+    for name, reader in readers:
+        assert dump_json(await reader(), List[ProjectGet]) == expected, name
+
+    print(f"{args.projects} projects")
+    print(f"{'path':<12}{'latency':>12}{'peak memory':>14}{'vs document':>13}")
+    baseline = None
+    for name, reader in readers:
+        latency = await best_of(args.rounds, reader)
+        peak = await peak_memory(reader)
+        baseline = baseline or latency
+        print(f"{name:<12}{latency * 1000:>10.1f}ms{peak / 2**20:>12.1f}MB{baseline / latency:>12.2f}x")
+    client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,273 @@
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+# Settings requires these; benchmarks never talk to the real services.
+ENV_DEFAULTS = {
+    "APP_ENV": "benchmark",
+    "GITHUB_TOKEN": "benchmark",
+    "GITHUB_USERNAME": "bench",
+    "MONGO_HOST": "localhost",
+    "MONGO_USERNAME": "bench",
+    "MONGO_PASSWORD": "bench",
+    "MONGO_DATABASE": "bench",
+    "EXTRA_CONNECT_PARAMS": "",
+    "SECRET_KEY": "benchmark-secret",
+    "ALGORITHM": "HS256",
+    # mongomock has a single member; secondary routing needs a real replica set.
+    "MONGO_LIST_READ_PREFERENCE": "primary",
+}
+for name, value in ENV_DEFAULTS.items():
+    os.environ.setdefault(name, value)
+
+import httpx
+from beanie import init_beanie
+
+from app.main import app
+from app.utils.password_encrypt import hash_password, password_pool
+from app.v2 import models
+from app.v2.auth.jwt_handler import sign_jwt
+from app.v2.core.config import settings
+from app.v2.core.github_client import GitHubClient
+from app.v2.core.security import login_rate_limiter
+from app.v2.models.admin import Admin
+from app.v2.services.language import create_language_resolver
+from app.v2.services.project_cache import project_cache
+from benchmarks.fake_github import FakeGitHub
+from benchmarks.scenarios import ADMIN_EMAIL, ADMIN_PASSWORD, SCENARIOS, BenchContext, Scenario, seed_projects
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+async def open_database(mongo_url: Optional[str], database: str):
+    if mongo_url:
+        from motor.motor_asyncio import AsyncIOMotorClient
+
+        client = AsyncIOMotorClient(mongo_url)
+        # Start from an empty database so runs are comparable.
+        await client.drop_database(database)
+        return client, client[database]
+    from mongomock_motor import AsyncMongoMockClient
+
+    client = AsyncMongoMockClient()
+    return client, client[database]
+
+
+async def boot(args: argparse.Namespace):
+    """
+    Do what the application lifespan does, against the benchmark backends.
+    """
+    client, database = await open_database(args.mongo_url, args.mongo_db)
+    await init_beanie(database=database, document_models=models.__all__)
+    password_pool.configure(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_MAX_PENDING)
+    github = GitHubClient.from_settings(
+        settings, transport=FakeGitHub(args.repos, args.github_latency / 1000).transport
+    )
+    await github.start()
+    app.state.github_client = github
+    app.state.language_resolver = create_language_resolver(github)
+    # The login scenario measures bcrypt and the lookup, not the throttle.
+    login_rate_limiter.by_ip.limit = login_rate_limiter.by_username.limit = sys.maxsize
+    return client, github
+
+
+async def seed(args: argparse.Namespace, http: httpx.AsyncClient) -> BenchContext:
+    ctx = BenchContext(client=http)
+    ctx.project_ids = await seed_projects(args.projects)
+    await Admin(fullname="Benchmark", email=ADMIN_EMAIL, password=hash_password(ADMIN_PASSWORD)).insert()
+    project_cache.clear()
+    return ctx
+
+
+async def run_scenario(ctx: BenchContext, scenario: Scenario, requests: int, concurrency: int, warmup: int) -> Dict[str, Any]:
+    if scenario.prepare:
+        await scenario.prepare(ctx, warmup + requests)
+    for i in range(warmup):
+        await scenario.call(ctx, i)
+
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    indices = itertools.count(warmup)
+    total = warmup + requests
+
+    async def worker() -> None:
+        for i in indices:
+            if i >= total:
+                return
+            started = time.perf_counter()
+            try:
+                response = await scenario.call(ctx, i)
+                statuses[response.status_code] += 1
+            except Exception as e:
+                statuses[type(e).__name__] += 1
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    latency_ms = {"mean": sum(latencies) / len(latencies) * 1000 if latencies else 0.0}
+    for pct in PERCENTILES:
+        latency_ms[f"p{pct}"] = percentile(latencies, pct) * 1000
+    latency_ms["max"] = latencies[-1] * 1000 if latencies else 0.0
+    return {
+        "description": scenario.description,
+        "requests": requests,
+        "concurrency": concurrency,
+        "errors": sum(count for status, count in statuses.items() if status != scenario.expected_status),
+        "statuses": {str(status): count for status, count in statuses.items()},
+        "throughput_rps": requests / elapsed if elapsed else 0.0,
+        "latency_ms": {key: round(value, 3) for key, value in latency_ms.items()},
+    }
+
+
+def git_revision() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = bool(subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True
+        ).stdout.strip())
+        return {"commit": commit, "dirty": dirty}
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+
+
+def print_results(results: Dict[str, Dict[str, Any]]) -> None:
+    header = f"{'scenario':<24}{'req/s':>10}{'mean':>9}{'p50':>9}{'p90':>9}{'p99':>9}{'max':>9}{'errors':>8}"
+    print(header)
+    print("-" * len(header))
+    for name, result in results.items():
+        latency = result["latency_ms"]
+        print(
+            f"{name:<24}{result['throughput_rps']:>10.1f}{latency['mean']:>9.2f}{latency['p50']:>9.2f}"
+            f"{latency['p90']:>9.2f}{latency['p99']:>9.2f}{latency['max']:>9.2f}{result['errors']:>8}"
+        )
+    print("(latencies in ms)")
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline_path: str, threshold: float) -> bool:
+    """
+    Print the change against a saved run; return True when any scenario's
+    throughput dropped, or p50/p99 latency grew, by more than ``threshold`` percent.
+    """
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    print(f"\nCompared with {baseline_path} ({baseline['meta'].get('git', {}).get('commit')})")
+    print(f"{'scenario':<24}{'req/s':>10}{'p50':>10}{'p99':>10}")
+    regressed = False
+    for name, result in results.items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+
+        def change(new: float, old: float) -> float:
+            return (new - old) / old * 100 if old else 0.0
+
+        rps = change(result["throughput_rps"], before["throughput_rps"])
+        p50 = change(result["latency_ms"]["p50"], before["latency_ms"]["p50"])
+        p99 = change(result["latency_ms"]["p99"], before["latency_ms"]["p99"])
+        flag = rps < -threshold or p50 > threshold or p99 > threshold
+        regressed = regressed or flag
+        print(f"{name:<24}{rps:>+9.1f}%{p50:>+9.1f}%{p99:>+9.1f}%{'  REGRESSION' if flag else ''}")
+    return regressed
+
+
+async def main(args: argparse.Namespace) -> int:
+    names = args.scenarios.split(",") if args.scenarios else list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        print(f"Unknown scenarios: {', '.join(unknown)}; available: {', '.join(SCENARIOS)}")
+        return 2
+
+    client, github = await boot(args)
+    token = sign_jwt("benchmark")["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    if args.accept_encoding is not None:
+        headers["Accept-Encoding"] = args.accept_encoding
+    http = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://benchmark",
+        headers=headers,
+        timeout=None,
+    )
+    try:
+        ctx = await seed(args, http)
+        results = {}
+        for name in names:
+            results[name] = await run_scenario(ctx, SCENARIOS[name], args.requests, args.concurrency, args.warmup)
+    finally:
+        await http.aclose()
+        await github.aclose()
+        password_pool.shutdown()
+        client.close()
+
+    print_results(results)
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "mongo": "mongodb" if args.mongo_url else "mongomock",
+            "projects": args.projects,
+            "repos": args.repos,
+            "github_latency_ms": args.github_latency,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "warmup": args.warmup,
+            "accept_encoding": args.accept_encoding,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved results to {args.output}")
+    if args.compare and compare(results, args.compare, args.threshold) and args.fail_on_regression:
+        return 1
+    return 0
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the v2 API in-process.")
+    parser.add_argument("--scenarios", help=f"Comma-separated subset of: {', '.join(SCENARIOS)}")
+    parser.add_argument("--requests", type=int, default=200, help="Timed requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=10, help="Concurrent clients")
+    parser.add_argument("--warmup", type=int, default=5, help="Untimed requests before each scenario")
+    parser.add_argument("--projects", type=int, default=1000, help="Projects seeded before the run")
+    parser.add_argument("--repos", type=int, default=300, help="Repositories served by the fake GitHub")
+    parser.add_argument("--github-latency", type=float, default=0.0, help="Added latency per fake GitHub call (ms)")
+    parser.add_argument("--accept-encoding", help="Accept-Encoding sent by the client, e.g. identity or gzip (default: httpx's)")
+    parser.add_argument("--mongo-url", help="Use this MongoDB instead of mongomock (its database is dropped first)")
+    parser.add_argument("--mongo-db", default="portfolio_benchmark")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    parser.add_argument("--compare", help="Baseline JSON from a previous run")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Regression threshold in percent")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit 1 when --compare finds a regression")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
@@ -0,0 +1,166 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+from app.v2.models.project import Project
+from app.v2.services.project_cache import project_cache
+
+# github_id ranges kept apart so seeded, created and deletable projects never clash
+CREATED_GITHUB_ID_BASE = 10_000_000
+DELETABLE_GITHUB_ID_BASE = 20_000_000
+
+ADMIN_EMAIL = "bench@example.com"
+ADMIN_PASSWORD = "bench-password"
+
+
+@dataclass
+class BenchContext:
+    client: httpx.AsyncClient
+    project_ids: List[str] = field(default_factory=list)
+    deletable_ids: List[str] = field(default_factory=list)
+    list_etag: Optional[str] = None
+
+
+@dataclass
+class Scenario:
+    name: str
+    description: str
+    call: Callable[[BenchContext, int], Awaitable[httpx.Response]]
+    expected_status: int = 200
+    # Runs once before the timed requests, with the number of requests planned.
+    prepare: Optional[Callable[[BenchContext, int], Awaitable[None]]] = None
+
+
+SCENARIOS: Dict[str, Scenario] = {}
+
+
+def scenario(name: str, description: str, expected_status: int = 200, prepare=None):
+    def register(call):
+        SCENARIOS[name] = Scenario(name, description, call, expected_status, prepare)
+        return call
+
+    return register
+
+
+def project_fields(count: int, github_id_base: int = 0) -> List[dict]:
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    languages = ["Python", "TypeScript", "Go", "Rust", "JavaScript"]
+    now = datetime.now(timezone.utc)
+    return [
+        dict(
+            github_id=github_id_base + i,
+            name=f"project-{github_id_base + i}",
+            description=f"Benchmark project {i} " + "x" * 120,
+            html_url=f"https://github.com/bench/project-{i}",
+            pushed_at=base + timedelta(minutes=i),
+            languages=[languages[i % len(languages)], languages[(i + 2) % len(languages)]],
+            languages_url=f"https://api.github.com/repos/bench/project-{i}/languages",
+            image_url=f"https://example.com/project-{i}.png",
+            created_at=now,
+            updated_at=now,
+            languages_refreshed_at=now,
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def make_projects(count: int, github_id_base: int = 0) -> List[Project]:
+    return [Project(**fields) for fields in project_fields(count, github_id_base)]
+
+
+async def seed_projects(count: int, github_id_base: int = 0) -> List[str]:
+    projects = make_projects(count, github_id_base)
+    for start in range(0, len(projects), 1000):
+        await Project.insert_many(projects[start: start + 1000])
+    inserted = await Project.find(
+        Project.github_id > github_id_base, Project.github_id <= github_id_base + count
+    ).to_list()
+    return [str(project.id) for project in inserted]
+
+
+@scenario("projects.list", "GET /v2/projects/ (read cache warm)")
+async def list_projects(ctx: BenchContext, i: int) -> httpx.Response:
+    return await ctx.client.get("/v2/projects/")
+
+
+@scenario("projects.list_cold", "GET /v2/projects/ with the read cache cleared first")
+async def list_projects_cold(ctx: BenchContext, i: int) -> httpx.Response:
+    project_cache.clear()
+    return await ctx.client.get("/v2/projects/")
+
+
+@scenario("projects.page", "GET /v2/projects/?limit=50")
+async def list_projects_page(ctx: BenchContext, i: int) -> httpx.Response:
+    return await ctx.client.get("/v2/projects/", params={"limit": 50})
+
+
+async def _prepare_conditional(ctx: BenchContext, requests: int) -> None:
+    response = await ctx.client.get("/v2/projects/")
+    ctx.list_etag = response.headers.get("ETag")
+
+
+@scenario(
+    "projects.not_modified",
+    "GET /v2/projects/ with a matching If-None-Match",
+    expected_status=304,
+    prepare=_prepare_conditional,
+)
+async def list_projects_not_modified(ctx: BenchContext, i: int) -> httpx.Response:
+    return await ctx.client.get("/v2/projects/", headers={"If-None-Match": ctx.list_etag or ""})
+
+
+@scenario("projects.get", "GET /v2/projects/{id}")
+async def get_project(ctx: BenchContext, i: int) -> httpx.Response:
+    return await ctx.client.get(f"/v2/projects/{ctx.project_ids[i % len(ctx.project_ids)]}")
+
+
+@scenario("projects.create", "POST /v2/projects/ (languages from fake GitHub)", expected_status=201)
+async def create_project(ctx: BenchContext, i: int) -> httpx.Response:
+    github_id = CREATED_GITHUB_ID_BASE + i
+    return await ctx.client.post(
+        "/v2/projects/",
+        json={
+            "github_id": github_id,
+            "name": f"created-{github_id}",
+            "description": "Created by the benchmark",
+            "html_url": f"https://github.com/bench/created-{github_id}",
+            "pushed_at": datetime.now(timezone.utc).isoformat(),
+            "languages_url": f"https://api.github.com/repos/bench/created-{github_id}/languages",
+        },
+    )
+
+
+@scenario("projects.update", "PUT /v2/projects/{id}", expected_status=201)
+async def update_project(ctx: BenchContext, i: int) -> httpx.Response:
+    return await ctx.client.put(
+        f"/v2/projects/{ctx.project_ids[i % len(ctx.project_ids)]}",
+        json={"description": f"Updated by the benchmark ({i})"},
+    )
+
+
+async def _prepare_delete(ctx: BenchContext, requests: int) -> None:
+    ctx.deletable_ids = await seed_projects(requests, DELETABLE_GITHUB_ID_BASE)
+
+
+@scenario("projects.delete", "DELETE /v2/projects/{id}", prepare=_prepare_delete)
+async def delete_project(ctx: BenchContext, i: int) -> httpx.Response:
+    return await ctx.client.delete(f"/v2/projects/{ctx.deletable_ids[i]}")
+
+
+@scenario("admin.login", "POST /v2/admin/login (bcrypt verify)")
+async def admin_login(ctx: BenchContext, i: int) -> httpx.Response:
+    return await ctx.client.post(
+        "/v2/admin/login", json={"username": ADMIN_EMAIL, "password": ADMIN_PASSWORD}
+    )
+
+
+@scenario("github.repos", "GET /github/repos (all pages from fake GitHub)")
+async def github_repos(ctx: BenchContext, i: int) -> httpx.Response:
+    return await ctx.client.get("/github/repos")
+
+
+@scenario("github.repos_stream", "GET /github/repos?stream=true (NDJSON)")
+async def github_repos_stream(ctx: BenchContext, i: int) -> httpx.Response:
+    return await ctx.client.get("/github/repos", params={"stream": "true"})
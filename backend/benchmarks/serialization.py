@@ -0,0 +1,70 @@
+"""
+Compare the response_model serialization path with the fast path.
+
+    python -m benchmarks.serialization --items 5000 --rounds 20
+"""
+import argparse
+import json
+import time
+from typing import Callable, List
+
+from fastapi.encoders import jsonable_encoder
+
+from benchmarks import run  # noqa: F401  (sets the Settings environment)
+from app.utils.serialization import dump_json, json_adapter
+from app.v2.models.github import GitHubRepo
+from app.v2.models.project import ProjectGet
+from benchmarks.fake_github import FakeGitHub
+from benchmarks.scenarios import project_fields
+
+
+def fastapi_response_bytes(value, field_type) -> bytes:
+    """
+    What FastAPI does for ``response_model``: validate, dump, jsonable_encoder, json.dumps.
+    """
+    adapter = json_adapter(field_type)
+    validated = adapter.validate_python(value, from_attributes=True)
+    content = jsonable_encoder(adapter.dump_python(validated, mode="json", by_alias=True))
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode()
+
+
+def best_of(rounds: int, repeat: int, func: Callable[[], bytes]) -> float:
+    """
+    Fastest of ``rounds`` runs, each timing ``repeat`` calls; seconds per call.
+    """
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        timings.append((time.perf_counter() - started) / repeat)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    projects: List[ProjectGet] = [
+        ProjectGet(_id="64a50b684f6b1e2b68a3d1f4", **fields) for fields in project_fields(args.items)
+    ]
+    repos = [GitHubRepo(**repo) for repo in FakeGitHub(args.items).repos]
+
+    cases = [
+        ("ProjectGet list", projects, List[ProjectGet]),
+        ("ProjectGet item", projects[0], ProjectGet),
+        ("GitHubRepo list", repos, List[GitHubRepo]),
+    ]
+    print(f"{'payload':<18}{'response_model':>16}{'fast path':>12}{'speedup':>9}")
+    for name, value, field_type in cases:
+        assert fastapi_response_bytes(value, field_type) == dump_json(value, field_type)
+        repeat = 1 if isinstance(value, list) else 1000
+        slow = best_of(args.rounds, repeat, lambda: fastapi_response_bytes(value, field_type))
+        fast = best_of(args.rounds, repeat, lambda: dump_json(value, field_type))
+        print(f"{name:<18}{slow * 1000:>14.3f}ms{fast * 1000:>10.3f}ms{slow / fast:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import os
+
+import pytest
+
+# Settings requires these; the tests never talk to the real services.
+for name, value in {
+    "APP_ENV": "test",
+    "GITHUB_TOKEN": "test",
+    "GITHUB_USERNAME": "test",
+    "MONGO_HOST": "localhost",
+    "MONGO_USERNAME": "test",
+    "MONGO_PASSWORD": "test",
+    "MONGO_DATABASE": "test",
+    "EXTRA_CONNECT_PARAMS": "",
+    "SECRET_KEY": "test-secret",
+    "ALGORITHM": "HS256",
+}.items():
+    os.environ.setdefault(name, value)
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def database():
+    """
+    Beanie initialised on an empty in-memory (mongomock) database.
+    """
+    from beanie import init_beanie
+    from mongomock_motor import AsyncMongoMockClient
+
+    from app.v2 import models
+    from app.v2.services.project_cache import project_cache
+
+    client = AsyncMongoMockClient()
+    await init_beanie(database=client["test"], document_models=models.__all__)
+    project_cache.clear()
+    yield client["test"]
+    project_cache.clear()
+    client.close()
+
+
+@pytest.fixture
+async def client(database):
+    """
+    HTTP client for the application, signed in as an admin, on the mongomock
+    database and without the lifespan (no GitHub client, scheduler or pre-warm).
+    """
+    import httpx
+
+    from app.main import app
+    from app.v2.auth.jwt_handler import sign_jwt
+
+    app.state.github_client = None
+    app.state.language_resolver = None
+    headers = {"Authorization": f"Bearer {sign_jwt('test-admin')['access_token']}"}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test", headers=headers) as client:
+        yield client
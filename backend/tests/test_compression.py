@@ -0,0 +1,190 @@
+import gzip
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import Response, StreamingResponse
+
+from app.utils.compression import (
+    AVAILABLE_ENCODINGS,
+    GZIP,
+    CompressionMiddleware,
+    ResponseCompressor,
+    parse_accept_encoding,
+)
+
+pytestmark = pytest.mark.anyio
+
+BIG = b'{"items": "' + b"x" * 4096 + b'"}'
+SMALL = b'{"ok": true}'
+
+
+def test_parse_accept_encoding():
+    assert parse_accept_encoding("gzip;q=0.5, br, zstd;q=0, *;q=0.1") == {
+        "gzip": 0.5, "br": 1.0, "zstd": 0.0, "*": 0.1
+    }
+    assert parse_accept_encoding(None) == {}
+    assert parse_accept_encoding("gzip;q=oops") == {"gzip": 0.0}
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        (None, None),
+        ("identity", None),
+        ("gzip", GZIP),
+        ("gzip;q=0", None),
+        ("gzip, br;q=0", GZIP),
+        ("gzip;q=0.5, br;q=0.8", "br"),
+        # Ties go to the preference order.
+        ("gzip, br", "br"),
+        ("*", "br"),
+        ("*, br;q=0", "zstd"),
+        ("*;q=0", None),
+    ],
+)
+def test_negotiation(accept_encoding, expected):
+    if expected not in AVAILABLE_ENCODINGS + [None]:
+        pytest.skip(f"{expected} is not installed")
+    compressor = ResponseCompressor(encodings=["br", "zstd", "gzip"])
+    assert compressor.negotiate(accept_encoding) == expected
+
+
+def test_unavailable_or_unconfigured_codings_are_not_offered():
+    compressor = ResponseCompressor(encodings=[GZIP, "deflate"])
+    assert compressor.encodings == [GZIP]
+    assert compressor.negotiate("br, deflate") is None
+
+
+@pytest.fixture
+def compressor():
+    return ResponseCompressor(minimum_size=1024, encodings=[GZIP])
+
+
+@pytest.fixture
+async def client(compressor):
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, compressor=compressor)
+    variants = {}
+
+    @app.get("/big")
+    async def big():
+        return Response(BIG, media_type="application/json", headers={"ETag": '"v1"'})
+
+    @app.get("/small")
+    async def small():
+        return Response(SMALL, media_type="application/json", headers={"ETag": '"v1"'})
+
+    @app.get("/image")
+    async def image():
+        return Response(BIG, media_type="image/png")
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for _ in range(3):
+                yield BIG
+
+        return StreamingResponse(chunks(), media_type="application/x-ndjson")
+
+    @app.get("/cached")
+    async def cached(request: Request):
+        return compressor.cached_response(request, BIG, variants, "application/json", {"ETag": '"v1"'})
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+async def test_buffered_body_is_compressed_with_vary_length_and_weak_etag(client, compressor):
+    response = await client.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert response.headers["ETag"] == 'W/"v1"'
+    assert response.content == BIG
+    wire = int(response.headers["Content-Length"])
+    assert wire < len(BIG)
+    assert compressor.counters["compressed"] == 1
+    assert compressor.counters["bytes_out"] == wire
+
+
+async def test_small_body_is_sent_as_is(client):
+    response = await client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in response.headers
+    assert response.headers["Content-Length"] == str(len(SMALL))
+    assert response.headers["ETag"] == '"v1"'
+    # Still varies: a larger body for the same URL would be compressed.
+    assert response.headers["Vary"] == "Accept-Encoding"
+
+
+async def test_refused_coding_is_not_used(client):
+    response = await client.get("/big", headers={"Accept-Encoding": "gzip;q=0"})
+    assert "Content-Encoding" not in response.headers
+    assert response.headers["ETag"] == '"v1"'
+    assert response.content == BIG
+
+
+async def test_non_compressible_types_are_left_alone(client):
+    response = await client.get("/image", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in response.headers
+    assert "Vary" not in response.headers
+
+
+async def test_streamed_body_is_compressed_chunk_by_chunk(client, compressor):
+    async with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+        raw = b"".join([chunk async for chunk in response.aiter_raw()])
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in response.headers
+    assert gzip.decompress(raw) == BIG * 3
+    assert compressor.counters["streamed"] == 1
+    assert compressor.counters["compressed"] == 0
+
+
+async def test_cached_body_reuses_its_precompressed_variant(client, compressor):
+    first = await client.get("/cached", headers={"Accept-Encoding": "gzip"})
+    second = await client.get("/cached", headers={"Accept-Encoding": "gzip"})
+    assert first.content == second.content == BIG
+    assert first.headers["ETag"] == second.headers["ETag"] == 'W/"v1"'
+    assert first.headers["Content-Length"] == second.headers["Content-Length"]
+    assert compressor.counters["precompressed_hits"] == 1
+    # The middleware does not compress the already-encoded body again.
+    assert compressor.counters["compressed"] == 0
+
+    plain = await client.get("/cached", headers={"Accept-Encoding": "identity"})
+    assert "Content-Encoding" not in plain.headers
+    assert plain.headers["ETag"] == '"v1"'
+    assert plain.headers["Vary"] == "Accept-Encoding"
+
+
+async def test_validator_is_weak_only_when_a_coding_is_negotiated(compressor):
+    def request(accept_encoding):
+        return Request({"type": "http", "headers": [(b"accept-encoding", accept_encoding.encode())]})
+
+    assert compressor.validator(request("gzip"), '"v1"') == 'W/"v1"'
+    assert compressor.validator(request("gzip"), 'W/"v1"') == 'W/"v1"'
+    assert compressor.validator(request("identity"), '"v1"') == '"v1"'
+
+
+@pytest.mark.parametrize("encoding", AVAILABLE_ENCODINGS)
+async def test_every_available_coding_round_trips(encoding):
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, compressor=ResponseCompressor(encodings=[encoding]))
+
+    @app.get("/big")
+    async def big():
+        return Response(BIG, media_type="application/json")
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        async with client.stream("GET", "/big", headers={"Accept-Encoding": encoding}) as response:
+            raw = b"".join([chunk async for chunk in response.aiter_raw()])
+    assert response.headers["Content-Encoding"] == encoding
+    # Decoded here: httpx itself does not decode zstd.
+    if encoding == "br":
+        import brotli
+
+        assert brotli.decompress(raw) == BIG
+    elif encoding == "zstd":
+        import zstandard
+
+        assert zstandard.ZstdDecompressor().decompressobj().decompress(raw) == BIG
+    else:
+        assert gzip.decompress(raw) == BIG
@@ -0,0 +1,102 @@
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from app.v2.models.admin import Admin
+from app.v2.models.project import Project, ProjectCreate
+from app.v2.services import admin_service
+from app.v2.services.admin_service import AdminService
+from app.v2.services.project_service import ProjectService
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeLanguages:
+    def __init__(self):
+        self.calls = 0
+
+    async def resolve(self, url, refresh=False):
+        self.calls += 1
+        return ["Python"]
+
+
+def project_create(github_id: int = 1) -> ProjectCreate:
+    return ProjectCreate(
+        github_id=github_id,
+        name="repo",
+        html_url="https://github.com/u/repo",
+        pushed_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        languages_url="https://api.github.com/repos/u/repo/languages",
+    )
+
+
+async def test_duplicate_project_is_409_without_fetching_languages(database):
+    languages = FakeLanguages()
+    service = ProjectService(github=None, languages=languages)
+    created = await service.insert_project(project_create())
+    assert created.languages == ["Python"]
+
+    with pytest.raises(HTTPException) as error:
+        await service.insert_project(project_create())
+    assert error.value.status_code == 409
+    assert languages.calls == 1
+    assert await Project.find_all().count() == 1
+
+
+async def test_project_is_not_inserted_when_its_languages_cannot_be_fetched(database):
+    class FailingLanguages(FakeLanguages):
+        async def resolve(self, url, refresh=False):
+            raise RuntimeError("GitHub is down")
+
+    with pytest.raises(HTTPException):
+        await ProjectService(github=None, languages=FailingLanguages()).insert_project(project_create())
+    assert await Project.find_all().count() == 0
+
+
+async def test_concurrent_project_insert_is_409_from_the_unique_index(database):
+    class RacingLanguages(FakeLanguages):
+        async def resolve(self, url, refresh=False):
+            # Another request inserts the same repository while this one fetches.
+            await Project(**project_create().model_dump(), languages=[]).insert()
+            return await super().resolve(url, refresh)
+
+    with pytest.raises(HTTPException) as error:
+        await ProjectService(github=None, languages=RacingLanguages()).insert_project(project_create())
+    assert error.value.status_code == 409
+    assert await Project.find_all().count() == 1
+
+
+async def test_duplicate_admin_is_409_before_hashing(database, monkeypatch):
+    hashed = []
+
+    async def fake_hash(password):
+        hashed.append(password)
+        return f"hashed:{password}"
+
+    monkeypatch.setattr(admin_service, "hash_password_async", fake_hash)
+    service = AdminService()
+    await service.register_admin(Admin(fullname="A", email="a@example.com", password="p"))
+
+    with pytest.raises(HTTPException) as error:
+        await service.register_admin(Admin(fullname="A", email="a@example.com", password="p"))
+    assert error.value.status_code == 409
+    assert hashed == ["p"]
+
+
+async def test_concurrent_admin_registration_is_409_from_the_unique_index(database, monkeypatch):
+    async def fake_hash(password):
+        return password
+
+    async def not_found(*args, **kwargs):
+        return None
+
+    monkeypatch.setattr(admin_service, "hash_password_async", fake_hash)
+    service = AdminService()
+    await service.register_admin(Admin(fullname="A", email="a@example.com", password="p"))
+    # The other registration passed the pre-check before this one was inserted.
+    monkeypatch.setattr(Admin, "find_one", not_found)
+
+    with pytest.raises(HTTPException) as error:
+        await service.register_admin(Admin(fullname="B", email="a@example.com", password="q"))
+    assert error.value.status_code == 409
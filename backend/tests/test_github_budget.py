@@ -0,0 +1,80 @@
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from app.utils.error_handler import handle_error
+from app.v2.core import github_client
+from app.v2.core.github_budget import GitHubRateBudget, Priority, backoff_delay
+from app.v2.core.github_client import GitHubClient
+
+pytestmark = pytest.mark.anyio
+
+
+def rate_limit_headers(remaining: int, reset_at: float) -> dict:
+    return {"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": str(remaining), "X-RateLimit-Reset": str(reset_at)}
+
+
+def test_low_priority_waits_once_the_reserve_is_reached():
+    budget = GitHubRateBudget(reserve=10)
+    budget.update(httpx.Response(200, headers=rate_limit_headers(10, reset_at=1100)))
+    assert budget.wait_time(Priority.LOW, now=1000) == 100
+    assert budget.wait_time(Priority.HIGH, now=1000) == 0
+    # After the reset the budget is available again.
+    assert budget.wait_time(Priority.LOW, now=1100) == 0
+
+
+def test_retry_after_blocks_every_priority(monkeypatch):
+    monkeypatch.setattr("app.v2.core.github_budget.time.time", lambda: 1000.0)
+    budget = GitHubRateBudget()
+    budget.update(httpx.Response(403, headers={"Retry-After": "30"}))
+    assert budget.wait_time(Priority.HIGH, now=1000) == 30
+    assert budget.wait_time(Priority.LOW, now=1010) == 20
+
+
+async def test_high_priority_fails_fast_when_the_wait_is_too_long():
+    budget = GitHubRateBudget(max_wait=5)
+    budget.blocked_until = 1e12
+    with pytest.raises(HTTPException) as error:
+        await budget.acquire(Priority.HIGH)
+    assert error.value.status_code == 503
+    assert int(error.value.headers["Retry-After"]) > 5
+
+
+@pytest.mark.parametrize("attempt", range(6))
+def test_backoff_is_jittered_and_capped(attempt):
+    delays = [backoff_delay(attempt, base=0.5, cap=4) for _ in range(50)]
+    assert all(0 <= delay <= min(4, 0.5 * 2 ** attempt) for delay in delays)
+
+
+async def test_transient_errors_are_retried_with_backoff(monkeypatch):
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(github_client.asyncio, "sleep", fake_sleep)
+    statuses = iter([502, 503, 200])
+
+    def handler(request):
+        return httpx.Response(next(statuses), json={})
+
+    client = GitHubClient(max_retries=3, backoff_base=1, backoff_max=8, transport=httpx.MockTransport(handler))
+    response = await client.get("/user")
+    await client.aclose()
+
+    assert response.status_code == 200
+    assert len(sleeps) == 2 and sleeps[0] <= 1 and sleeps[1] <= 2
+    assert client.budget.retries == {"502": 1, "503": 1}
+
+
+async def test_upstream_rate_limit_becomes_503_with_retry_after():
+    @handle_error
+    async def call():
+        request = httpx.Request("GET", "https://api.github.com/user")
+        response = httpx.Response(403, headers={"X-RateLimit-Remaining": "0"}, request=request)
+        response.raise_for_status()
+
+    with pytest.raises(HTTPException) as error:
+        await call()
+    assert error.value.status_code == 503
+    assert error.value.headers["Retry-After"] == "60"
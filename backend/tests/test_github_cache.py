@@ -0,0 +1,77 @@
+import httpx
+import pytest
+
+from app.v2.core.github_client import GitHubClient
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeGitHub:
+    """
+    Serves ``/repos/{n}`` with an ETag and answers matching If-None-Match with 304.
+    """
+
+    def __init__(self):
+        self.requests = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        etag = f'"{request.url.path}"'
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(200, json={"path": request.url.path}, headers={"ETag": etag})
+
+
+def make_client(github: FakeGitHub, cache_size: int = 512) -> GitHubClient:
+    return GitHubClient(
+        cache_size=cache_size, max_retries=0, transport=httpx.MockTransport(github.handler)
+    )
+
+
+async def test_revalidates_with_etag_and_serves_304_from_cache():
+    github = FakeGitHub()
+    client = make_client(github)
+    parsed = []
+
+    def parse(response):
+        parsed.append(response)
+        return response.json()
+
+    first = await client.get_json("/repos/1", parse=parse)
+    second = await client.get_json("/repos/1", parse=parse)
+    await client.aclose()
+
+    assert first == second == {"path": "/repos/1"}
+    assert "if-none-match" not in github.requests[0].headers
+    assert github.requests[1].headers["if-none-match"] == '"/repos/1"'
+    # The 304 is answered from the cached value without parsing again.
+    assert len(parsed) == 1
+    assert client.cache.stats()["hits"] == 1
+
+
+async def test_evicts_least_recently_used_entry():
+    github = FakeGitHub()
+    client = make_client(github, cache_size=2)
+
+    await client.get_json("/repos/1")
+    await client.get_json("/repos/2")
+    await client.get_json("/repos/1")  # 1 is now the most recently used
+    await client.get_json("/repos/3")  # evicts 2
+    await client.get_json("/repos/2")
+    await client.aclose()
+
+    assert client.cache.stats()["evictions"] == 2
+    assert "if-none-match" not in github.requests[-1].headers
+    assert github.requests[2].headers["if-none-match"] == '"/repos/1"'
+
+
+async def test_disabled_cache_sends_plain_requests():
+    github = FakeGitHub()
+    client = make_client(github, cache_size=0)
+
+    await client.get_json("/repos/1")
+    await client.get_json("/repos/1")
+    await client.aclose()
+
+    assert client.cache is None
+    assert all("if-none-match" not in request.headers for request in github.requests)
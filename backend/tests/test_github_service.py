@@ -0,0 +1,97 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.v2.core.github_client import GitHubClient
+from app.v2.services.github_service import REPOS_PER_PAGE, _parse_repo_page, fetch_github_repos
+from benchmarks.fake_github import FakeGitHub
+
+pytestmark = pytest.mark.anyio
+
+
+def page_of(request: httpx.Request) -> int:
+    return int(request.url.params.get("page", 1))
+
+
+class SlowFirstPagesGitHub(FakeGitHub):
+    """
+    Later pages answer first, and the number of page requests in flight is recorded.
+    """
+
+    def __init__(self, repo_count: int):
+        super().__init__(repo_count)
+        self.inflight = 0
+        self.max_inflight = 0
+
+    async def handle(self, request):
+        self.inflight += 1
+        self.max_inflight = max(self.max_inflight, self.inflight)
+        try:
+            await asyncio.sleep(0.01 * (10 - page_of(request)))
+            return await super().handle(request)
+        finally:
+            self.inflight -= 1
+
+
+def client_for(github: FakeGitHub) -> GitHubClient:
+    return GitHubClient(max_retries=0, transport=github.transport)
+
+
+def test_last_page_is_read_from_the_link_header():
+    request = httpx.Request("GET", "https://api.github.com/user/repos?per_page=100&page=1")
+    links = (
+        '<https://api.github.com/user/repos?per_page=100&page=2>; rel="next", '
+        '<https://api.github.com/user/repos?per_page=100&page=7>; rel="last"'
+    )
+    response = httpx.Response(200, json=[], headers={"Link": links}, request=request)
+    assert _parse_repo_page(response) == ([], 7)
+
+    single = httpx.Response(200, json=[], request=request)
+    assert _parse_repo_page(single) == ([], 1)
+
+
+async def test_pages_are_fetched_concurrently_and_merged_in_order():
+    github = SlowFirstPagesGitHub(repo_count=REPOS_PER_PAGE * 5 + 7)
+    client = client_for(github)
+
+    repos = await fetch_github_repos(client, concurrency=3)
+    await client.aclose()
+
+    assert [repo.id for repo in repos] == [repo["id"] for repo in github.repos]
+    assert github.requests == 6
+    assert github.max_inflight == 3
+
+
+class FailingPageGitHub(FakeGitHub):
+    """
+    Page 2 fails; every later page hangs until it is cancelled.
+    """
+
+    def __init__(self):
+        super().__init__(repo_count=REPOS_PER_PAGE * 5)
+        self.cancelled = []
+
+    async def handle(self, request):
+        page = page_of(request)
+        if page == 2:
+            await asyncio.sleep(0.01)
+            return httpx.Response(404, json={"message": "Not Found"})
+        if page > 2:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                self.cancelled.append(page)
+                raise
+        return await super().handle(request)
+
+
+async def test_a_failed_page_cancels_the_remaining_ones():
+    github = FailingPageGitHub()
+    client = client_for(github)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await fetch_github_repos(client, concurrency=10)
+    await client.aclose()
+
+    assert sorted(github.cancelled) == [3, 4, 5]
@@ -0,0 +1,73 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from app.v2.models.project import Project
+
+pytestmark = pytest.mark.anyio
+
+
+async def insert_project(github_id: int) -> Project:
+    return await Project(
+        github_id=github_id,
+        name=f"repo{github_id}",
+        html_url=f"https://github.com/u/repo{github_id}",
+        pushed_at=datetime(2024, 1, github_id, tzinfo=timezone.utc),
+        languages=[],
+        languages_url=f"https://api.github.com/repos/u/repo{github_id}/languages",
+    ).insert()
+
+
+async def test_listing_revalidates_with_if_none_match(client):
+    await insert_project(1)
+    first = await client.get("/v2/projects/")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    revalidated = await client.get("/v2/projects/", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["ETag"] == etag
+    assert revalidated.content == b""
+
+    await insert_project(2)
+    changed = await client.get("/v2/projects/", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+async def test_listing_ignores_if_modified_since(client):
+    # Deleting an older project leaves the newest updated_at as it was.
+    older = await insert_project(1)
+    await insert_project(2)
+    first = await client.get("/v2/projects/")
+    assert "Last-Modified" not in first.headers
+    await older.delete()
+
+    response = await client.get(
+        "/v2/projects/", headers={"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"}
+    )
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+
+
+@pytest.mark.parametrize("accept_encoding, weak", [("gzip", True), ("identity", False)])
+async def test_304_carries_the_validator_of_the_200(client, accept_encoding, weak):
+    # Enough projects for the listing to be compressed.
+    for github_id in range(1, 21):
+        await insert_project(github_id)
+    headers = {"Accept-Encoding": accept_encoding}
+    first = await client.get("/v2/projects/", headers=headers)
+    assert (first.headers.get("Content-Encoding") == "gzip") is weak
+    etag = first.headers["ETag"]
+    assert etag.startswith("W/") is weak
+
+    revalidated = await client.get("/v2/projects/", headers={**headers, "If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["ETag"] == etag
+
+    project = await client.get(f"/v2/projects/{first.json()[0]['_id']}", headers=headers)
+    item = await client.get(
+        f"/v2/projects/{first.json()[0]['_id']}", headers={**headers, "If-None-Match": project.headers["ETag"]}
+    )
+    assert item.status_code == 304
+    assert item.headers["ETag"] == project.headers["ETag"]
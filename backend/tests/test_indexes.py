@@ -0,0 +1,21 @@
+import pytest
+
+from app.v2.db.indexes import migrate_indexes
+from app.v2.models.project import Project
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_migration_replaces_the_non_unique_github_id_index(database):
+    collection = database[Project.Settings.name]
+    await collection.drop_index("github_id_unique")
+    await collection.create_index("github_id", name="github_id_1")
+
+    dropped = await migrate_indexes(database)
+
+    indexes = await collection.index_information()
+    assert dropped == [f"{Project.Settings.name}.github_id_1"]
+    assert "github_id_1" not in indexes
+    assert indexes["github_id_unique"]["unique"]
+    # Running it again finds nothing to do.
+    assert await migrate_indexes(database) == []
@@ -0,0 +1,51 @@
+import hashlib
+import time
+
+import pytest
+from fastapi import HTTPException
+from jose import jwt
+
+from app.utils import cache
+from app.v2.auth import jwt_handler
+from app.v2.auth.jwt_handler import decode_jwt, sign_jwt, verified_tokens
+
+
+def token_expiring_in(seconds: float) -> str:
+    payload = {"sub": "admin", "exp": int(time.time() + seconds)}
+    return jwt.encode(payload, jwt_handler.SECRET_KEY, algorithm=jwt_handler.ALGORITHM)
+
+
+def digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+
+def test_verified_token_is_decoded_once(monkeypatch):
+    verified_tokens.clear()
+    token = sign_jwt("admin")["access_token"]
+    assert decode_jwt(token)["sub"] == "admin"
+
+    def fail(*args, **kwargs):
+        raise AssertionError("signature verified twice")
+
+    monkeypatch.setattr(jwt_handler.jwt, "decode", fail)
+    assert decode_jwt(token)["sub"] == "admin"
+
+
+def test_cached_claims_expire_with_the_token(monkeypatch):
+    verified_tokens.clear()
+    token = token_expiring_in(60)
+    decode_jwt(token)
+    assert verified_tokens.get(digest(token)) is not None
+
+    later = time.monotonic() + 61
+    monkeypatch.setattr(cache.time, "monotonic", lambda: later)
+    assert verified_tokens.get(digest(token)) is None
+
+
+def test_expired_token_is_401_and_not_cached():
+    verified_tokens.clear()
+    token = token_expiring_in(-1)
+    with pytest.raises(HTTPException) as error:
+        decode_jwt(token)
+    assert error.value.status_code == 401
+    assert verified_tokens.get(digest(token)) is None
@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+from app.utils.language_resolver import LanguageResolver
+from app.v2.core.github_budget import Priority, current_priority, github_priority
+
+pytestmark = pytest.mark.anyio
+
+
+class SlowFetcher:
+    def __init__(self):
+        self.calls = []
+        self.release = asyncio.Event()
+
+    async def __call__(self, url):
+        self.calls.append((url, current_priority()))
+        await self.release.wait()
+        return ["Python"]
+
+
+async def test_concurrent_lookups_share_one_fetch():
+    fetch = SlowFetcher()
+    resolver = LanguageResolver(fetch)
+    lookups = asyncio.gather(*(resolver.resolve("u") for _ in range(5)))
+    await asyncio.sleep(0)
+    fetch.release.set()
+
+    assert await lookups == [["Python"]] * 5
+    assert len(fetch.calls) == 1
+    assert resolver.coalesced == 4
+    # Then served from the cache.
+    assert await resolver.resolve("u") == ["Python"]
+    assert len(fetch.calls) == 1
+
+
+async def test_failed_fetch_is_not_cached():
+    calls = []
+
+    async def failing(url):
+        calls.append(url)
+        raise RuntimeError("boom")
+
+    resolver = LanguageResolver(failing)
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            await resolver.resolve("u")
+    assert len(calls) == 2
+
+
+async def test_lookups_are_not_coalesced_across_priorities():
+    fetch = SlowFetcher()
+    resolver = LanguageResolver(fetch, context_key=current_priority)
+
+    async def resolve_at(priority):
+        with github_priority(priority):
+            return await resolver.resolve("u")
+
+    lookups = asyncio.gather(resolve_at(Priority.LOW), resolve_at(Priority.HIGH), resolve_at(Priority.HIGH))
+    await asyncio.sleep(0)
+    fetch.release.set()
+
+    assert await lookups == [["Python"]] * 3
+    assert sorted(fetch.calls) == [("u", Priority.HIGH), ("u", Priority.LOW)]
+    assert resolver.coalesced == 1
@@ -0,0 +1,38 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.v2.core.config import settings
+from app.v2.routes import metrics_routes
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def metrics_client():
+    app = FastAPI()
+    app.include_router(metrics_routes.router)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+async def test_metrics_require_the_token(metrics_client, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-me")
+    assert (await metrics_client.get("/metrics")).status_code == 401
+    wrong = await metrics_client.get("/metrics", headers={"Authorization": "Bearer nope"})
+    assert wrong.status_code == 401
+
+    response = await metrics_client.get("/metrics", headers={"Authorization": "Bearer scrape-me"})
+    assert response.status_code == 200
+    assert "app_cache_entries" in response.text
+
+
+async def test_metrics_are_closed_without_a_configured_token(metrics_client, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", None)
+    response = await metrics_client.get("/metrics", headers={"Authorization": "Bearer "})
+    assert response.status_code == 401
+
+
+async def test_app_does_not_serve_metrics_without_a_token(client):
+    assert settings.METRICS_TOKEN is None
+    assert (await client.get("/metrics")).status_code == 404
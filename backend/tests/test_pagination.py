@@ -0,0 +1,51 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.v2.models.project import Project, ProjectQuery
+from app.v2.services.project_service import ProjectService
+
+pytestmark = pytest.mark.anyio
+
+
+def test_cursor_round_trip():
+    values = {"p": "2024-01-01T00:00:00+00:00", "i": "65a000000000000000000000"}
+    cursor = encode_cursor(values)
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == values
+
+
+@pytest.mark.parametrize("cursor", ["not base64!", encode_cursor({"p": "x"})[:-2], "WzEsMl0"])
+def test_malformed_cursor_is_400(cursor):
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(cursor)
+    assert error.value.status_code == 400
+
+
+async def test_pages_cover_every_project_once_in_order(database):
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    # Pairs of projects pushed at the same time, so pages split on the _id tie-breaker.
+    for n in range(7):
+        await Project(
+            github_id=n,
+            name=f"repo{n}",
+            html_url=f"https://github.com/u/repo{n}",
+            pushed_at=start + timedelta(days=n // 2),
+            languages=[],
+            languages_url=f"https://api.github.com/repos/u/repo{n}/languages",
+        ).insert()
+    service = ProjectService(github=None, languages=object())
+
+    seen, cursor = [], None
+    while True:
+        page = await service.list_projects(ProjectQuery(limit=2, cursor=cursor))
+        seen += [(project.pushed_at, project.id) for project in page.items]
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert len(seen) == 7
+    assert seen == sorted(seen, reverse=True)
+    assert len(set(seen)) == 7
@@ -0,0 +1,55 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from app.utils import password_encrypt
+from app.utils.password_encrypt import (
+    PasswordHasherPool,
+    hash_password,
+    hash_password_async,
+    verify_password,
+    verify_password_async,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+def test_sync_path_still_verifies():
+    hashed = hash_password("s3cret")
+    assert hashed != "s3cret"
+    assert verify_password("s3cret", hashed)
+    assert not verify_password("wrong", hashed)
+
+
+async def test_async_path_matches_the_sync_one():
+    hashed = await hash_password_async("s3cret")
+    assert verify_password("s3cret", hashed)
+    assert await verify_password_async("s3cret", hashed)
+    assert not await verify_password_async("wrong", hashed)
+
+
+async def test_saturated_pool_rejects_with_503(monkeypatch):
+    pool = PasswordHasherPool(max_workers=1, max_pending=1, retry_after=2)
+    monkeypatch.setattr(password_encrypt, "password_pool", pool)
+    hashed = hash_password("s3cret")
+    release = threading.Event()
+
+    blocked = asyncio.ensure_future(pool.run(release.wait))
+    await asyncio.sleep(0)
+    try:
+        with pytest.raises(HTTPException) as error:
+            await verify_password_async("s3cret", hashed)
+        assert error.value.status_code == 503
+        assert error.value.headers["Retry-After"] == "2"
+        assert pool.stats()["rejected"] == 1
+    finally:
+        release.set()
+        await blocked
+        pool.shutdown()
+
+    # Once the pool drains, verification goes through again.
+    assert await verify_password_async("s3cret", hashed)
+    assert pool.stats()["pending"] == 0
+    pool.shutdown()
@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from app.v2.services.project_cache import BY_ID, LIST, CachedBody, ProjectReadCache
+
+pytestmark = pytest.mark.anyio
+
+
+class Loader:
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        return CachedBody(f"load {self.calls}".encode())
+
+
+def identity(body):
+    return body
+
+
+async def test_hit_skips_the_loader():
+    cache = ProjectReadCache()
+    loader = Loader()
+    first = await cache.get_or_load((LIST, "a"), loader, identity)
+    second = await cache.get_or_load((LIST, "a"), loader, identity)
+    assert first is second
+    assert loader.calls == 1
+
+
+async def test_invalidate_project_drops_the_project_and_every_listing():
+    cache = ProjectReadCache()
+    loader = Loader()
+    await cache.get_or_load((BY_ID, "1"), loader, identity)
+    await cache.get_or_load((BY_ID, "2"), loader, identity)
+    await cache.get_or_load((LIST, "a"), loader, identity)
+
+    cache.invalidate_project("1")
+
+    assert (await cache.get_or_load((BY_ID, "1"), loader, identity)).body == b"load 4"
+    assert (await cache.get_or_load((BY_ID, "2"), loader, identity)).body == b"load 2"
+    assert (await cache.get_or_load((LIST, "a"), loader, identity)).body == b"load 5"
+
+
+async def test_load_overlapping_an_invalidation_is_not_stored():
+    cache = ProjectReadCache()
+    started, release = asyncio.Event(), asyncio.Event()
+
+    async def slow_loader():
+        started.set()
+        await release.wait()
+        return CachedBody(b"before the write")
+
+    read = asyncio.ensure_future(cache.get_or_load((LIST, "a"), slow_loader, identity))
+    await started.wait()
+    cache.invalidate_lists()
+    release.set()
+
+    # The overlapping caller still gets its result, but the next one reloads.
+    assert (await read).body == b"before the write"
+    loader = Loader()
+    assert (await cache.get_or_load((LIST, "a"), loader, identity)).body == b"load 1"
+
+
+async def test_entry_from_another_version_is_reloaded():
+    # Another worker wrote: the live version moved on, this worker's entry did not.
+    cache = ProjectReadCache()
+    loader = Loader()
+    await cache.get_or_load((LIST, "a"), loader, identity, version=1)
+    assert (await cache.get_or_load((LIST, "a"), loader, identity, version=1)).body == b"load 1"
+
+    reloaded = await cache.get_or_load((LIST, "a"), loader, identity, version=2)
+    assert (reloaded.body, reloaded.version) == (b"load 2", 2)
+    assert (await cache.get_or_load((LIST, "a"), loader, identity, version=2)).body == b"load 2"
@@ -0,0 +1,47 @@
+import pytest
+from fastapi import HTTPException
+
+from app.utils.rate_limit import InMemoryRateLimitStorage, SlidingWindowRateLimiter
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_limit_within_a_window():
+    limiter = SlidingWindowRateLimiter(3, 60, InMemoryRateLimitStorage(), "test")
+    for _ in range(3):
+        await limiter.check("ip", now=600)
+    with pytest.raises(HTTPException) as error:
+        await limiter.check("ip", now=610)
+    assert error.value.status_code == 429
+    assert error.value.headers["Retry-After"] == "50"
+    # Other keys have their own count.
+    await limiter.check("other", now=610)
+
+
+async def test_previous_window_is_weighted_by_its_overlap():
+    storage = InMemoryRateLimitStorage()
+    for _ in range(4):
+        await storage.hit("k", 60, now=600)
+    # 15s into the next window, three quarters of the previous one still count.
+    assert await storage.hit("k", 60, now=675) == pytest.approx(1 + 4 * 0.75)
+    # Two windows later, nothing carries over.
+    assert await storage.hit("k", 60, now=800) == 1
+
+
+async def test_reset_forgets_the_key():
+    limiter = SlidingWindowRateLimiter(1, 60, InMemoryRateLimitStorage(), "test")
+    await limiter.check("ip", now=600)
+    await limiter.reset("ip")
+    await limiter.check("ip", now=600)
+
+
+async def test_least_recently_hit_keys_are_evicted():
+    storage = InMemoryRateLimitStorage(max_keys=2)
+    await storage.hit("a", 60, now=600)
+    await storage.hit("b", 60, now=600)
+    await storage.hit("a", 60, now=601)
+    await storage.hit("c", 60, now=602)
+
+    assert list(storage._windows) == ["a", "c"]
+    assert await storage.hit("a", 60, now=603) == 3
+    assert await storage.hit("b", 60, now=603) == 1
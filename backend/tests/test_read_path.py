@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+import pytest
+from beanie.odm.utils.projection import get_projection
+
+from app.utils.dates import as_utc
+from app.utils.serialization import dump_json
+from app.v2.models.project import Project, ProjectGet
+from app.v2.services.project_service import _read_many, _read_one
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def projects(database):
+    pushed_at = datetime(2024, 5, 1, 12, 30, 15, 123000, tzinfo=timezone.utc)
+    stored = []
+    for i in range(3):
+        stored.append(await Project(
+            github_id=i,
+            name=f"repo-{i}",
+            # Optional fields left unset on one document
+            description=None if i == 0 else f"project {i}",
+            html_url=f"https://github.com/u/repo-{i}",
+            pushed_at=pushed_at - timedelta(days=i),
+            languages=[] if i == 0 else ["Python", "Go"][:i],
+            languages_url=f"https://api.github.com/repos/u/repo-{i}/languages",
+            image_url=None if i == 0 else f"https://example.com/{i}.png",
+            languages_refreshed_at=pushed_at,
+        ).insert())
+    return stored
+
+
+def from_document(project: Project) -> ProjectGet:
+    return ProjectGet(**project.model_dump(by_alias=True))
+
+
+async def test_lean_list_matches_the_document_serialization(projects):
+    documents = [from_document(project) for project in await Project.find_all().to_list()]
+    cursor = Project.get_motor_collection().find({}, projection=get_projection(ProjectGet))
+    lean = await _read_many(cursor, ProjectGet)
+
+    assert dump_json(lean, List[ProjectGet]) == dump_json(documents, List[ProjectGet])
+    assert [project.id for project in lean] == [str(project.id) for project in projects]
+    assert [as_utc(project.pushed_at) for project in lean] == [project.pushed_at for project in projects]
+
+
+async def test_lean_single_read_matches_the_document_serialization(projects):
+    for project in projects:
+        expected = from_document(await Project.get(project.id))
+        by_id = await _read_one({"_id": project.id}, ProjectGet)
+        by_github_id = await _read_one({"github_id": project.github_id}, ProjectGet)
+        assert by_id.model_dump_json(by_alias=True) == expected.model_dump_json(by_alias=True)
+        assert by_github_id == by_id
+
+
+async def test_lean_single_read_of_a_missing_project(projects):
+    assert await _read_one({"github_id": 404}, ProjectGet) is None
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from app.v2.models.sync_state import SyncState
+from app.v2.services import sync_scheduler
+from app.v2.services.sync_scheduler import SyncInProgress, SyncScheduler
+
+pytestmark = pytest.mark.anyio
+
+
+def scheduler(lease: float = 60.0) -> SyncScheduler:
+    return SyncScheduler(github=None, interval=30.0, lease=lease)
+
+
+async def test_only_one_scheduler_holds_the_lease(database):
+    first, second = scheduler(), scheduler()
+    assert await first.acquire_lease()
+    assert not await second.acquire_lease()
+    # The holder renews its own lease.
+    assert await first.acquire_lease()
+
+
+async def test_lease_is_taken_over_once_released_or_expired(database):
+    first, second = scheduler(lease=-1), scheduler()
+    assert await first.acquire_lease()
+    assert await second.acquire_lease()
+
+    await second.release_lease()
+    assert await first.acquire_lease()
+    state = await SyncState.find_one(SyncState.key == "github")
+    assert state.lease_owner == first.owner
+
+
+async def test_run_upserts_the_state_and_keeps_the_lease(database, monkeypatch):
+    async def no_repos(github):
+        return []
+
+    monkeypatch.setattr(sync_scheduler, "fetch_github_repos", no_repos)
+    runner = scheduler()
+    first = await runner.run_once()
+    assert first.last_scanned == 0 and first.last_error is None
+
+    assert await runner.acquire_lease()
+    second = await runner.run_once()
+    assert second.id == first.id
+    assert second.last_run_at >= first.last_run_at
+    assert second.lease_owner == runner.owner
+    assert await SyncState.find_all().count() == 1
+
+
+async def test_overlapping_run_is_refused(database, client, monkeypatch):
+    started, release = asyncio.Event(), asyncio.Event()
+
+    async def slow_repos(github):
+        started.set()
+        await release.wait()
+        return []
+
+    monkeypatch.setattr(sync_scheduler, "fetch_github_repos", slow_repos)
+    running = asyncio.ensure_future(scheduler().run_once())
+    await started.wait()
+
+    with pytest.raises(SyncInProgress):
+        await scheduler().run_once()
+    response = await client.post("/v2/sync/run")
+    assert response.status_code == 409
+
+    release.set()
+    await running
+    assert not scheduler().busy
+
+
+async def test_manual_run_is_refused_while_another_worker_holds_the_lease(database, client, monkeypatch):
+    async def no_repos(github):
+        return []
+
+    monkeypatch.setattr(sync_scheduler, "fetch_github_repos", no_repos)
+    other_worker = scheduler()
+    assert await other_worker.acquire_lease()
+
+    assert (await client.post("/v2/sync/run")).status_code == 409
+    await other_worker.release_lease()
+
+    # A manual run releases the lease it took, so the next one goes through too.
+    assert (await client.post("/v2/sync/run")).status_code == 200
+    assert (await client.post("/v2/sync/run")).status_code == 200
+    assert await other_worker.acquire_lease()
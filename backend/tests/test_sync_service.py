@@ -0,0 +1,104 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from app.v2.core.github_budget import Priority, github_priority
+from app.utils.dates import as_utc
+from app.v2.core.github_client import GitHubClient
+from app.v2.models.project import Project, ProjectCreate
+from app.v2.services.language import create_language_resolver
+from app.v2.services.project_service import ProjectService
+from app.v2.services.sync_service import ProjectSyncService
+
+pytestmark = pytest.mark.anyio
+
+
+def project_create(github_id: int) -> ProjectCreate:
+    return ProjectCreate(
+        github_id=github_id,
+        name=f"repo{github_id}",
+        html_url=f"https://github.com/u/repo{github_id}",
+        pushed_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        languages_url=f"https://api.github.com/repos/u/repo{github_id}/languages",
+    )
+
+
+def github_below_reserve() -> GitHubClient:
+    # 150 calls left against a reserve of 200, resetting in an hour.
+    headers = {
+        "X-RateLimit-Limit": "5000",
+        "X-RateLimit-Remaining": "150",
+        "X-RateLimit-Reset": str(int(time.time() + 3600)),
+    }
+
+    def handler(request):
+        return httpx.Response(200, json={"Python": 1}, headers=headers)
+
+    client = GitHubClient(max_retries=0, transport=httpx.MockTransport(handler))
+    client.budget.update(httpx.Response(200, headers=headers))
+    return client
+
+
+async def test_requested_sync_does_not_wait_for_the_low_priority_reserve(database):
+    github = github_below_reserve()
+    service = ProjectSyncService(github, create_language_resolver(github))
+
+    report = await asyncio.wait_for(service.sync_projects([project_create(1), project_create(2)]), 5)
+
+    assert report.created == 2
+    await github.aclose()
+
+
+async def test_scheduled_sync_holds_back_below_the_reserve(database):
+    github = github_below_reserve()
+    service = ProjectSyncService(github, create_language_resolver(github))
+
+    with github_priority(Priority.LOW):
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(service.sync_projects([project_create(1)]), 0.5)
+    assert github.budget.waits["low"] == 1
+    await github.aclose()
+
+
+class FakeLanguages:
+    def __init__(self):
+        self.calls = 0
+
+    async def resolve_many(self, urls, refresh=False):
+        urls = list(urls)
+        self.calls += len(urls)
+        return {url: ["Python"] for url in urls}
+
+
+async def test_sync_keeps_admin_edits_and_updates_github_fields(database):
+    service = ProjectSyncService(github=None, languages=FakeLanguages())
+    await service.sync_projects([project_create(1)])
+    project = await Project.find_one(Project.github_id == 1)
+    await project.set({"name": "Edited", "description": "Written by an admin"})
+
+    pushed = project_create(1)
+    pushed.pushed_at = datetime(2024, 2, 1, tzinfo=timezone.utc)
+    pushed.description = None
+    report = await service.sync_projects([pushed])
+
+    synced = await Project.find_one(Project.github_id == 1)
+    assert report.updated == 1
+    assert (synced.name, synced.description) == ("Edited", "Written by an admin")
+    assert as_utc(synced.pushed_at) == pushed.pushed_at
+    assert synced.updated_at > project.updated_at
+
+
+async def test_unchanged_repositories_do_not_move_the_collection_version(database):
+    languages = FakeLanguages()
+    service = ProjectSyncService(github=None, languages=languages)
+    await service.sync_projects([project_create(1), project_create(2)])
+    version = await ProjectService(github=None, languages=object()).get_collection_version()
+
+    report = await service.sync_projects([project_create(1), project_create(2)])
+
+    assert (report.unchanged, report.updated, report.created) == (2, 0, 0)
+    assert languages.calls == 2
+    assert await ProjectService(github=None, languages=object()).get_collection_version() == version
@@ -0,0 +1,118 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from app.v2.core.config import settings
+from app.v2.core.github_client import GitHubClient
+from app.v2.models.project import Project, ProjectUpdate
+from app.v2.services.project_service import ProjectService
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeLanguages:
+    def __init__(self, languages=("Python", "Go")):
+        self.languages = list(languages)
+        self.calls = []
+
+    async def resolve(self, url, refresh=False):
+        self.calls.append((url, refresh))
+        return list(self.languages)
+
+
+async def stored_project(refreshed_ago: timedelta = timedelta(0)) -> Project:
+    now = datetime.now(timezone.utc)
+    return await Project(
+        github_id=1,
+        name="repo",
+        description="old",
+        html_url="https://github.com/u/repo",
+        pushed_at=now,
+        languages=["Python"],
+        languages_url="https://api.github.com/repos/u/repo/languages",
+        languages_refreshed_at=now - refreshed_ago,
+    ).insert()
+
+
+@pytest.fixture
+def sets(monkeypatch):
+    """
+    The update documents passed to ``Project.set``.
+    """
+    recorded = []
+    original = Project.set
+
+    async def spy(self, expression, *args, **kwargs):
+        recorded.append(dict(expression))
+        return await original(self, expression, *args, **kwargs)
+
+    monkeypatch.setattr(Project, "set", spy)
+    return recorded
+
+
+def service(languages: FakeLanguages, github: GitHubClient = None) -> ProjectService:
+    return ProjectService(github or GitHubClient(), languages)
+
+
+async def test_only_changed_fields_are_set_without_calling_github(database, sets):
+    project = await stored_project()
+    languages = FakeLanguages()
+
+    updated = await service(languages).update_project(
+        project.id, ProjectUpdate(name="repo", description="new")
+    )
+
+    assert updated.description == "new"
+    assert languages.calls == []
+    assert len(sets) == 1
+    assert set(sets[0]) == {"description", "updated_at"}
+
+
+async def test_no_change_writes_nothing(database, sets):
+    project = await stored_project()
+    updated = await service(FakeLanguages()).update_project(project.id, ProjectUpdate(name="repo"))
+    assert updated.name == "repo"
+    assert sets == []
+
+
+async def test_refresh_languages_refetches_them(database, sets):
+    project = await stored_project()
+    languages = FakeLanguages()
+
+    updated = await service(languages).update_project(project.id, ProjectUpdate(), refresh_languages=True)
+
+    assert languages.calls == [(project.languages_url, True)]
+    assert updated.languages == ["Python", "Go"]
+    assert set(sets[0]) == {"languages", "languages_refreshed_at", "updated_at"}
+
+
+async def test_stale_languages_are_refetched(database, sets):
+    project = await stored_project(refreshed_ago=timedelta(seconds=settings.LANGUAGES_MAX_AGE_SECONDS + 60))
+    languages = FakeLanguages(languages=["Python"])
+
+    await service(languages).update_project(project.id, ProjectUpdate())
+
+    assert languages.calls == [(project.languages_url, False)]
+    # Same languages: only the refresh time is written, updated_at (the ETag) stays.
+    assert set(sets[0]) == {"languages_refreshed_at"}
+
+
+async def test_low_budget_skips_the_automatic_refresh(database, sets):
+    project = await stored_project(refreshed_ago=timedelta(seconds=settings.LANGUAGES_MAX_AGE_SECONDS + 60))
+    github = GitHubClient(rate_limit_reserve=200)
+    github.budget.update(httpx.Response(200, headers={
+        "X-RateLimit-Limit": "5000",
+        "X-RateLimit-Remaining": "150",
+        "X-RateLimit-Reset": str(int(time.time() + 3600)),
+    }))
+    languages = FakeLanguages()
+
+    await service(languages, github).update_project(project.id, ProjectUpdate(description="new"))
+    assert languages.calls == []
+    assert set(sets[0]) == {"description", "updated_at"}
+
+    # An explicit refresh still goes out.
+    await service(languages, github).update_project(project.id, ProjectUpdate(), refresh_languages=True)
+    assert len(languages.calls) == 1